@@ -9,6 +9,7 @@ import json
 import logging
 import os
 import subprocess
+import time
 import uuid
 from pathlib import Path
 
@@ -150,6 +151,7 @@ class ConnectorRunner:
 
         self.logger.info(f"⏳ Start running {self.command.value} command")
 
+        start_time = time.monotonic()
         try:
             entrypoint = await container.entrypoint()
             assert entrypoint, "The connector container has no entrypoint"
@@ -177,6 +179,7 @@ class ConnectorRunner:
             self.stdout_file_path.write_text(e.stdout)
             executed_container = None
             success = False
+        execution_duration = time.monotonic() - start_time
 
         self.completion_event.set()
         if not success:
@@ -196,6 +199,7 @@ class ConnectorRunner:
             http_dump=await self.http_proxy.retrieve_http_dump() if self.http_proxy else None,
             executed_container=executed_container,
             config=self.config,
+            execution_duration=execution_duration,
         )
         await execution_result.save_artifacts(self.output_dir, self.duckdb_path)
         return execution_result
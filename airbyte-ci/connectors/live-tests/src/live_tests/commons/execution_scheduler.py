@@ -0,0 +1,50 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+DEFAULT_MAX_CONCURRENT_EXECUTIONS = 2
+DEFAULT_MAX_CONCURRENT_EXECUTIONS_PER_CONNECTOR = 1
+
+
+class ExecutionScheduler:
+    """Run connector command executions as concurrent tasks.
+
+    Executions are keyed so that the first fixture needing an execution can start it along with its sibling (e.g. the target execution
+    of the same command), and the fixture needing the sibling later on awaits the already started task instead of running it again.
+    Concurrency is capped globally and per connector (image and version), to bound the load put on the host running the containers.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_executions: int = DEFAULT_MAX_CONCURRENT_EXECUTIONS,
+        max_concurrent_executions_per_connector: int = DEFAULT_MAX_CONCURRENT_EXECUTIONS_PER_CONNECTOR,
+    ) -> None:
+        if max_concurrent_executions < 1 or max_concurrent_executions_per_connector < 1:
+            raise ValueError("Concurrency limits must be at least 1")
+        self.max_concurrent_executions = max_concurrent_executions
+        self.max_concurrent_executions_per_connector = max_concurrent_executions_per_connector
+        self._semaphore: asyncio.Semaphore | None = None
+        self._semaphores_per_connector: dict[str, asyncio.Semaphore] = {}
+        self._tasks: dict[Hashable, asyncio.Task] = {}
+
+    def schedule(self, key: Hashable, connector: str, execution: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """Start the execution registered under key, unless it was already started, and return its task."""
+        if key not in self._tasks:
+            self._tasks[key] = asyncio.create_task(self._run(connector, execution))
+        return self._tasks[key]
+
+    def is_scheduled(self, key: Hashable) -> bool:
+        return key in self._tasks
+
+    async def _run(self, connector: str, execution: Callable[[], Awaitable[Any]]) -> Any:
+        # Semaphores are created lazily to be bound to the event loop running the executions
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_executions)
+        if connector not in self._semaphores_per_connector:
+            self._semaphores_per_connector[connector] = asyncio.Semaphore(self.max_concurrent_executions_per_connector)
+        # The per connector semaphore is always acquired first, so a task waiting for its connector never holds a global slot
+        async with self._semaphores_per_connector[connector], self._semaphore:
+            return await execution()
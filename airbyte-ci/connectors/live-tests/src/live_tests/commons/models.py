@@ -11,7 +11,6 @@ from collections import defaultdict
 from collections.abc import Iterable, Iterator, MutableMapping
 from dataclasses import dataclass, field
 from enum import Enum
-from functools import cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -255,6 +254,31 @@ class ExecutionInputs:
         return output_dir
 
 
+@dataclass
+class AirbyteMessageIndex:
+    """
+    Per type and per stream view of the messages emitted by a command, filled in a single pass over the command output.
+    Records are not held here: they are indexed on disk, per stream, by the backend writing the messages.
+    """
+
+    message_count_per_type: dict[AirbyteMessageType, int] = field(default_factory=lambda: defaultdict(int))
+    states_per_stream: dict[str, list[AirbyteStateMessage]] = field(default_factory=lambda: defaultdict(list))
+    status_messages_per_stream: dict[str, list[AirbyteStreamStatusTraceMessage]] = field(default_factory=lambda: defaultdict(list))
+
+    def add(self, message: AirbyteMessage) -> None:
+        self.message_count_per_type[message.type] += 1
+        if message.type is AirbyteMessageType.STATE and message.state.stream:
+            self.states_per_stream[message.state.stream.stream_descriptor.name].append(message.state)
+        elif message.type is AirbyteMessageType.TRACE and message.trace.type == TraceType.STREAM_STATUS:
+            self.status_messages_per_stream[message.trace.stream_status.stream_descriptor.name].append(message.trace.stream_status)
+
+    def index(self, messages: Iterable[AirbyteMessage]) -> Iterator[AirbyteMessage]:
+        """Add the messages to the index while passing them through, so indexing can piggyback on another pass over the output."""
+        for message in messages:
+            self.add(message)
+            yield message
+
+
 @dataclass
 class ExecutionResult:
     hashed_connection_id: str
@@ -271,6 +295,8 @@ class ExecutionResult:
     http_flows: list[http.HTTPFlow] = field(default_factory=list)
     stream_schemas: Optional[dict[str, Any]] = None
     backend: Optional[FileBackend] = None
+    execution_duration: Optional[float] = None
+    _message_index: Optional[AirbyteMessageIndex] = field(default=None, init=False, repr=False)
 
     HTTP_DUMP_FILE_NAME = "http_dump.mitm"
     HAR_FILE_NAME = "http_dump.har"
@@ -283,6 +309,16 @@ class ExecutionResult:
     def airbyte_messages(self) -> Iterable[AirbyteMessage]:
         return self.parse_airbyte_messages_from_command_output(self.stdout_file_path)
 
+    @property
+    def message_index(self) -> AirbyteMessageIndex:
+        """The index is filled while the messages are saved to disk, or by a dedicated pass over the output if they were not."""
+        if self._message_index is None:
+            message_index = AirbyteMessageIndex()
+            for _ in message_index.index(self.airbyte_messages):
+                pass
+            self._message_index = message_index
+        return self._message_index
+
     @property
     def duckdb_schema(self) -> Iterable[str]:
         return (self.connector_under_test.target_or_control.value, self.command.value, self.hashed_connection_id)
@@ -309,6 +345,7 @@ class ExecutionResult:
         executed_container: Optional[dagger.Container],
         config: Optional[SecretDict] = None,
         http_dump: Optional[dagger.File] = None,
+        execution_duration: Optional[float] = None,
     ) -> ExecutionResult:
         execution_result = cls(
             hashed_connection_id,
@@ -322,6 +359,7 @@ class ExecutionResult:
             executed_container,
             config,
             http_dump,
+            execution_duration=execution_duration,
         )
         await execution_result.load_http_flows()
         return execution_result
@@ -348,7 +386,12 @@ class ExecutionResult:
         self.logger.info(
             f"Reading records all records for command {self.command.value} on {self.connector_under_test.target_or_control.value} version."
         )
-        for message in self.airbyte_messages:
+        # Once saved, records are read back from the records file instead of parsing the whole command output again
+        if self.backend is not None and self.backend.jsonl_records_path.exists():
+            messages = self.parse_airbyte_messages_from_command_output(self.backend.jsonl_records_path, log_validation_errors=True)
+        else:
+            messages = self.airbyte_messages
+        for message in messages:
             if message.type is AirbyteMessageType.RECORD:
                 yield message
 
@@ -406,26 +449,14 @@ class ExecutionResult:
 
     def get_states_per_stream(self, stream: str) -> Dict[str, List[AirbyteStateMessage]]:
         self.logger.info(f"Reading state messages for stream {stream}")
-        states = defaultdict(list)
-        for message in self.airbyte_messages:
-            if message.type is AirbyteMessageType.STATE:
-                states[message.state.stream.stream_descriptor.name].append(message.state)
-        return states
+        return self.message_index.states_per_stream
 
     def get_status_messages_per_stream(self, stream: str) -> Dict[str, List[AirbyteStreamStatusTraceMessage]]:
-        self.logger.info(f"Reading state messages for stream {stream}")
-        statuses = defaultdict(list)
-        for message in self.airbyte_messages:
-            if message.type is AirbyteMessageType.TRACE and message.trace.type == TraceType.STREAM_STATUS:
-                statuses[message.trace.stream_status.stream_descriptor.name].append(message.trace.stream_status)
-        return statuses
+        self.logger.info(f"Reading status messages for stream {stream}")
+        return self.message_index.status_messages_per_stream
 
-    @cache
     def get_message_count_per_type(self) -> dict[AirbyteMessageType, int]:
-        message_count: dict[AirbyteMessageType, int] = defaultdict(int)
-        for message in self.airbyte_messages:
-            message_count[message.type] += 1
-        return message_count
+        return self.message_index.message_count_per_type
 
     async def save_http_dump(self, output_dir: Path) -> None:
         if self.http_dump:
@@ -450,7 +481,13 @@ class ExecutionResult:
             self.backend = DuckDbBackend(airbyte_messages_dir, duckdb_path, self.duckdb_schema)
         else:
             self.backend = FileBackend(airbyte_messages_dir)
-        self.backend.write(self.airbyte_messages)
+        if self._message_index is None:
+            # Index the messages in the same pass as the one writing them to disk
+            message_index = AirbyteMessageIndex()
+            self.backend.write(message_index.index(self.airbyte_messages))
+            self._message_index = message_index
+        else:
+            self.backend.write(self.airbyte_messages)
         self.logger.info("Airbyte messages saved")
 
     def save_stream_schemas(self, output_dir: Path) -> None:
@@ -0,0 +1,161 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, TextIO
+
+from airbyte_protocol.models import AirbyteMessage  # type: ignore
+
+DEFAULT_PARTITION_COUNT = 64
+DEFAULT_MAX_RECORDS_PER_DIFF = 10_000
+
+
+def _digest(value: str) -> str:
+    return hashlib.blake2b(value.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class RecordPartitions:
+    """Spill the records of a stream to on-disk partitions, so two versions of a stream can be compared one partition at a time.
+
+    Each record is stored with a key and a digest of its canonical payload (the record serialized with sorted keys, without emitted_at).
+    The key is the primary key value when the stream has one, otherwise the payload digest itself.
+    Records are partitioned by a hash of their key: records sharing a key always land in the same partition on both versions.
+    """
+
+    def __init__(self, directory: Path, primary_key: Optional[list[str]], partition_count: int = DEFAULT_PARTITION_COUNT):
+        self.directory = directory
+        self.primary_key = primary_key
+        self.partition_count = partition_count
+        self.record_count = 0
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get_partition_path(self, partition: int) -> Path:
+        return self.directory / f"partition_{partition}.jsonl"
+
+    def write(self, records: Iterable[AirbyteMessage]) -> None:
+        partition_files: dict[int, TextIO] = {}
+        try:
+            for record in records:
+                payload = record.record.json(sort_keys=True, exclude={"emitted_at"})
+                payload_digest = _digest(payload)
+                if self.primary_key:
+                    key = json.dumps(record.record.data.get(self.primary_key[0]), sort_keys=True)
+                else:
+                    key = payload_digest
+                partition = int(_digest(key), 16) % self.partition_count
+                if partition not in partition_files:
+                    partition_files[partition] = open(self.get_partition_path(partition), "a")
+                partition_files[partition].write(json.dumps([key, payload_digest, payload]) + "\n")
+                self.record_count += 1
+        finally:
+            for partition_file in partition_files.values():
+                partition_file.close()
+
+    def read_partition(self, partition: int) -> Iterator[tuple[str, str, str]]:
+        """Yield the (key, payload digest, payload) entries of a partition."""
+        partition_path = self.get_partition_path(partition)
+        if not partition_path.exists():
+            return
+        with open(partition_path) as partition_file:
+            for line in partition_file:
+                key, payload_digest, payload = json.loads(line)
+                yield key, payload_digest, payload
+
+
+@dataclass
+class RecordPartitionsDiff:
+    """Records which could not be matched between the control and target versions, grouped as the non-streaming diff does.
+
+    Only up to max_records_per_diff records are kept for each group, the counts cover all unmatched records.
+    """
+
+    max_records_per_diff: int = DEFAULT_MAX_RECORDS_PER_DIFF
+    mismatched_control_records: list[tuple[str, dict]] = field(default_factory=list)
+    mismatched_target_records: list[tuple[str, dict]] = field(default_factory=list)
+    control_only_records: list[tuple[str, dict]] = field(default_factory=list)
+    target_only_records: list[tuple[str, dict]] = field(default_factory=list)
+    mismatched_key_count: int = 0
+    control_only_count: int = 0
+    target_only_count: int = 0
+
+    def _add(self, records: list[tuple[str, dict]], key: str, payloads: Iterable[str]) -> None:
+        for payload in payloads:
+            if len(records) < self.max_records_per_diff:
+                records.append((key, json.loads(payload)))
+
+    def add_mismatch(self, key: str, control_payloads: list[str], target_payloads: list[str]) -> None:
+        self.mismatched_key_count += 1
+        self._add(self.mismatched_control_records, key, control_payloads)
+        self._add(self.mismatched_target_records, key, target_payloads)
+
+    def add_control_only(self, key: str, payloads: list[str]) -> None:
+        self.control_only_count += len(payloads)
+        self._add(self.control_only_records, key, payloads)
+
+    def add_target_only(self, key: str, payloads: list[str]) -> None:
+        self.target_only_count += len(payloads)
+        self._add(self.target_only_records, key, payloads)
+
+    @staticmethod
+    def sorted_records(records: list[tuple[str, dict]]) -> list[dict]:
+        return [record for _, record in sorted(records, key=lambda keyed_record: keyed_record[0])]
+
+    def __bool__(self) -> bool:
+        return bool(self.mismatched_key_count or self.control_only_count or self.target_only_count)
+
+
+def _load_partition(partitions: RecordPartitions, partition: int) -> dict[str, dict[str, str]]:
+    # key -> payload digest -> payload, payloads being kept once per distinct digest
+    entries: dict[str, dict[str, str]] = defaultdict(dict)
+    for key, payload_digest, payload in partitions.read_partition(partition):
+        entries[key][payload_digest] = payload
+    return entries
+
+
+def _count_partition(partitions: RecordPartitions, partition: int) -> dict[str, Counter]:
+    counts: dict[str, Counter] = defaultdict(Counter)
+    for key, payload_digest, _ in partitions.read_partition(partition):
+        counts[key][payload_digest] += 1
+    return counts
+
+
+def diff_record_partitions(
+    control: RecordPartitions, target: RecordPartitions, max_records_per_diff: int = DEFAULT_MAX_RECORDS_PER_DIFF
+) -> RecordPartitionsDiff:
+    """Compare the control and target partitions one partition at a time.
+
+    Records are compared by payload digest only: payloads are loaded back for the keys whose digests differ, which are the only
+    ones worth a detailed diff. A single partition of each version is held in memory at any time.
+    """
+    assert control.partition_count == target.partition_count, "Control and target records must be split in the same number of partitions"
+    diff = RecordPartitionsDiff(max_records_per_diff=max_records_per_diff)
+    for partition in range(control.partition_count):
+        control_counts = _count_partition(control, partition)
+        target_counts = _count_partition(target, partition)
+        unmatched_keys = [key for key in control_counts.keys() | target_counts.keys() if control_counts.get(key) != target_counts.get(key)]
+        if not unmatched_keys:
+            continue
+        control_payloads = _load_partition(control, partition)
+        target_payloads = _load_partition(target, partition)
+        for key in sorted(unmatched_keys):
+            control_key_counts, target_key_counts = control_counts.get(key, Counter()), target_counts.get(key, Counter())
+            if control.primary_key and control_key_counts and target_key_counts:
+                diff.add_mismatch(
+                    key,
+                    [control_payloads[key][digest] for digest in sorted(control_key_counts.elements())],
+                    [target_payloads[key][digest] for digest in sorted(target_key_counts.elements())],
+                )
+                continue
+            # Without primary key, records are matched by payload: only the surplus occurrences on either side are reported
+            control_surplus = control_key_counts - target_key_counts
+            target_surplus = target_key_counts - control_key_counts
+            if control_surplus:
+                diff.add_control_only(key, [control_payloads[key][digest] for digest in control_surplus.elements()])
+            if target_surplus:
+                diff.add_target_only(key, [target_payloads[key][digest] for digest in target_surplus.elements()])
+    return diff
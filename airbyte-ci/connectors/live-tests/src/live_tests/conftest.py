@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
 import os
@@ -26,6 +27,11 @@ from live_tests import stash_keys
 from live_tests.commons.connection_objects_retrieval import ConnectionObject, InvalidConnectionError, get_connection_objects
 from live_tests.commons.connector_runner import ConnectorRunner, Proxy
 from live_tests.commons.evaluation_modes import TestEvaluationMode
+from live_tests.commons.execution_scheduler import (
+    DEFAULT_MAX_CONCURRENT_EXECUTIONS,
+    DEFAULT_MAX_CONCURRENT_EXECUTIONS_PER_CONNECTOR,
+    ExecutionScheduler,
+)
 from live_tests.commons.models import (
     ActorType,
     Command,
@@ -113,6 +119,24 @@ def pytest_addoption(parser: Parser) -> None:
         default=False,
         help="If a connector uses provider-specific libraries (e.g., facebook-business), it is better to disable the proxy.",
     )
+    parser.addoption(
+        "--streaming-record-diff",
+        type=bool,
+        default=False,
+        help="Compare records through on-disk partitions instead of loading them in memory. Recommended for streams with millions of records.",
+    )
+    parser.addoption(
+        "--max-concurrent-executions",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENT_EXECUTIONS,
+        help="The maximum number of connector commands running at the same time. Control and target versions run concurrently by default.",
+    )
+    parser.addoption(
+        "--max-concurrent-executions-per-connector",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENT_EXECUTIONS_PER_CONNECTOR,
+        help="The maximum number of commands running at the same time for a single connector version.",
+    )
 
 
 def pytest_configure(config: Config) -> None:
@@ -164,6 +188,11 @@ def pytest_configure(config: Config) -> None:
     )
 
     config.stash[stash_keys.DISABLE_PROXY] = config.getoption("--disable-proxy")
+    config.stash[stash_keys.STREAMING_RECORD_DIFF] = config.getoption("--streaming-record-diff")
+    config.stash[stash_keys.EXECUTION_SCHEDULER] = ExecutionScheduler(
+        config.getoption("--max-concurrent-executions"),
+        config.getoption("--max-concurrent-executions-per-connector"),
+    )
 
     if config.stash[stash_keys.RUN_IN_AIRBYTE_CI]:
         config.stash[stash_keys.SHOULD_READ_WITH_STATE] = bool(config.getoption("--should-read-with-state"))
@@ -229,11 +258,15 @@ def get_artifacts_directory(config: pytest.Config) -> Path:
 
 
 def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    requested_execution_result_fixtures = set()
     for item in items:
         if config.stash[stash_keys.SHOULD_READ_WITH_STATE] and "without_state" in item.keywords:
             item.add_marker(pytest.mark.skip(reason="Test is marked with without_state marker"))
         if not config.stash[stash_keys.SHOULD_READ_WITH_STATE] and "with_state" in item.keywords:
             item.add_marker(pytest.mark.skip(reason="Test is marked with with_state marker"))
+        if not item.get_closest_marker("skip"):
+            requested_execution_result_fixtures.update(EXECUTION_RESULT_FIXTURES.intersection(getattr(item, "fixturenames", [])))
+    config.stash[stash_keys.REQUESTED_EXECUTION_RESULT_FIXTURES] = requested_execution_result_fixtures
 
 
 def pytest_terminal_summary(terminalreporter: SugarTerminalReporter, exitstatus: int, config: Config) -> None:
@@ -542,6 +575,33 @@ async def run_command_and_add_to_report(
     return execution_result, proxy
 
 
+def schedule_command_and_add_to_report(
+    request: SubRequest,
+    dagger_client: dagger.Client,
+    command: Command,
+    connection_objects: ConnectionObjects,
+    connector: ConnectorUnderTest,
+    test_artifacts_directory: Path,
+) -> asyncio.Task:
+    """Start running the given command for the given connector, unless it was already started, and return the task running it."""
+    return request.config.stash[stash_keys.EXECUTION_SCHEDULER].schedule(
+        (command, connection_objects.connection_id, connector.target_or_control),
+        connector.image_name,
+        lambda: run_command_and_add_to_report(
+            dagger_client,
+            command,
+            connection_objects,
+            connector,
+            test_artifacts_directory,
+            request.config.stash[stash_keys.DUCKDB_PATH],
+            request.config.stash[stash_keys.RUN_IN_AIRBYTE_CI],
+            request.config.stash[stash_keys.TEST_REPORT],
+            request.config.stash[stash_keys.PRIVATE_DETAILS_REPORT],
+            disable_proxy=request.config.stash[stash_keys.DISABLE_PROXY],
+        ),
+    )
+
+
 def generate_execution_results_fixture(command: Command, control_or_target: str) -> Callable:
     """Dynamically generate the fixture for the given command and control/target.
     This is mainly to avoid code duplication and to make the code more maintainable.
@@ -557,23 +617,24 @@ def generate_execution_results_fixture(command: Command, control_or_target: str)
 
         @pytest.fixture(scope="session")
         async def generated_fixture(
-            request: SubRequest, dagger_client: dagger.Client, control_connector: ConnectorUnderTest, test_artifacts_directory: Path
+            request: SubRequest,
+            dagger_client: dagger.Client,
+            control_connector: ConnectorUnderTest,
+            target_connector: ConnectorUnderTest,
+            test_artifacts_directory: Path,
         ) -> ExecutionResult:
             connection_objects = request.param
             disable_proxy = request.config.stash[stash_keys.DISABLE_PROXY]
 
-            execution_results, proxy = await run_command_and_add_to_report(
-                dagger_client,
-                command,
-                connection_objects,
-                control_connector,
-                test_artifacts_directory,
-                request.config.stash[stash_keys.DUCKDB_PATH],
-                request.config.stash[stash_keys.RUN_IN_AIRBYTE_CI],
-                request.config.stash[stash_keys.TEST_REPORT],
-                request.config.stash[stash_keys.PRIVATE_DETAILS_REPORT],
-                disable_proxy=disable_proxy,
+            control_execution = schedule_command_and_add_to_report(
+                request, dagger_client, command, connection_objects, control_connector, test_artifacts_directory
             )
+            if f"{command.name.lower()}_target_execution_result" in request.config.stash[stash_keys.REQUESTED_EXECUTION_RESULT_FIXTURES]:
+                # Start the target execution right away, so it runs concurrently with the control one
+                schedule_command_and_add_to_report(
+                    request, dagger_client, command, connection_objects, target_connector, test_artifacts_directory
+                )
+            execution_results, proxy = await control_execution
 
             yield execution_results
 
@@ -589,17 +650,9 @@ def generate_execution_results_fixture(command: Command, control_or_target: str)
             connection_objects = request.param
             disable_proxy = request.config.stash[stash_keys.DISABLE_PROXY]
 
-            execution_results, proxy = await run_command_and_add_to_report(
-                dagger_client,
-                command,
-                connection_objects,
-                target_connector,
-                test_artifacts_directory,
-                request.config.stash[stash_keys.DUCKDB_PATH],
-                request.config.stash[stash_keys.RUN_IN_AIRBYTE_CI],
-                request.config.stash[stash_keys.TEST_REPORT],
-                request.config.stash[stash_keys.PRIVATE_DETAILS_REPORT],
-                disable_proxy=disable_proxy,
+            # The target execution might have already been started along with the control one
+            execution_results, proxy = await schedule_command_and_add_to_report(
+                request, dagger_client, command, connection_objects, target_connector, test_artifacts_directory
             )
 
             yield execution_results
@@ -2,14 +2,18 @@
 from __future__ import annotations
 
 import json
+import tempfile
 from collections.abc import Callable, Generator, Iterable
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
 import pytest
 from airbyte_protocol.models import AirbyteMessage  # type: ignore
 from deepdiff import DeepDiff  # type: ignore
 
+from live_tests import stash_keys
 from live_tests.commons.models import ExecutionResult
+from live_tests.commons.record_partitions import RecordPartitions, diff_record_partitions
 from live_tests.utils import fail_test_on_failing_execution_results, get_and_write_diff, get_test_logger, write_string_to_test_artifact
 
 if TYPE_CHECKING:
@@ -140,6 +144,7 @@ class TestDataIntegrity:
         """This test checks if all records in the control version are present in the target version for each stream.
         If there are mismatches, the test fails and the missing records are stored in the test artifacts.
         It will catch differences in record schemas, missing records, and extra records.
+        With --streaming-record-diff, records are compared through on-disk partitions instead of being loaded in memory.
 
         Args:
             request (SubRequest): The test request.
@@ -147,7 +152,20 @@ class TestDataIntegrity:
             read_target_execution_result (ExecutionResult): The target version execution result.
         """
         streams_with_diff = set()
+        streaming_record_diff = request.config.stash.get(stash_keys.STREAMING_RECORD_DIFF, False)
         for stream in read_control_execution_result.configured_streams:
+            if streaming_record_diff:
+                if self._get_streaming_diff_on_stream(
+                    request,
+                    record_property,
+                    stream,
+                    read_control_execution_result,
+                    read_target_execution_result,
+                    read_control_execution_result.primary_keys_per_stream.get(stream),
+                ):
+                    streams_with_diff.add(stream)
+                continue
+
             control_records = list(read_control_execution_result.get_records_per_stream(stream))
             target_records = list(read_target_execution_result.get_records_per_stream(stream))
 
@@ -522,6 +540,91 @@ class TestDataIntegrity:
             return (diff,)
         return None
 
+    def _get_streaming_diff_on_stream(
+        self,
+        request: SubRequest,
+        record_property: Callable,
+        stream: str,
+        control_execution_result: ExecutionResult,
+        target_execution_result: ExecutionResult,
+        primary_key: Optional[list[str]],
+    ) -> Optional[Iterable[str]]:
+        """Compare the records of a stream partition by partition, and only produce a detailed diff for the records which do not match.
+        The diff artifacts are the same as the ones of the in-memory comparison, restricted to the unmatched records.
+        """
+        logger = get_test_logger(request)
+        with tempfile.TemporaryDirectory() as partitions_directory:
+            control_partitions = RecordPartitions(Path(partitions_directory) / "control", primary_key)
+            target_partitions = RecordPartitions(Path(partitions_directory) / "target", primary_key)
+            logger.info(f"Partitioning records of stream {stream} on control and target versions.")
+            control_partitions.write(control_execution_result.get_records_per_stream(stream))
+            target_partitions.write(target_execution_result.get_records_per_stream(stream))
+            if control_partitions.record_count and not target_partitions.record_count:
+                pytest.fail(f"Stream {stream} is missing in the target version.")
+            diff = diff_record_partitions(control_partitions, target_partitions)
+
+        if not diff:
+            return None
+        logger.warning(
+            f"Stream {stream}: {diff.mismatched_key_count} primary keys with different records, "
+            f"{diff.control_only_count} records in control but not target, {diff.target_only_count} records in target but not control."
+        )
+
+        if not primary_key:
+            records_diff = get_and_write_diff(
+                request,
+                diff.sorted_records(diff.control_only_records),
+                diff.sorted_records(diff.target_only_records),
+                f"{stream}_diff",
+                ignore_order=True,
+                exclude_paths=EXCLUDE_PATHS,
+            )
+            if records_diff:
+                record_property(f"Diff for stream {stream}", records_diff)
+                return (records_diff,)
+            return None
+
+        record_diff = get_and_write_diff(
+            request,
+            diff.sorted_records(diff.mismatched_control_records),
+            diff.sorted_records(diff.mismatched_target_records),
+            f"{stream}_record_diff",
+            ignore_order=False,
+            exclude_paths=EXCLUDE_PATHS,
+        )
+        control_records_diff = get_and_write_diff(
+            request,
+            diff.sorted_records(diff.control_only_records),
+            [],
+            f"{stream}_control_records_diff",
+            ignore_order=False,
+            exclude_paths=EXCLUDE_PATHS,
+        )
+        target_records_diff = get_and_write_diff(
+            request,
+            [],
+            diff.sorted_records(diff.target_only_records),
+            f"{stream}_target_records_diff",
+            ignore_order=False,
+            exclude_paths=EXCLUDE_PATHS,
+        )
+
+        if record_diff or control_records_diff or target_records_diff:
+            record_property(
+                f"{stream} stream: records with primary key in target & control whose values differ",
+                record_diff,
+            )
+            record_property(
+                f"{stream} stream: records in control but not target",
+                control_records_diff,
+            )
+            record_property(
+                f"{stream} stream: records in target but not control",
+                target_records_diff,
+            )
+            return (record_diff, control_records_diff, target_records_diff)
+        return None
+
 
 def _get_filtered_sorted_records(
     records: list[AirbyteMessage],
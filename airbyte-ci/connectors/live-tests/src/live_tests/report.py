@@ -14,6 +14,7 @@ from typing import TYPE_CHECKING, Any, Optional
 
 import requests
 import yaml
+from airbyte_protocol.models import Type as AirbyteMessageType  # type: ignore
 from jinja2 import Environment, PackageLoader, select_autoescape
 
 from live_tests import stash_keys
@@ -213,6 +214,7 @@ class TestReport(BaseReport):
             selected_streams=self.get_configured_streams(),
             sync_mode_coverage=self.get_sync_mode_coverage(),
             http_metrics_per_command=self.get_http_metrics_per_command(),
+            execution_time_per_command=self.get_execution_time_per_command(),
             record_count_per_command_and_stream=self.get_record_count_per_stream(),
             test_results=self.test_results,
             max_lines=MAX_LINES_IN_REPORT,
@@ -365,6 +367,30 @@ class TestReport(BaseReport):
                 )
         return all_commands_sorted, message_count_per_type_and_command
 
+    def get_execution_time_per_command(self) -> dict[Command, dict[str, dict[str, str] | str]]:
+        """Duration and record throughput of the control and target executions of each command, summed over all connections."""
+        execution_time_per_command: dict[Command, dict[str, dict[str, str] | str]] = {}
+        for command in Command:
+            durations = {}
+            metrics: dict[str, dict[str, str] | str] = {}
+            for version, execution_results in [
+                ("control", self.control_execution_results_per_command[command]),
+                ("target", self.target_execution_results_per_command[command]),
+            ]:
+                timed_results = [result for result in execution_results if result.execution_duration is not None]
+                if not timed_results:
+                    continue
+                durations[version] = sum(result.execution_duration for result in timed_results)  # type: ignore
+                record_count = sum(result.get_message_count_per_type().get(AirbyteMessageType.RECORD, 0) for result in timed_results)
+                metrics[version] = {
+                    "duration": f"{durations[version]:.1f}s",
+                    "records_per_second": f"{record_count / durations[version]:.1f}" if durations[version] and record_count else "N/A",
+                }
+            if len(durations) == 2:
+                metrics["difference"] = f"{durations['target'] - durations['control']:+.1f}s"
+                execution_time_per_command[command] = metrics
+        return execution_time_per_command
+
     def get_http_metrics_per_command(
         self,
     ) -> dict[Command, dict[str, dict[str, int | str] | int]]:
@@ -7,6 +7,7 @@ from typing import List
 import pytest
 
 from live_tests.commons.evaluation_modes import TestEvaluationMode
+from live_tests.commons.execution_scheduler import ExecutionScheduler
 from live_tests.commons.models import ConnectionObjects, ConnectionSubset
 from live_tests.report import PrivateDetailsReport, TestReport
 
@@ -19,6 +20,7 @@ CONTROL_VERSION = pytest.StashKey[str]()
 CONNECTION_SUBSET = pytest.StashKey[ConnectionSubset]()
 DAGGER_LOG_PATH = pytest.StashKey[Path]()
 DUCKDB_PATH = pytest.StashKey[Path]()
+EXECUTION_SCHEDULER = pytest.StashKey[ExecutionScheduler]()
 HTTP_DUMP_CACHE_VOLUMES = pytest.StashKey[list]()
 RUN_IN_AIRBYTE_CI = pytest.StashKey[bool]()  # Running in airbyte-ci, locally or in GhA
 IS_PRODUCTION_CI = pytest.StashKey[bool]()  # Running in airbyte-ci in GhA
@@ -26,10 +28,12 @@ IS_PERMITTED_BOOL = pytest.StashKey[bool]()
 PR_URL = pytest.StashKey[str]()
 TEST_REPORT = pytest.StashKey[TestReport]()
 PRIVATE_DETAILS_REPORT = pytest.StashKey[PrivateDetailsReport]()
+REQUESTED_EXECUTION_RESULT_FIXTURES = pytest.StashKey[set[str]]()
 RETRIEVAL_REASONS = pytest.StashKey[str]()
 SELECTED_STREAMS = pytest.StashKey[set[str]]()
 SESSION_RUN_ID = pytest.StashKey[str]()
 SHOULD_READ_WITH_STATE = pytest.StashKey[bool]()
+STREAMING_RECORD_DIFF = pytest.StashKey[bool]()
 DISABLE_PROXY = pytest.StashKey[bool]()
 TARGET_VERSION = pytest.StashKey[str]()
 TEST_ARTIFACT_DIRECTORY = pytest.StashKey[Path]()
@@ -0,0 +1,71 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+import asyncio
+from collections import Counter
+
+import pytest
+
+from live_tests.commons.execution_scheduler import ExecutionScheduler
+
+
+class ExecutionTracker:
+    def __init__(self) -> None:
+        self.running: Counter = Counter()
+        self.max_running = 0
+        self.max_running_per_connector: Counter = Counter()
+        self.run_count = 0
+
+    def execution(self, connector: str):
+        async def _execution() -> str:
+            self.run_count += 1
+            self.running[connector] += 1
+            self.max_running = max(self.max_running, sum(self.running.values()))
+            self.max_running_per_connector[connector] = max(self.max_running_per_connector[connector], self.running[connector])
+            await asyncio.sleep(0.01)
+            self.running[connector] -= 1
+            return connector
+
+        return _execution
+
+
+async def _run_all(scheduler: ExecutionScheduler, tracker: ExecutionTracker, connectors: list[str]) -> list[str]:
+    tasks = [scheduler.schedule(i, connector, tracker.execution(connector)) for i, connector in enumerate(connectors)]
+    return [await task for task in tasks]
+
+
+@pytest.mark.parametrize(
+    "max_concurrent_executions, max_concurrent_executions_per_connector, expected_max_running, expected_max_running_per_connector",
+    [
+        (2, 1, 2, 1),
+        (1, 1, 1, 1),
+        (4, 2, 4, 2),
+    ],
+)
+def test_concurrency_limits(
+    max_concurrent_executions, max_concurrent_executions_per_connector, expected_max_running, expected_max_running_per_connector
+):
+    scheduler = ExecutionScheduler(max_concurrent_executions, max_concurrent_executions_per_connector)
+    tracker = ExecutionTracker()
+    connectors = ["control", "target"] * 4
+    assert asyncio.run(_run_all(scheduler, tracker, connectors)) == connectors
+    assert tracker.max_running == expected_max_running
+    assert max(tracker.max_running_per_connector.values()) == expected_max_running_per_connector
+
+
+def test_execution_is_scheduled_once():
+    scheduler = ExecutionScheduler()
+    tracker = ExecutionTracker()
+
+    async def _schedule_twice():
+        first_task = scheduler.schedule("key", "target", tracker.execution("target"))
+        second_task = scheduler.schedule("key", "target", tracker.execution("target"))
+        assert first_task is second_task
+        return await first_task, await second_task
+
+    assert asyncio.run(_schedule_twice()) == ("target", "target")
+    assert tracker.run_count == 1
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError):
+        ExecutionScheduler(0, 1)
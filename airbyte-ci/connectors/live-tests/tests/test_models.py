@@ -0,0 +1,105 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from airbyte_protocol.models import (
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    AirbyteStateMessage,
+    AirbyteStateType,
+    AirbyteStreamState,
+    AirbyteStreamStatus,
+    AirbyteStreamStatusTraceMessage,
+    AirbyteTraceMessage,
+    StreamDescriptor,
+    TraceType,
+)
+from airbyte_protocol.models import Type as AirbyteMessageType
+
+from live_tests.commons.models import Command, ExecutionResult
+
+
+def _record(stream: str) -> AirbyteMessage:
+    return AirbyteMessage(type=AirbyteMessageType.RECORD, record=AirbyteRecordMessage(stream=stream, data={"id": 1}, emitted_at=1))
+
+
+def _state(stream: str) -> AirbyteMessage:
+    return AirbyteMessage(
+        type=AirbyteMessageType.STATE,
+        state=AirbyteStateMessage(
+            type=AirbyteStateType.STREAM,
+            stream=AirbyteStreamState(stream_descriptor=StreamDescriptor(name=stream), stream_state={"cursor": 1}),
+        ),
+    )
+
+
+def _status(stream: str, status: AirbyteStreamStatus) -> AirbyteMessage:
+    return AirbyteMessage(
+        type=AirbyteMessageType.TRACE,
+        trace=AirbyteTraceMessage(
+            type=TraceType.STREAM_STATUS,
+            emitted_at=1,
+            stream_status=AirbyteStreamStatusTraceMessage(stream_descriptor=StreamDescriptor(name=stream), status=status),
+        ),
+    )
+
+
+@pytest.fixture
+def execution_result(tmp_path) -> ExecutionResult:
+    messages = [
+        _status("a", AirbyteStreamStatus.STARTED),
+        _record("a"),
+        _record("b"),
+        _state("a"),
+        _state("b"),
+        _record("a"),
+        _state("a"),
+        _status("a", AirbyteStreamStatus.COMPLETE),
+    ]
+    stdout_file_path = tmp_path / "stdout.txt"
+    stdout_file_path.write_text("\n".join([message.json() for message in messages] + ["not an airbyte message"]) + "\n")
+    return ExecutionResult(
+        hashed_connection_id="hashed_connection_id",
+        actor_id="actor_id",
+        configured_catalog=MagicMock(),
+        connector_under_test=MagicMock(),
+        command=Command.READ,
+        stdout_file_path=stdout_file_path,
+        stderr_file_path=tmp_path / "stderr.txt",
+        success=True,
+        executed_container=None,
+        config=None,
+    )
+
+
+def test_message_index(execution_result):
+    assert execution_result.get_message_count_per_type() == {
+        AirbyteMessageType.TRACE: 2,
+        AirbyteMessageType.RECORD: 3,
+        AirbyteMessageType.STATE: 3,
+    }
+    states = execution_result.get_states_per_stream("a")
+    assert [len(states["a"]), len(states["b"])] == [2, 1]
+    statuses = execution_result.get_status_messages_per_stream("a")
+    assert [status.status for status in statuses["a"]] == [AirbyteStreamStatus.STARTED, AirbyteStreamStatus.COMPLETE]
+    assert "b" not in statuses
+
+
+def test_command_output_is_parsed_once(tmp_path, execution_result):
+    parse = ExecutionResult.parse_airbyte_messages_from_command_output
+    parsed_paths = []
+
+    def record_parse(self, command_output_path, log_validation_errors=False):
+        parsed_paths.append(command_output_path)
+        return parse(self, command_output_path, log_validation_errors)
+
+    with patch.object(ExecutionResult, "parse_airbyte_messages_from_command_output", autospec=True, side_effect=record_parse):
+        execution_result.save_airbyte_messages(tmp_path / "output")
+        execution_result.get_states_per_stream("a")
+        execution_result.get_status_messages_per_stream("a")
+        execution_result.get_message_count_per_type()
+        records = list(execution_result.get_records())
+
+    assert parsed_paths == [execution_result.stdout_file_path, execution_result.backend.jsonl_records_path]
+    assert [record.record.stream for record in records] == ["a", "b", "a"]
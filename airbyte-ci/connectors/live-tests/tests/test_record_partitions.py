@@ -0,0 +1,67 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+import pytest
+from airbyte_protocol.models import AirbyteMessage, AirbyteRecordMessage
+from airbyte_protocol.models import Type as AirbyteMessageType
+
+from live_tests.commons.record_partitions import RecordPartitions, diff_record_partitions
+
+
+def _records(*data: dict, emitted_at: int = 1) -> list[AirbyteMessage]:
+    return [
+        AirbyteMessage(type=AirbyteMessageType.RECORD, record=AirbyteRecordMessage(stream="stream", data=d, emitted_at=emitted_at))
+        for d in data
+    ]
+
+
+def _diff(tmp_path, control_records, target_records, primary_key, partition_count=4):
+    control = RecordPartitions(tmp_path / "control", primary_key, partition_count)
+    target = RecordPartitions(tmp_path / "target", primary_key, partition_count)
+    control.write(control_records)
+    target.write(target_records)
+    return diff_record_partitions(control, target)
+
+
+def test_identical_records_have_no_diff(tmp_path):
+    records = [{"id": i, "value": f"value_{i}"} for i in range(100)]
+    # emitted_at is not compared and record order does not matter
+    diff = _diff(tmp_path, _records(*records), _records(*reversed(records), emitted_at=2), ["id"])
+    assert not diff
+
+
+def test_diff_with_primary_key(tmp_path):
+    diff = _diff(
+        tmp_path,
+        _records({"id": 1, "value": "a"}, {"id": 2, "value": "b"}, {"id": 3, "value": "c"}),
+        _records({"id": 1, "value": "a"}, {"id": 2, "value": "changed"}, {"id": 4, "value": "d"}),
+        ["id"],
+    )
+    assert diff.mismatched_key_count == 1
+    assert [r["data"] for r in diff.sorted_records(diff.mismatched_control_records)] == [{"id": 2, "value": "b"}]
+    assert [r["data"] for r in diff.sorted_records(diff.mismatched_target_records)] == [{"id": 2, "value": "changed"}]
+    assert [r["data"] for r in diff.sorted_records(diff.control_only_records)] == [{"id": 3, "value": "c"}]
+    assert [r["data"] for r in diff.sorted_records(diff.target_only_records)] == [{"id": 4, "value": "d"}]
+
+
+@pytest.mark.parametrize("partition_count", [1, 8])
+def test_diff_without_primary_key_reports_surplus_records(tmp_path, partition_count):
+    diff = _diff(
+        tmp_path,
+        _records({"value": "a"}, {"value": "a"}, {"value": "b"}),
+        _records({"value": "a"}, {"value": "b"}, {"value": "c"}),
+        None,
+        partition_count,
+    )
+    assert diff.mismatched_key_count == 0
+    assert [r["data"] for r in diff.sorted_records(diff.control_only_records)] == [{"value": "a"}]
+    assert [r["data"] for r in diff.sorted_records(diff.target_only_records)] == [{"value": "c"}]
+
+
+def test_diff_keeps_a_bounded_number_of_records(tmp_path):
+    control = RecordPartitions(tmp_path / "control", ["id"])
+    target = RecordPartitions(tmp_path / "target", ["id"])
+    control.write(_records(*[{"id": i} for i in range(50)]))
+    target.write([])
+    diff = diff_record_partitions(control, target, max_records_per_diff=10)
+    assert diff.control_only_count == 50
+    assert len(diff.control_only_records) == 10
@@ -3,14 +3,16 @@
 #
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
-from typing import List
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from google.cloud import storage
 
 PROD_SPEC_CACHE_BUCKET_NAME = "io-airbyte-cloud-spec-cache"
 CACHE_FOLDER = "specs"
+DEFAULT_MAX_DOWNLOAD_WORKERS = 16
 
 
 class Registries(str, Enum):
@@ -41,10 +43,18 @@ class CachedSpec:
         return self.spec_cache_path
 
 
+SpecCacheKey = Tuple[str, str, Registries]
+
+
 def get_spec_file_name(registry: Registries) -> str:
     return SPEC_FILE_NAMES[registry]
 
 
+def get_spec_cache_path(docker_repository: str, docker_image_tag: str, registry: Registries) -> str:
+    """Returns the path of the spec of a given docker repository, tag and registry in the spec cache bucket."""
+    return f"{CACHE_FOLDER}/{docker_repository}/{docker_image_tag}/{get_spec_file_name(registry)}"
+
+
 def get_registry_from_spec_cache_path(spec_cache_path: str) -> Registries:
     """Returns the registry from the spec cache path."""
     for registry in Registries:
@@ -76,10 +86,35 @@ def get_docker_info_from_spec_cache_path(spec_cache_path: str) -> CachedSpec:
 
 
 class SpecCache:
-    def __init__(self, bucket_name: str = PROD_SPEC_CACHE_BUCKET_NAME):
+    """Finds and downloads the connector specs stored in the spec cache bucket.
+
+    By default all the specs of the bucket are listed once and indexed by docker repository, tag and registry.
+    In lazy mode nothing is listed: each lookup checks whether the spec exists at its deterministic path in the bucket,
+    which is cheaper for callers looking up the specs of only a few connectors.
+    """
+
+    def __init__(self, bucket_name: str = PROD_SPEC_CACHE_BUCKET_NAME, lazy: bool = False):
         self.client = storage.Client.create_anonymous_client()
         self.bucket = self.client.bucket(bucket_name)
-        self.cached_specs = self.get_all_cached_specs()
+        self.lazy = lazy
+        self._cached_specs: Optional[List[CachedSpec]] = None
+        self._index: Dict[SpecCacheKey, CachedSpec] = {}
+        self._lazy_lookups: Dict[SpecCacheKey, Optional[CachedSpec]] = {}
+        if not lazy:
+            self._load_cached_specs()
+
+    @property
+    def cached_specs(self) -> List[CachedSpec]:
+        if self._cached_specs is None:
+            self._load_cached_specs()
+        return self._cached_specs
+
+    def _load_cached_specs(self):
+        self._cached_specs = self.get_all_cached_specs()
+        self._index = {}
+        for cached_spec in self._cached_specs:
+            # keep the first spec listed for a key, as the former linear scan did
+            self._index.setdefault((cached_spec.docker_repository, cached_spec.docker_image_tag, cached_spec.registry), cached_spec)
 
     def get_all_cached_specs(self) -> List[CachedSpec]:
         """Returns a list of all the specs in the spec cache bucket."""
@@ -88,19 +123,17 @@ class SpecCache:
 
         return [get_docker_info_from_spec_cache_path(blob.name) for blob in blobs if blob.name.endswith(".json")]
 
-    def _find_spec_cache(self, docker_repository: str, docker_image_tag: str, registry: Registries) -> CachedSpec:
+    def _find_spec_cache(self, docker_repository: str, docker_image_tag: str, registry: Registries) -> Optional[CachedSpec]:
         """Returns the spec cache path for a given docker repository and tag."""
+        key = (docker_repository, docker_image_tag, registry)
+        if self._cached_specs is not None:
+            return self._index.get(key)
 
-        # find the spec cache path for the given docker repository and tag
-        for cached_spec in self.cached_specs:
-            if (
-                cached_spec.docker_repository == docker_repository
-                and cached_spec.registry == registry
-                and cached_spec.docker_image_tag == docker_image_tag
-            ):
-                return cached_spec
-
-        return None
+        if key not in self._lazy_lookups:
+            spec_cache_path = get_spec_cache_path(docker_repository, docker_image_tag, registry)
+            exists = self.bucket.blob(spec_cache_path).exists()
+            self._lazy_lookups[key] = CachedSpec(docker_repository, docker_image_tag, spec_cache_path, registry) if exists else None
+        return self._lazy_lookups[key]
 
     def find_spec_cache_with_fallback(self, docker_repository: str, docker_image_tag: str, registry_str: str) -> CachedSpec:
         """Returns the spec cache path for a given docker repository and tag and fallback to OSS if none found"""
@@ -118,3 +151,10 @@ class SpecCache:
     def download_spec(self, spec: CachedSpec) -> dict:
         """Downloads the spec from the spec cache bucket."""
         return json.loads(self.bucket.blob(spec.spec_cache_path).download_as_string())
+
+    def download_specs(self, specs: Iterable[CachedSpec], max_workers: int = DEFAULT_MAX_DOWNLOAD_WORKERS) -> List[dict]:
+        """Downloads the specs concurrently from the spec cache bucket, with at most max_workers downloads in flight.
+        Specs are returned in the order they were given.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.download_spec, specs))
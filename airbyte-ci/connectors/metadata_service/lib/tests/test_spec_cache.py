@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
 from unittest.mock import patch
 
 import pytest
@@ -100,3 +101,87 @@ def test_get_docker_info_from_spec_cache_path(spec_cache_path, expected_spec):
 def test_get_docker_info_from_spec_cache_path_invalid():
     with pytest.raises(Exception):
         get_docker_info_from_spec_cache_path("specs/airbyte/destination-azure-blob-storage/0.1.1/spec")
+
+
+class FakeBlob:
+    def __init__(self, bucket: "FakeBucket", name: str):
+        self.bucket = bucket
+        self.name = name
+
+    def exists(self) -> bool:
+        self.bucket.existence_checks.append(self.name)
+        return self.name in self.bucket.specs
+
+    def download_as_string(self) -> bytes:
+        return json.dumps(self.bucket.specs[self.name]).encode("utf-8")
+
+
+class FakeBucket:
+    def __init__(self, specs: dict):
+        self.specs = specs
+        self.existence_checks = []
+
+    def blob(self, name: str) -> FakeBlob:
+        return FakeBlob(self, name)
+
+    def list_blobs(self, prefix: str):
+        return [FakeBlob(self, name) for name in self.specs if name.startswith(prefix)]
+
+
+@pytest.fixture
+def fake_bucket():
+    return FakeBucket(
+        {
+            "specs/airbyte/source-faker/1.0.0/spec.json": {"connectionSpecification": {"title": "oss"}},
+            "specs/airbyte/source-faker/1.0.0/spec.cloud.json": {"connectionSpecification": {"title": "cloud"}},
+            "specs/airbyte/source-pokeapi/0.1.0/spec.json": {"connectionSpecification": {"title": "pokeapi"}},
+        }
+    )
+
+
+@pytest.fixture
+def fake_bucket_client(fake_bucket):
+    with patch("google.cloud.storage.Client.create_anonymous_client") as MockClient:
+        MockClient.return_value.bucket.return_value = fake_bucket
+        yield MockClient
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+@pytest.mark.parametrize(
+    "image,tag,given_registry,expected_path",
+    [
+        ("airbyte/source-faker", "1.0.0", "oss", "specs/airbyte/source-faker/1.0.0/spec.json"),
+        ("airbyte/source-faker", "1.0.0", "cloud", "specs/airbyte/source-faker/1.0.0/spec.cloud.json"),
+        ("airbyte/source-pokeapi", "0.1.0", "cloud", "specs/airbyte/source-pokeapi/0.1.0/spec.json"),
+        ("airbyte/source-pokeapi", "0.2.0", "oss", None),
+    ],
+)
+def test_find_spec_cache_with_fallback_in_bucket(fake_bucket_client, lazy, image, tag, given_registry, expected_path):
+    spec_cache = SpecCache(lazy=lazy)
+    spec = spec_cache.find_spec_cache_with_fallback(image, tag, given_registry)
+    if expected_path is None:
+        assert spec is None
+    else:
+        assert spec == get_docker_info_from_spec_cache_path(expected_path)
+
+
+def test_lazy_spec_cache_does_not_list_bucket(fake_bucket_client, fake_bucket, mocker):
+    list_blobs = mocker.spy(fake_bucket, "list_blobs")
+    spec_cache = SpecCache(lazy=True)
+
+    for _ in range(3):
+        spec_cache.find_spec_cache_with_fallback("airbyte/source-pokeapi", "0.1.0", "cloud")
+
+    list_blobs.assert_not_called()
+    # lookups are memoized, including the missing cloud spec
+    assert fake_bucket.existence_checks == [
+        "specs/airbyte/source-pokeapi/0.1.0/spec.cloud.json",
+        "specs/airbyte/source-pokeapi/0.1.0/spec.json",
+    ]
+
+
+def test_download_specs(fake_bucket_client, fake_bucket):
+    spec_cache = SpecCache()
+    specs = [get_docker_info_from_spec_cache_path(path) for path in fake_bucket.specs]
+
+    assert spec_cache.download_specs(specs, max_workers=2) == list(fake_bucket.specs.values())
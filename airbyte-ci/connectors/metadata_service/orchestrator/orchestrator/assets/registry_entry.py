@@ -3,11 +3,14 @@
 #
 
 import copy
+import hashlib
 import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 import orchestrator.hacks as HACKS
 import pandas as pd
@@ -21,7 +24,13 @@ from metadata_service.models.generated.ConnectorRegistryDestinationDefinition im
 from metadata_service.models.generated.ConnectorRegistrySourceDefinition import ConnectorRegistrySourceDefinition
 from metadata_service.models.transform import to_json_sanitized_dict
 from metadata_service.spec_cache import SpecCache
-from orchestrator.config import MAX_METADATA_PARTITION_RUN_REQUEST, VALID_REGISTRIES, get_public_url_for_gcs_file
+from orchestrator.config import (
+    MAX_METADATA_PARTITION_RUN_REQUEST,
+    MAX_REGISTRY_ENTRY_FETCH_WORKERS,
+    VALID_REGISTRIES,
+    get_public_url_for_gcs_file,
+    get_registry_entry_cache_directory,
+)
 from orchestrator.fetcher.connector_cdk_version import get_cdk_version
 from orchestrator.logging import sentry
 from orchestrator.logging.publish_connector_lifecycle import PublishConnectorLifecycle, PublishConnectorLifecycleStage, StageStatus
@@ -309,6 +318,10 @@ def apply_entry_schema_migrations(registry_entry: dict) -> dict:
 @sentry_sdk.trace
 def read_registry_entry_blob(registry_entry_blob: storage.Blob) -> TaggedRegistryEntry:
     json_string = registry_entry_blob.download_as_string().decode("utf-8")
+    return parse_registry_entry(json_string)
+
+
+def parse_registry_entry(json_string: str) -> TaggedRegistryEntry:
     registry_entry_dict = json.loads(json_string)
 
     connector_type, ConnectorModel = get_connector_type_from_registry_entry(registry_entry_dict)
@@ -318,6 +331,102 @@ def read_registry_entry_blob(registry_entry_blob: storage.Blob) -> TaggedRegistr
     return connector_type, registry_entry
 
 
+class RegistryEntryBlobCache:
+    """Cache of the registry entries read from GCS blobs.
+
+    GCS never changes the content of a blob generation: overwriting a blob creates a new generation. Entries are therefore cached
+    under their blob name and generation (or etag when the generation is unknown): parsed in memory, and as downloaded on the local
+    disk when a cache directory is set. An unchanged entry is neither downloaded nor parsed again when the registries are regenerated.
+    Only the latest generation read of each blob is kept, so superseded generations are dropped instead of accumulating.
+    """
+
+    def __init__(self, cache_directory: Optional[str] = None):
+        self.cache_directory = cache_directory
+        # blob path -> (cache key of the generation read last, its parsed entry)
+        self._entries: Dict[str, Tuple[str, TaggedRegistryEntry]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_blob_path(registry_entry_blob: storage.Blob) -> str:
+        bucket_name = getattr(registry_entry_blob.bucket, "name", "")
+        return f"{bucket_name}/{registry_entry_blob.name}"
+
+    @classmethod
+    def get_key(cls, registry_entry_blob: storage.Blob) -> Optional[str]:
+        version = registry_entry_blob.generation or registry_entry_blob.etag
+        if not version:
+            return None
+        return hashlib.sha256(f"{cls.get_blob_path(registry_entry_blob)}#{version}".encode("utf-8")).hexdigest()
+
+    def read(self, registry_entry_blob: storage.Blob) -> TaggedRegistryEntry:
+        key = self.get_key(registry_entry_blob)
+        if key is None:
+            return read_registry_entry_blob(registry_entry_blob)
+
+        blob_path = self.get_blob_path(registry_entry_blob)
+        with self._lock:
+            cached_key, tagged_registry_entry = self._entries.get(blob_path, (None, None))
+        if cached_key == key:
+            return tagged_registry_entry
+
+        json_string = self._read_from_disk(key)
+        if json_string is None:
+            json_string = registry_entry_blob.download_as_string().decode("utf-8")
+            self._write_to_disk(key, json_string)
+        tagged_registry_entry = parse_registry_entry(json_string)
+
+        with self._lock:
+            superseded_key, _ = self._entries.get(blob_path, (None, None))
+            self._entries[blob_path] = (key, tagged_registry_entry)
+        if superseded_key is not None and superseded_key != key:
+            self._remove_from_disk(superseded_key)
+        return tagged_registry_entry
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.cache_directory, f"{key}.json")
+
+    def _read_from_disk(self, key: str) -> Optional[str]:
+        if not self.cache_directory:
+            return None
+        try:
+            with open(self._get_path(key), "r") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write_to_disk(self, key: str, json_string: str):
+        if not self.cache_directory:
+            return
+        os.makedirs(self.cache_directory, exist_ok=True)
+        # Written to a temporary file first, so an interrupted write never leaves a truncated entry behind
+        tmp_path = f"{self._get_path(key)}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(json_string)
+        os.replace(tmp_path, self._get_path(key))
+
+    def _remove_from_disk(self, key: str):
+        if not self.cache_directory:
+            return
+        try:
+            os.remove(self._get_path(key))
+        except OSError:
+            pass
+
+
+registry_entry_blob_cache = RegistryEntryBlobCache(get_registry_entry_cache_directory())
+
+
+def read_registry_entry_blobs(
+    registry_entry_blobs: Iterable[storage.Blob],
+    cache: Optional[RegistryEntryBlobCache] = None,
+    max_workers: int = MAX_REGISTRY_ENTRY_FETCH_WORKERS,
+) -> List[TaggedRegistryEntry]:
+    """Read registry entry blobs concurrently, with at most max_workers downloads in flight. Entries are returned in the blobs order."""
+    cache = cache or registry_entry_blob_cache
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(cache.read, registry_entry_blobs))
+
+
 def get_connector_type_from_registry_entry(registry_entry: dict) -> TaggedRegistryEntry:
     if registry_entry.get(ConnectorTypePrimaryKey.SOURCE.value):
         return (ConnectorTypes.SOURCE, ConnectorRegistrySourceDefinition)
@@ -653,7 +762,7 @@ def registry_entry(
         commit_sha=commit_sha,
     )
 
-    spec_cache = SpecCache()
+    spec_cache = SpecCache(lazy=True)
 
     root_metadata_directory_manager = context.resources.root_metadata_directory_manager
     enabled_registries, disabled_registries = get_registry_status_lists(metadata_entry)
@@ -717,10 +826,7 @@ def registry_entry(
 
 
 def get_registry_entries(blob_resource) -> Output[List]:
-    registry_entries = []
-    for blob in blob_resource:
-        _, registry_entry = read_registry_entry_blob(blob)
-        registry_entries.append(registry_entry)
+    registry_entries = [registry_entry for _, registry_entry in read_registry_entry_blobs(blob_resource)]
 
     return Output(registry_entries)
 
@@ -3,6 +3,7 @@
 #
 
 import os
+import tempfile
 from typing import Optional
 
 
@@ -30,6 +31,9 @@ CONNECTOR_DEPENDENCY_FILE_NAME = "dependencies.json"
 
 MAX_METADATA_PARTITION_RUN_REQUEST = 50
 
+MAX_REGISTRY_ENTRY_FETCH_WORKERS = 16
+DEFAULT_REGISTRY_ENTRY_CACHE_DIRECTORY = os.path.join(tempfile.gettempdir(), "registry_entry_cache")
+
 HIGH_QUEUE_PRIORITY = "3"
 MED_QUEUE_PRIORITY = "2"
 LOW_QUEUE_PRIORITY = "1"
@@ -50,6 +54,14 @@ def get_public_url_for_gcs_file(bucket_name: str, file_path: str, cdn_url: Optio
     return f"{cdn_url}/{file_path}" if cdn_url else f"{DEFAULT_ASSET_URL}/{bucket_name}/{file_path}"
 
 
+def get_registry_entry_cache_directory() -> Optional[str]:
+    """Get the local directory where downloaded registry entries are cached.
+
+    Setting the REGISTRY_ENTRY_CACHE_DIRECTORY environment variable to an empty string disables the local disk cache.
+    """
+    return os.getenv("REGISTRY_ENTRY_CACHE_DIRECTORY", DEFAULT_REGISTRY_ENTRY_CACHE_DIRECTORY) or None
+
+
 def get_public_metadata_service_url(file_path: str) -> str:
     metadata_bucket = os.getenv("METADATA_BUCKET")
     metadata_cdn_url = os.getenv("METADATA_CDN_BASE_URL")
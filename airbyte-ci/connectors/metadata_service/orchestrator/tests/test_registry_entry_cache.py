@@ -0,0 +1,130 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import threading
+from typing import Dict, List, Optional
+
+import pytest
+from orchestrator.assets.registry_entry import RegistryEntryBlobCache, get_registry_entries, read_registry_entry_blobs
+
+
+class FakeBlob:
+    def __init__(self, bucket: "FakeBucket", name: str, content: bytes, generation: Optional[int]):
+        self.bucket = bucket
+        self.name = name
+        self.generation = generation
+        self.etag = None
+        self._content = content
+
+    def download_as_string(self) -> bytes:
+        self.bucket.record_download(self.name)
+        return self._content
+
+
+class FakeBucket:
+    """A local stand-in for a GCS bucket: every upload of a blob creates a new generation, as GCS does."""
+
+    def __init__(self, name: str = "fake-bucket"):
+        self.name = name
+        self.downloads: List[str] = []
+        self._blobs: Dict[str, FakeBlob] = {}
+        self._lock = threading.Lock()
+
+    def upload(self, name: str, content: dict, versioned: bool = True):
+        previous_generation = self._blobs[name].generation if name in self._blobs else 0
+        generation = previous_generation + 1 if versioned else None
+        self._blobs[name] = FakeBlob(self, name, json.dumps(content).encode("utf-8"), generation)
+
+    def list_blobs(self, prefix: str = "") -> List[FakeBlob]:
+        return [blob for name, blob in sorted(self._blobs.items()) if name.startswith(prefix)]
+
+    def record_download(self, name: str):
+        with self._lock:
+            self.downloads.append(name)
+
+
+@pytest.fixture
+def fake_bucket(oss_registry_dict) -> FakeBucket:
+    bucket = FakeBucket()
+    for registry_entry in oss_registry_dict["sources"][:20]:
+        bucket.upload(f"metadata/{registry_entry['dockerRepository']}/latest/oss.json", registry_entry)
+    return bucket
+
+
+def test_read_registry_entry_blobs_keeps_blobs_order(fake_bucket):
+    blobs = fake_bucket.list_blobs()
+    tagged_registry_entries = read_registry_entry_blobs(blobs, cache=RegistryEntryBlobCache(), max_workers=4)
+
+    assert [f"metadata/{registry_entry.dockerRepository}/latest/oss.json" for _, registry_entry in tagged_registry_entries] == [
+        blob.name for blob in blobs
+    ]
+    assert {connector_type for connector_type, _ in tagged_registry_entries} == {"source"}
+    assert sorted(fake_bucket.downloads) == sorted(blob.name for blob in blobs)
+
+
+def test_unchanged_entries_are_not_downloaded_again(fake_bucket, oss_registry_dict):
+    cache = RegistryEntryBlobCache()
+    read_registry_entry_blobs(fake_bucket.list_blobs(), cache=cache)
+    fake_bucket.downloads.clear()
+
+    changed_entry = dict(oss_registry_dict["sources"][0], dockerImageTag="99.0.0")
+    changed_blob_name = f"metadata/{changed_entry['dockerRepository']}/latest/oss.json"
+    fake_bucket.upload(changed_blob_name, changed_entry)
+    tagged_registry_entries = read_registry_entry_blobs(fake_bucket.list_blobs(), cache=cache)
+
+    assert fake_bucket.downloads == [changed_blob_name]
+    assert changed_entry["dockerImageTag"] in [registry_entry.dockerImageTag for _, registry_entry in tagged_registry_entries]
+
+
+def test_entries_are_cached_on_disk(fake_bucket, tmp_path):
+    read_registry_entry_blobs(fake_bucket.list_blobs(), cache=RegistryEntryBlobCache(str(tmp_path)))
+    fake_bucket.downloads.clear()
+
+    # A new cache, as in a new run, reads the entries downloaded by the previous one from the disk
+    tagged_registry_entries = read_registry_entry_blobs(fake_bucket.list_blobs(), cache=RegistryEntryBlobCache(str(tmp_path)))
+
+    assert fake_bucket.downloads == []
+    assert len(tagged_registry_entries) == len(fake_bucket.list_blobs())
+
+
+def test_superseded_generations_are_dropped(fake_bucket, oss_registry_dict, tmp_path):
+    cache = RegistryEntryBlobCache(str(tmp_path))
+    read_registry_entry_blobs(fake_bucket.list_blobs(), cache=cache)
+
+    registry_entry = oss_registry_dict["sources"][0]
+    blob_name = f"metadata/{registry_entry['dockerRepository']}/latest/oss.json"
+    for version in range(3):
+        fake_bucket.upload(blob_name, dict(registry_entry, dockerImageTag=f"99.0.{version}"))
+        read_registry_entry_blobs(fake_bucket.list_blobs(), cache=cache)
+
+    # One entry per blob, in memory and on the disk, however many generations of the blob were read
+    assert len(cache._entries) == len(fake_bucket.list_blobs())
+    assert len(list(tmp_path.iterdir())) == len(fake_bucket.list_blobs())
+    _, latest_registry_entry = cache._entries[f"{fake_bucket.name}/{blob_name}"][1]
+    assert latest_registry_entry.dockerImageTag == "99.0.2"
+
+
+def test_unversioned_blobs_are_always_downloaded(oss_registry_dict):
+    bucket = FakeBucket()
+    registry_entry = oss_registry_dict["sources"][0]
+    bucket.upload("metadata/latest/oss.json", registry_entry, versioned=False)
+    cache = RegistryEntryBlobCache()
+
+    read_registry_entry_blobs(bucket.list_blobs(), cache=cache)
+    read_registry_entry_blobs(bucket.list_blobs(), cache=cache)
+
+    assert bucket.downloads == ["metadata/latest/oss.json", "metadata/latest/oss.json"]
+
+
+def test_get_registry_entries(fake_bucket, mocker):
+    mocker.patch("orchestrator.assets.registry_entry.registry_entry_blob_cache", RegistryEntryBlobCache())
+
+    output = get_registry_entries(fake_bucket.list_blobs())
+    get_registry_entries(fake_bucket.list_blobs())
+
+    assert [registry_entry.dockerImageTag for registry_entry in output.value] == [
+        json.loads(blob._content)["dockerImageTag"] for blob in fake_bucket.list_blobs()
+    ]
+    assert len(fake_bucket.downloads) == len(fake_bucket.list_blobs())
@@ -5,7 +5,7 @@
             _airbyte_active_row,
             generate_array(0, 1, 1)
         )
-  cluster by _airbyte_unique_key_scd, _airbyte_emitted_at
+  cluster by _airbyte_unique_key, _airbyte_unique_key_scd, _airbyte_emitted_at
   OPTIONS()
   as (
     
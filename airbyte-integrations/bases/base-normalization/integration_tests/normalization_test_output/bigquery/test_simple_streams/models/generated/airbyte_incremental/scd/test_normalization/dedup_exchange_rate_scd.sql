@@ -1,5 +1,5 @@
 {{ config(
-    cluster_by = ["_airbyte_unique_key_scd","_airbyte_emitted_at"],
+    cluster_by = ["_airbyte_unique_key","_airbyte_unique_key_scd","_airbyte_emitted_at"],
     partition_by = {"field": "_airbyte_active_row", "data_type": "int64", "range": {"start": 0, "end": 1, "interval": 1}},
     unique_key = "_airbyte_unique_key_scd",
     schema = "test_normalization",
@@ -1,5 +1,5 @@
 {{ config(
-    indexes = [{'columns':['_airbyte_active_row','_airbyte_unique_key_scd','_airbyte_emitted_at'],'type': 'btree'}],
+    indexes = [{'columns':['_airbyte_active_row','_airbyte_unique_key'],'type': 'btree'},{'columns':['_airbyte_unique_key_scd'],'type': 'btree'},{'columns':['_airbyte_emitted_at'],'type': 'btree'}],
     unique_key = "_airbyte_unique_key_scd",
     schema = "test_normalization",
     post_hook = ["
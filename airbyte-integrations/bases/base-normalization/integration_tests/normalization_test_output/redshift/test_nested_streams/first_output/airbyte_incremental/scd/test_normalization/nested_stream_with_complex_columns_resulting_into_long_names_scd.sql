@@ -5,7 +5,7 @@
     "integrationtests".test_normalization_xjvlg."nested_stream_with_complex_columns_resulting_into_long_names_scd"
     
     
-      compound sortkey(_airbyte_active_row,_airbyte_unique_key_scd,_airbyte_emitted_at)
+      compound sortkey(_airbyte_active_row,_airbyte_unique_key,_airbyte_emitted_at)
     
   as (
     
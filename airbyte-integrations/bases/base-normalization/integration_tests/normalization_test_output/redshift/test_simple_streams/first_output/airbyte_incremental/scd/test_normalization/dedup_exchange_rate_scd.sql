@@ -5,7 +5,7 @@
     "integrationtests".test_normalization_bhhpj."dedup_exchange_rate_scd"
     
     
-      compound sortkey(_airbyte_active_row,_airbyte_unique_key_scd,_airbyte_emitted_at)
+      compound sortkey(_airbyte_active_row,_airbyte_unique_key,_airbyte_emitted_at)
     
   as (
     
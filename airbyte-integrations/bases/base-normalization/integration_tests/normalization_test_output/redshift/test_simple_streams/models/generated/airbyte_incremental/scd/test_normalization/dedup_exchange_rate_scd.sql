@@ -1,5 +1,5 @@
 {{ config(
-    sort = ["_airbyte_active_row", "_airbyte_unique_key_scd", "_airbyte_emitted_at"],
+    sort = ["_airbyte_active_row", "_airbyte_unique_key", "_airbyte_emitted_at"],
     unique_key = "_airbyte_unique_key_scd",
     schema = "test_normalization_bhhpj",
     post_hook = ["
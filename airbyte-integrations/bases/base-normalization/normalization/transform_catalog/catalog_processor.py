@@ -6,16 +6,21 @@
 import json
 import os
 import re
-from typing import Any, Dict, List, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import yaml
 from airbyte_cdk.models.airbyte_protocol import DestinationSyncMode, SyncMode  # type: ignore
 from normalization.destination_type import DestinationType
 from normalization.transform_catalog import dbt_macro
 from normalization.transform_catalog.destination_name_transformer import DestinationNameTransformer
+from normalization.transform_catalog.model_cache import ModelCache
 from normalization.transform_catalog.stream_processor import StreamProcessor
 from normalization.transform_catalog.table_name_registry import TableNameRegistry
 
+# number of threads used to write the generated models to the output directory
+MAX_WRITE_WORKERS = 8
+
 
 class CatalogProcessor:
     """
@@ -28,21 +33,27 @@ class CatalogProcessor:
     This is relying on a StreamProcessor to handle the conversion of a stream to a table one at a time.
     """
 
-    def __init__(self, output_directory: str, destination_type: DestinationType):
+    def __init__(self, output_directory: str, destination_type: DestinationType, cache_directory: Optional[str] = None):
         """
         @param output_directory is the path to the directory where this processor should write the resulting SQL files (DBT models)
         @param destination_type is the destination type of warehouse
+        @param cache_directory is the optional path to a directory persisted across runs, where generated models are cached
+        so that only the streams that changed since the previous run are regenerated
         """
         self.output_directory: str = output_directory
         self.destination_type: DestinationType = destination_type
         self.name_transformer: DestinationNameTransformer = DestinationNameTransformer(destination_type)
         self.models_to_source: Dict[str, str] = {}
+        self.model_cache: Optional[ModelCache] = ModelCache(cache_directory) if cache_directory else None
 
     def process(self, catalog_file: str, json_column_name: str, default_schema: str):
         """
         This method first parse and build models to handle top-level streams.
         In a second loop will go over the substreams that were nested in a breadth-first traversal manner.
 
+        When a cache directory is configured, the models of a top-level stream and its substreams are reused from the
+        cache instead, as long as the stream's catalog entry and its resolved table names did not change.
+
         @param catalog_file input AirbyteCatalog file in JSON Schema describing the structure of the raw data
         @param json_column_name is the column name containing the JSON Blob with the raw data
         @param default_schema is the final schema where to output the final transformed data to
@@ -51,7 +62,6 @@ class CatalogProcessor:
         schema_to_source_tables: Dict[str, Set[str]] = {}
         catalog = read_json(catalog_file)
         # print(json.dumps(catalog, separators=(",", ":")))
-        substreams = []
         stream_processors = self.build_stream_processor(
             catalog=catalog,
             json_column_name=json_column_name,
@@ -67,7 +77,8 @@ class CatalogProcessor:
                 f"WARN: Resolving conflict: {conflict.schema}.{conflict.table_name_conflict} "
                 f"from '{'.'.join(conflict.json_path)}' into {conflict.table_name_resolved}"
             )
-        for stream_processor in stream_processors:
+        sql_outputs: Dict[str, str] = {}
+        for configured_stream, stream_processor in zip(catalog["streams"], stream_processors):
             # MySQL table names need to be manually truncated, because it does not do it automatically
             truncate = (
                 self.destination_type == DestinationType.MYSQL
@@ -77,15 +88,46 @@ class CatalogProcessor:
             raw_table_name = self.name_transformer.normalize_table_name(f"_airbyte_raw_{stream_processor.stream_name}", truncate=truncate)
             add_table_to_sources(schema_to_source_tables, stream_processor.schema, raw_table_name)
 
-            nested_processors = stream_processor.process()
-            self.models_to_source.update(stream_processor.models_to_source)
-
-            if nested_processors and len(nested_processors) > 0:
-                substreams += nested_processors
-            for file in stream_processor.sql_outputs:
-                output_sql_file(os.path.join(self.output_directory, file), stream_processor.sql_outputs[file])
+            cache_key = None
+            if self.model_cache:
+                cache_key = self.model_cache.get_key(
+                    configured_stream,
+                    self.destination_type.value,
+                    json_column_name,
+                    default_schema,
+                    tables_registry.get_stream_resolved_names(stream_processor.schema, stream_processor.stream_name),
+                )
+                cached_models = self.model_cache.get(cache_key)
+                if cached_models is not None:
+                    print(f"  Reusing cached models for stream '{stream_processor.stream_name}'")
+                    self.models_to_source.update(cached_models["models_to_source"])
+                    sql_outputs.update(cached_models["sql_outputs"])
+                    continue
+
+            models_to_source, stream_sql_outputs = self.process_stream(stream_processor, tables_registry)
+            self.models_to_source.update(models_to_source)
+            sql_outputs.update(stream_sql_outputs)
+            if self.model_cache:
+                self.model_cache.put(cache_key, {"models_to_source": models_to_source, "sql_outputs": stream_sql_outputs})
         self.write_yaml_sources_file(schema_to_source_tables)
-        self.process_substreams(substreams, tables_registry)
+        self.write_sql_files(sql_outputs)
+
+    def process_stream(
+        self, stream_processor: StreamProcessor, tables_registry: TableNameRegistry
+    ) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Generate the models of a top-level stream and of all its nested substreams.
+        @return the models_to_source and sql_outputs collected from all the processors of the stream
+        """
+        models_to_source: Dict[str, str] = {}
+        sql_outputs: Dict[str, str] = {}
+        substreams = stream_processor.process()
+        models_to_source.update(stream_processor.models_to_source)
+        sql_outputs.update(stream_processor.sql_outputs)
+        for substream in self.process_substreams(substreams, tables_registry):
+            models_to_source.update(substream.models_to_source)
+            sql_outputs.update(substream.sql_outputs)
+        return models_to_source, sql_outputs
 
     @staticmethod
     def build_stream_processor(
@@ -165,21 +207,36 @@ class CatalogProcessor:
             result.append(stream_processor)
         return result
 
-    def process_substreams(self, substreams: List[StreamProcessor], tables_registry: TableNameRegistry):
+    @staticmethod
+    def process_substreams(substreams: List[StreamProcessor], tables_registry: TableNameRegistry) -> List[StreamProcessor]:
         """
         Handle nested stream/substream/children
+        @return the list of all processed substreams, in a breadth-first traversal order
         """
+        processed = []
         while substreams:
             children = substreams
             substreams = []
             for substream in children:
                 substream.tables_registry = tables_registry
                 nested_processors = substream.process()
-                self.models_to_source.update(substream.models_to_source)
+                processed.append(substream)
                 if nested_processors:
                     substreams += nested_processors
-                for file in substream.sql_outputs:
-                    output_sql_file(os.path.join(self.output_directory, file), substream.sql_outputs[file])
+        return processed
+
+    def write_sql_files(self, sql_outputs: Dict[str, str]):
+        """
+        Write the generated models to the output directory. Files are independent from each other, so they are
+        written concurrently.
+        """
+        with ThreadPoolExecutor(max_workers=MAX_WRITE_WORKERS) as executor:
+            futures = [
+                executor.submit(output_sql_file, os.path.join(self.output_directory, file), sql_outputs[file]) for file in sql_outputs
+            ]
+            for future in futures:
+                # propagate any error raised while writing
+                future.result()
 
     def write_yaml_sources_file(self, schema_to_source_tables: Dict[str, Set[str]]):
         """
@@ -290,8 +347,8 @@ def output_sql_file(file: str, sql: str):
     @param sql is the dbt sql content to be written in the generated model file
     """
     output_dir = os.path.dirname(file)
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    # files of the same directory may be written concurrently
+    os.makedirs(output_dir, exist_ok=True)
     with open(file, "w") as f:
         for line in sql.splitlines():
             if line.strip():
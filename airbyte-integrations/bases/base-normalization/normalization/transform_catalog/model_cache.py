@@ -0,0 +1,82 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional
+
+import normalization
+
+
+def generator_version() -> str:
+    """
+    Fingerprint of the normalization code generating the dbt models.
+
+    Any change to the python sources of the normalization package (templates included, since they live in there)
+    produces a new fingerprint, so models cached by a previous version are never reused.
+    """
+    h = hashlib.sha256()
+    package_dir = os.path.dirname(normalization.__file__)
+    for root, dirs, files in os.walk(package_dir):
+        dirs.sort()
+        for file in sorted(files):
+            if file.endswith(".py"):
+                h.update(os.path.relpath(os.path.join(root, file), package_dir).encode("utf-8"))
+                with open(os.path.join(root, file), "rb") as f:
+                    h.update(f.read())
+    return h.hexdigest()
+
+
+class ModelCache:
+    """
+    A cache of the dbt models generated for a top-level stream (and all of its nested streams).
+
+    Entries are stored as json files in the cache directory, named after a hash of everything the generated
+    SQL depends on, so a stream whose catalog entry, resolved table names, destination type or generator version
+    did not change between two runs can reuse the models generated by the previous run.
+    """
+
+    def __init__(self, cache_directory: str):
+        """
+        @param cache_directory is the path to the directory where the cache entries are persisted across runs
+        """
+        self.cache_directory: str = cache_directory
+        self.version: str = generator_version()
+
+    def get_key(self, *parts: Any) -> str:
+        """
+        Build the key of a cache entry from json serializable parts
+        """
+        h = hashlib.sha256()
+        h.update(self.version.encode("utf-8"))
+        h.update(json.dumps(parts, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+        return h.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the cache entry stored under key, or None when missing or unreadable
+        """
+        try:
+            with open(self.get_entry_path(key), "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, entry: Dict[str, Any]):
+        """
+        Store the cache entry under key. The entry is written to a temporary file first and then moved in place,
+        so an interrupted run never leaves a truncated entry behind.
+        """
+        if not os.path.exists(self.cache_directory):
+            os.makedirs(self.cache_directory)
+        entry_path = self.get_entry_path(key)
+        tmp_path = f"{entry_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, entry_path)
+
+    def get_entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_directory, f"{key}.json")
@@ -1356,7 +1356,9 @@ where 1 = 1
         In general, we need to do lookups on the last emitted_at column to know if a record is freshly produced and need to be
         incrementally processed or not.
         But in certain models, such as SCD tables for example, we also need to retrieve older data to update their type 2 SCD end_dates,
-        thus a different partitioning scheme is used to optimize that use case.
+        thus a different partitioning scheme is used to optimize that use case: incremental SCD models only read the active rows
+        of the primary keys found in the new batch, so SCD tables are organized by _airbyte_active_row first and by
+        _airbyte_unique_key next, letting that lookup skip the history of every other key.
         """
         config = {}
         if self.destination_type == DestinationType.BIGQUERY:
@@ -1364,7 +1366,7 @@ where 1 = 1
             if partition_by == PartitionScheme.UNIQUE_KEY:
                 config["cluster_by"] = f'["{self.airbyte_unique_key}","{self.airbyte_emitted_at}"]'
             elif partition_by == PartitionScheme.ACTIVE_ROW:
-                config["cluster_by"] = f'["{self.airbyte_unique_key}_scd","{self.airbyte_emitted_at}"]'
+                config["cluster_by"] = f'["{self.airbyte_unique_key}","{self.airbyte_unique_key}_scd","{self.airbyte_emitted_at}"]'
             else:
                 config["cluster_by"] = f'"{self.airbyte_emitted_at}"'
             if partition_by == PartitionScheme.ACTIVE_ROW:
@@ -1378,10 +1380,13 @@ where 1 = 1
         elif self.destination_type == DestinationType.POSTGRES:
             # see https://docs.getdbt.com/reference/resource-configs/postgres-configs
             if partition_by == PartitionScheme.ACTIVE_ROW:
+                # the unique_key_scd index serves the delete+insert of incremental updates
                 config["indexes"] = (
                     "[{'columns':['_airbyte_active_row','"
                     + self.airbyte_unique_key
-                    + "_scd','"
+                    + "'],'type': 'btree'},{'columns':['"
+                    + self.airbyte_unique_key
+                    + "_scd'],'type': 'btree'},{'columns':['"
                     + self.airbyte_emitted_at
                     + "'],'type': 'btree'}]"
                 )
@@ -1392,7 +1397,7 @@ where 1 = 1
         elif self.destination_type == DestinationType.REDSHIFT:
             # see https://docs.getdbt.com/reference/resource-configs/redshift-configs
             if partition_by == PartitionScheme.ACTIVE_ROW:
-                config["sort"] = f'["_airbyte_active_row", "{self.airbyte_unique_key}_scd", "{self.airbyte_emitted_at}"]'
+                config["sort"] = f'["_airbyte_active_row", "{self.airbyte_unique_key}", "{self.airbyte_emitted_at}"]'
             elif partition_by == PartitionScheme.UNIQUE_KEY:
                 config["sort"] = f'["{self.airbyte_unique_key}", "{self.airbyte_emitted_at}"]'
             elif partition_by == PartitionScheme.NOTHING:
@@ -1404,7 +1409,7 @@ where 1 = 1
             if partition_by == PartitionScheme.ACTIVE_ROW:
                 config[
                     "cluster_by"
-                ] = f'["_AIRBYTE_ACTIVE_ROW", "{self.airbyte_unique_key.upper()}_SCD", "{self.airbyte_emitted_at.upper()}"]'
+                ] = f'["_AIRBYTE_ACTIVE_ROW", "{self.airbyte_unique_key.upper()}", "{self.airbyte_emitted_at.upper()}"]'
             elif partition_by == PartitionScheme.UNIQUE_KEY:
                 config["cluster_by"] = f'["{self.airbyte_unique_key.upper()}", "{self.airbyte_emitted_at.upper()}"]'
             elif partition_by == PartitionScheme.NOTHING:
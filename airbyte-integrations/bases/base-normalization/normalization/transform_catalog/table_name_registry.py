@@ -315,6 +315,23 @@ class TableNameRegistry:
 
         return self.name_transformer.normalize_table_name(f"{file_name}{norm_suffix}", False, truncate, conflict, conflict_solver)
 
+    def get_stream_resolved_names(self, schema: str, stream_name: str) -> Dict[str, List[str]]:
+        """
+        Return the resolved names used by a top level stream and all of its nested streams, indexed by registry key.
+
+        Names are resolved against the whole catalog, so these can change even if the stream itself did not.
+        """
+        schema = self.name_transformer.normalize_schema_name(schema, False, False)
+        result = {}
+        for values in self.simple_table_registry.values():
+            for value in values:
+                if value.schema == schema and value.json_path[0] == stream_name:
+                    for key_schema in [value.intermediate_schema, value.schema]:
+                        key = self.get_registry_key(key_schema, value.json_path, value.stream_name)
+                        resolved = self.registry[key]
+                        result[key] = [resolved.schema, resolved.table_name, resolved.file_name]
+        return result
+
     def to_dict(self, apply_function=(lambda x: x)) -> Dict:
         """
         Converts to a pure dict to serialize as json
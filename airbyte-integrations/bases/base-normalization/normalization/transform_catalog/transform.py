@@ -21,7 +21,8 @@ python3 main_dev_transform_catalog.py \
   --profile-config-dir . \
   --catalog integration_tests/catalog.json \
   --out dir \
-  --json-column json_blob
+  --json-column json_blob \
+  --cache-dir cache
 ```
     """
 
@@ -42,6 +43,9 @@ python3 main_dev_transform_catalog.py \
         parser.add_argument("--catalog", nargs="+", type=str, required=True, help="path to Catalog (JSON Schema) file")
         parser.add_argument("--out", type=str, required=True, help="path to output generated DBT Models to")
         parser.add_argument("--json-column", type=str, required=False, help="name of the column containing the json blob")
+        parser.add_argument(
+            "--cache-dir", type=str, required=False, help="path to a directory persisted across runs to cache generated DBT Models into"
+        )
         parsed_args = parser.parse_args(args)
         profiles_yml = read_profiles_yml(parsed_args.profile_config_dir)
         self.config = {
@@ -51,6 +55,7 @@ python3 main_dev_transform_catalog.py \
             "output_path": parsed_args.out,
             "json_column": parsed_args.json_column,
             "profile_config_dir": parsed_args.profile_config_dir,
+            "cache_dir": parsed_args.cache_dir,
         }
 
     def process_catalog(self) -> None:
@@ -58,7 +63,9 @@ python3 main_dev_transform_catalog.py \
         schema = self.config["schema"]
         output = self.config["output_path"]
         json_col = self.config["json_column"]
-        processor = CatalogProcessor(output_directory=output, destination_type=destination_type)
+        processor = CatalogProcessor(
+            output_directory=output, destination_type=destination_type, cache_directory=self.config.get("cache_dir")
+        )
         for catalog_file in self.config["catalog"]:
             print(f"Processing {catalog_file}...")
             processor.process(catalog_file=catalog_file, json_column_name=json_col, default_schema=schema)
@@ -0,0 +1,74 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+
+import json
+import os
+from typing import Dict
+from unittest.mock import patch
+
+import pytest
+from normalization.destination_type import DestinationType
+from normalization.transform_catalog.catalog_processor import CatalogProcessor
+from normalization.transform_catalog.stream_processor import StreamProcessor
+
+
+@pytest.fixture(scope="function", autouse=True)
+def before_tests(request):
+    # This makes the test run whether it is executed from the tests folder (with pytest/gradle)
+    # or from the base-normalization folder (through pycharm)
+    unit_tests_dir = os.path.join(request.fspath.dirname, "unit_tests")
+    if os.path.exists(unit_tests_dir):
+        os.chdir(unit_tests_dir)
+    else:
+        os.chdir(request.fspath.dirname)
+    yield
+    os.chdir(request.config.invocation_dir)
+
+
+def run_catalog_processor(catalog_file: str, output_directory: str, cache_directory: str = None) -> Dict[str, str]:
+    processor = CatalogProcessor(output_directory, DestinationType.POSTGRES, cache_directory=cache_directory)
+    processor.process(catalog_file, "_airbyte_data", "schema_test")
+    outputs = {}
+    for root, _, files in os.walk(output_directory):
+        for file in files:
+            with open(os.path.join(root, file), "r") as f:
+                outputs[os.path.relpath(os.path.join(root, file), output_directory)] = f.read()
+    return outputs
+
+
+@pytest.mark.parametrize("catalog_file", ["nested_catalog", "un-nesting_collisions_catalog", "long_name_truncate_collisions_catalog"])
+def test_cached_models_match_generated_models(tmp_path, catalog_file: str):
+    catalog = f"resources/{catalog_file}.json"
+    expected = run_catalog_processor(catalog, str(tmp_path / "no_cache"))
+
+    assert run_catalog_processor(catalog, str(tmp_path / "first_run"), str(tmp_path / "cache")) == expected
+    with patch.object(StreamProcessor, "process", side_effect=AssertionError("models should be read from the cache")):
+        assert run_catalog_processor(catalog, str(tmp_path / "second_run"), str(tmp_path / "cache")) == expected
+
+
+def test_only_changed_streams_are_regenerated(tmp_path):
+    catalog_path = str(tmp_path / "catalog.json")
+    with open("resources/un-nesting_collisions_catalog.json", "r") as f:
+        catalog = json.load(f)
+    with open(catalog_path, "w") as f:
+        json.dump(catalog, f)
+    run_catalog_processor(catalog_path, str(tmp_path / "first_run"), str(tmp_path / "cache"))
+
+    catalog["streams"][1]["stream"]["json_schema"]["properties"]["new_column"] = {"type": ["null", "string"]}
+    with open(catalog_path, "w") as f:
+        json.dump(catalog, f)
+    process = StreamProcessor.process
+    processed_streams = []
+
+    def record_process(stream_processor: StreamProcessor):
+        processed_streams.append(stream_processor.json_path)
+        return process(stream_processor)
+
+    with patch.object(StreamProcessor, "process", autospec=True, side_effect=record_process):
+        outputs = run_catalog_processor(catalog_path, str(tmp_path / "second_run"), str(tmp_path / "cache"))
+
+    # only the changed stream and its nested streams are processed again
+    assert processed_streams == [["simple"], ["simple", "stream_name"]]
+    assert outputs == run_catalog_processor(catalog_path, str(tmp_path / "no_cache"))
@@ -9,7 +9,7 @@ from typing import List
 import pytest
 from airbyte_cdk.models import DestinationSyncMode, SyncMode
 from normalization.destination_type import DestinationType
-from normalization.transform_catalog.stream_processor import StreamProcessor
+from normalization.transform_catalog.stream_processor import PartitionScheme, StreamProcessor
 from normalization.transform_catalog.table_name_registry import TableNameRegistry
 
 
@@ -103,3 +103,46 @@ def test_primary_key(
     except ValueError as e:
         if not expecting_exception:
             raise e
+
+
+@pytest.mark.parametrize(
+    "destination_type, expected_config",
+    [
+        (
+            DestinationType.BIGQUERY,
+            {
+                "cluster_by": '["_airbyte_unique_key","_airbyte_unique_key_scd","_airbyte_emitted_at"]',
+                "partition_by": '{"field": "_airbyte_active_row", "data_type": "int64", "range": {"start": 0, "end": 1, "interval": 1}}',
+            },
+        ),
+        (
+            DestinationType.POSTGRES,
+            {
+                "indexes": "[{'columns':['_airbyte_active_row','_airbyte_unique_key'],'type': 'btree'},"
+                "{'columns':['_airbyte_unique_key_scd'],'type': 'btree'},{'columns':['_airbyte_emitted_at'],'type': 'btree'}]"
+            },
+        ),
+        (DestinationType.REDSHIFT, {"sort": '["_airbyte_active_row", "_airbyte_unique_key", "_airbyte_emitted_at"]'}),
+        (DestinationType.SNOWFLAKE, {"cluster_by": '["_AIRBYTE_ACTIVE_ROW", "_AIRBYTE_UNIQUE_KEY", "_AIRBYTE_EMITTED_AT"]'}),
+        (DestinationType.MYSQL, {}),
+    ],
+)
+def test_scd_partition_config(destination_type: DestinationType, expected_config: dict):
+    # SCD tables are organized around the lookup of the active rows of the primary keys found in the new batch
+    stream_processor = StreamProcessor.create(
+        stream_name="test_scd_partition_config",
+        destination_type=destination_type,
+        raw_schema="raw_schema",
+        default_schema="default_schema",
+        schema="schema_name",
+        source_sync_mode=SyncMode.incremental,
+        destination_sync_mode=DestinationSyncMode.append_dedup,
+        cursor_field=[],
+        primary_key=[["id"]],
+        json_column_name="json_column_name",
+        properties={"id": {"type": "string"}},
+        tables_registry=TableNameRegistry(destination_type),
+        from_table="",
+    )
+    config = stream_processor.get_model_partition_config(PartitionScheme.ACTIVE_ROW, "_airbyte_unique_key_scd")
+    assert config == {**expected_config, "unique_key": '"_airbyte_unique_key_scd"'}
@@ -54,6 +54,7 @@ from connector_acceptance_test.config import (
 from connector_acceptance_test.utils import ConnectorRunner, SecretDict, filter_output, make_hashable, verify_records_schema
 from connector_acceptance_test.utils.backward_compatibility import CatalogDiffChecker, SpecDiffChecker, validate_previous_configs
 from connector_acceptance_test.utils.common import (
+    batched,
     build_configured_catalog_from_custom_catalog,
     build_configured_catalog_from_discovered_catalog_and_empty_streams,
     find_all_values_for_key_in_schema,
@@ -943,29 +944,32 @@ class TestBasicRead(BaseTest):
         if streams_errors:
             pytest.fail(f"Please check your json_schema in selected streams {tuple(streams_errors.keys())}.")
 
-    def _validate_empty_streams(self, records, configured_catalog, allowed_empty_streams):
+    def _validate_empty_streams(self, streams_with_records: Iterable[str], configured_catalog, allowed_empty_streams):
         """
         Only certain streams allowed to be empty
         """
         allowed_empty_stream_names = set([allowed_empty_stream.name for allowed_empty_stream in allowed_empty_streams])
-        counter = Counter(record.stream for record in records)
 
         all_streams = set(stream.stream.name for stream in configured_catalog.streams)
-        streams_with_records = set(counter.keys())
-        streams_without_records = all_streams - streams_with_records
+        streams_without_records = all_streams - set(streams_with_records)
 
         streams_without_records = streams_without_records - allowed_empty_stream_names
         assert not streams_without_records, f"All streams should return some records, streams without records: {streams_without_records}"
 
-    def _validate_field_appears_at_least_once_in_stream(self, records: List, schema: Dict):
+    @staticmethod
+    def _get_expected_field_paths(schema: Dict) -> Set[str]:
+        expected_paths = get_expected_schema_structure(schema, annotate_one_of=True)
+        return set(flatten_tuples(tuple(expected_paths)))
+
+    @staticmethod
+    def _remove_field_paths_present_in_records(expected_paths: Set[str], records: Iterable[Mapping]) -> Set[str]:
         """
-        Get all possible schema paths, then diff with existing record paths.
+        Remove the paths present in records from the expected paths.
         In case of `oneOf` or `anyOf` schema props, compare only choice which is present in records.
         """
-        expected_paths = get_expected_schema_structure(schema, annotate_one_of=True)
-        expected_paths = set(flatten_tuples(tuple(expected_paths)))
-
         for record in records:
+            if not expected_paths:
+                break
             record_paths = set(get_object_structure(record))
             paths_to_remove = {path for path in expected_paths if re.sub(r"\([0-9]*\)", "", path) in record_paths}
             for path in paths_to_remove:
@@ -974,7 +978,14 @@ class TestBasicRead(BaseTest):
                     expected_paths -= {path for path in expected_paths if path_parts[0] in path}
             expected_paths -= paths_to_remove
 
-        return sorted(list(expected_paths))
+        return expected_paths
+
+    def _validate_field_appears_at_least_once_in_stream(self, records: List, schema: Dict):
+        """
+        Get all possible schema paths, then diff with existing record paths.
+        """
+        expected_paths = self._get_expected_field_paths(schema)
+        return sorted(list(self._remove_field_paths_present_in_records(expected_paths, records)))
 
     def _validate_field_appears_at_least_once(self, records: List[AirbyteRecordMessage], configured_catalog: ConfiguredAirbyteCatalog):
         """
@@ -991,6 +1002,10 @@ class TestBasicRead(BaseTest):
             if empty_field_paths:
                 stream_name_to_empty_fields_mapping[stream.stream.name] = empty_field_paths
 
+        self._assert_no_empty_fields(stream_name_to_empty_fields_mapping)
+
+    @staticmethod
+    def _assert_no_empty_fields(stream_name_to_empty_fields_mapping: Mapping[str, List[str]]):
         msg = "Following streams has records with fields, that are either null or not present in each output record:\n"
         for stream_name, fields in stream_name_to_empty_fields_mapping.items():
             msg += f"`{stream_name}` stream has `{fields}` empty fields\n"
@@ -1090,6 +1105,9 @@ class TestBasicRead(BaseTest):
 
     _file_types: Set[str] = set()
 
+    # Number of messages validated at once while consuming the output of the read command
+    READ_BATCH_SIZE = 1000
+
     async def test_read(
         self,
         connector_config: SecretDict,
@@ -1110,29 +1128,65 @@ class TestBasicRead(BaseTest):
     ):
         output = await docker_runner.call_read(connector_config, configured_catalog)
 
-        records = [message.record for message in filter_output(output, Type.RECORD)]
-        state_messages = [message for message in filter_output(output, Type.STATE)]
+        # The output is consumed in a single pass, batch by batch: only the records compared to expected records,
+        # the state and the stream status messages are retained until the end of the read.
+        record_count_per_stream = Counter()
+        state_messages = []
+        all_statuses = []
+        records_with_expectations = []
+        missing_field_paths_per_stream = (
+            {stream.stream.name: self._get_expected_field_paths(stream.stream.json_schema) for stream in configured_catalog.streams}
+            if should_validate_data_points
+            else {}
+        )
+        for messages in batched(output, self.READ_BATCH_SIZE):
+            records = [message.record for message in messages if message.type == Type.RECORD]
+            state_messages.extend(message for message in messages if message.type == Type.STATE)
+            if should_validate_stream_statuses:
+                all_statuses.extend(
+                    message.trace.stream_status
+                    for message in messages
+                    if message.type == Type.TRACE and message.trace.type == TraceType.STREAM_STATUS
+                )
+            if not records:
+                continue
 
-        if certified_file_based_connector:
-            self._file_types.update(self._get_actual_file_types(records))
+            record_count_per_stream.update(record.stream for record in records)
 
-        assert records, "At least one record should be read using provided catalog"
+            if certified_file_based_connector:
+                self._file_types.update(self._get_actual_file_types(records))
 
-        if should_validate_schema:
-            self._validate_schema(records=records, configured_catalog=configured_catalog)
+            if should_validate_schema:
+                self._validate_schema(records=records, configured_catalog=configured_catalog)
 
-        self._validate_empty_streams(records=records, configured_catalog=configured_catalog, allowed_empty_streams=empty_streams)
+            if should_validate_primary_keys_data_type:
+                self._validate_primary_keys_data_type(streams=configured_catalog.streams, records=records)
 
-        if should_validate_primary_keys_data_type:
-            self._validate_primary_keys_data_type(streams=configured_catalog.streams, records=records)
+            # TODO: remove this condition after https://github.com/airbytehq/airbyte/issues/8312 is done
+            if should_validate_data_points:
+                for stream_name, stream_records in self.group_by_stream(records).items():
+                    if stream_name in missing_field_paths_per_stream:
+                        missing_field_paths_per_stream[stream_name] = self._remove_field_paths_present_in_records(
+                            missing_field_paths_per_stream[stream_name], stream_records
+                        )
+
+            if expected_records_by_stream:
+                records_with_expectations.extend(record for record in records if record.stream in expected_records_by_stream)
+
+        assert record_count_per_stream, "At least one record should be read using provided catalog"
+
+        self._validate_empty_streams(
+            streams_with_records=record_count_per_stream.keys(), configured_catalog=configured_catalog, allowed_empty_streams=empty_streams
+        )
 
-        # TODO: remove this condition after https://github.com/airbytehq/airbyte/issues/8312 is done
         if should_validate_data_points:
-            self._validate_field_appears_at_least_once(records=records, configured_catalog=configured_catalog)
+            self._assert_no_empty_fields(
+                {stream_name: sorted(list(paths)) for stream_name, paths in missing_field_paths_per_stream.items() if paths}
+            )
 
         if expected_records_by_stream:
             self._validate_expected_records(
-                records=records,
+                records=records_with_expectations,
                 expected_records_by_stream=expected_records_by_stream,
                 flags=expect_records_config,
                 ignored_fields=ignored_fields,
@@ -1141,11 +1195,6 @@ class TestBasicRead(BaseTest):
             )
 
         if should_validate_stream_statuses:
-            all_statuses = [
-                message.trace.stream_status
-                for message in filter_output(output, Type.TRACE)
-                if message.trace.type == TraceType.STREAM_STATUS
-            ]
             self._validate_stream_statuses(configured_catalog=configured_catalog, statuses=all_statuses)
 
         if should_validate_state_messages:
@@ -3,12 +3,15 @@
 #
 
 import copy
+import functools
+import json
 import logging
 import re
 from collections import defaultdict
-from typing import Any, Dict, List, Mapping
+from typing import Any, Callable, Dict, List, Mapping, Optional
 
 import pendulum
+from connector_acceptance_test.utils.schema_compiler import UnsupportedSchemaError, compile_schema
 from jsonschema import Draft7Validator, FormatChecker, FormatError, ValidationError, validators
 
 from airbyte_protocol.models import AirbyteRecordMessage, ConfiguredAirbyteCatalog
@@ -81,20 +84,50 @@ class CustomFormatChecker(FormatChecker):
             return super().check(instance, format)
 
 
+class StreamValidator:
+    """Validate the records of a stream against its schema.
+
+    The schema is compiled into a function which only tells whether a record is valid, so valid records are checked without
+    collecting errors. The full Draft 7 validator is only run on the records failing this check, to report detailed errors.
+    Schemas the compiler does not support are always validated by the Draft 7 validator.
+    """
+
+    def __init__(self, schema: Dict[str, Any]):
+        format_checker = CustomFormatChecker()
+        # We will be disabling strict `NoAdditionalPropertiesValidator` until we have a better plan for schema validation. The consequence
+        # is that we will lack visibility on new fields that are not added on the root level (root level is validated by Datadog)
+        #   validator = NoAdditionalPropertiesValidator if fail_on_extra_columns else Draft7ValidatorWithStrictInteger
+        self.validator = Draft7ValidatorWithStrictInteger(schema, format_checker=format_checker)
+        try:
+            self.is_valid: Optional[Callable[[Any], bool]] = compile_schema(schema, format_checker)
+        except UnsupportedSchemaError as exc:
+            logging.debug(f"Schema can't be compiled, records will be validated with the Draft 7 validator: {exc}")
+            self.is_valid = None
+
+    def iter_errors(self, data: Any):
+        if self.is_valid is not None and self.is_valid(data):
+            return iter(())
+        return self.validator.iter_errors(data)
+
+
+@functools.lru_cache(maxsize=256)
+def _get_stream_validator(serialized_schema: str) -> StreamValidator:
+    return StreamValidator(json.loads(serialized_schema))
+
+
+def get_stream_validator(schema: Dict[str, Any]) -> StreamValidator:
+    """Get the validator of a stream schema, validators are cached as records of a stream are usually verified in several batches."""
+    # Keys are not sorted: the order of the properties is the order in which errors are reported
+    return _get_stream_validator(json.dumps(schema))
+
+
 def verify_records_schema(
     records: List[AirbyteRecordMessage], catalog: ConfiguredAirbyteCatalog
 ) -> Mapping[str, Mapping[str, ValidationError]]:
     """Check records against their schemas from the catalog, yield error messages.
     Only first record with error will be yielded for each stream.
     """
-    stream_validators = {}
-    for stream in catalog.streams:
-        schema_to_validate_against = stream.stream.json_schema
-        # We will be disabling strict `NoAdditionalPropertiesValidator` until we have a better plan for schema validation. The consequence
-        # is that we will lack visibility on new fields that are not added on the root level (root level is validated by Datadog)
-        #   validator = NoAdditionalPropertiesValidator if fail_on_extra_columns else Draft7ValidatorWithStrictInteger
-        validator = Draft7ValidatorWithStrictInteger
-        stream_validators[stream.stream.name] = validator(schema_to_validate_against, format_checker=CustomFormatChecker())
+    stream_validators = {stream.stream.name: get_stream_validator(stream.stream.json_schema) for stream in catalog.streams}
     stream_errors = defaultdict(dict)
     for record in records:
         validator = stream_validators.get(record.stream)
@@ -102,8 +135,7 @@ def verify_records_schema(
             logging.error(f"Received record from the `{record.stream}` stream, which is not in the catalog.")
             continue
 
-        errors = list(validator.iter_errors(record.data))
-        for error in errors:
+        for error in validator.iter_errors(record.data):
             stream_errors[record.stream][str(error.schema_path)] = error
 
     return stream_errors
@@ -68,6 +68,18 @@ def filter_output(records: Iterable[AirbyteMessage], type_) -> List[AirbyteMessa
     return list(filter(lambda x: x.type == type_, records))
 
 
+def batched(iterable: Iterable, size: int) -> Iterable[List]:
+    """Split an iterable into lists of at most size items, without loading the whole iterable in memory"""
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
 class SecretDict(UserDict):
     def __str__(self) -> str:
         return f"{self.__class__.__name__}(******)"
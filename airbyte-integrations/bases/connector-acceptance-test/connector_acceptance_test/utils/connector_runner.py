@@ -8,13 +8,13 @@ import json
 import logging
 import os
 import uuid
+import weakref
 from pathlib import Path
-from typing import Any, List, Mapping, Optional, Union
+from typing import Any, Iterable, Iterator, List, Mapping, Optional, Union
 
 import dagger
 import docker
 import pytest
-from anyio import Path as AnyioPath
 from pydantic import ValidationError
 
 from airbyte_protocol.models import AirbyteMessage, ConfiguredAirbyteCatalog, OrchestratorType
@@ -28,6 +28,35 @@ def splitlines_generator(input_string: str):
             yield line.rstrip("\n")
 
 
+def parse_airbyte_messages(lines: Iterable[str], log_invalid_lines: bool = True) -> Iterator[AirbyteMessage]:
+    for line in lines:
+        try:
+            yield AirbyteMessage.parse_raw(line)
+        except ValidationError as exc:
+            if log_invalid_lines:
+                logging.warning("Unable to parse connector's output %s, error: %s", line, exc)
+
+
+class ConnectorOutput(Iterable[AirbyteMessage]):
+    """The messages emitted by a connector command.
+
+    Messages are parsed lazily from the command output file each time the output is iterated over, so the whole output is never
+    held in memory. The output file is deleted once this object is garbage collected.
+    """
+
+    def __init__(self, output_file_path: Path):
+        self.output_file_path = output_file_path
+        self._has_been_iterated = False
+        weakref.finalize(self, output_file_path.unlink, missing_ok=True)
+
+    def __iter__(self) -> Iterator[AirbyteMessage]:
+        # Invalid lines are only reported on the first pass over the output
+        log_invalid_lines = not self._has_been_iterated
+        self._has_been_iterated = True
+        with open(self.output_file_path) as output_file:
+            yield from parse_airbyte_messages((line.rstrip("\n") for line in output_file), log_invalid_lines=log_invalid_lines)
+
+
 async def get_container_from_id(dagger_client: dagger.Client, container_id: str) -> dagger.Container:
     """Get a dagger container from its id.
     Please remind that container id are not persistent and can change between Dagger sessions.
@@ -164,17 +193,17 @@ class ConnectorRunner:
             container = container.with_env_variable(k, str(v))
         return container
 
-    async def call_spec(self, raise_container_error=False) -> List[AirbyteMessage]:
+    async def call_spec(self, raise_container_error=False) -> ConnectorOutput:
         return await self._run(["spec"], raise_container_error)
 
-    async def call_check(self, config: SecretDict, raise_container_error: bool = False) -> List[AirbyteMessage]:
+    async def call_check(self, config: SecretDict, raise_container_error: bool = False) -> ConnectorOutput:
         return await self._run(
             ["check", "--config", self.IN_CONTAINER_CONFIG_PATH],
             raise_container_error,
             config=config,
         )
 
-    async def call_discover(self, config: SecretDict, raise_container_error: bool = False) -> List[AirbyteMessage]:
+    async def call_discover(self, config: SecretDict, raise_container_error: bool = False) -> ConnectorOutput:
         return await self._run(
             ["discover", "--config", self.IN_CONTAINER_CONFIG_PATH],
             raise_container_error,
@@ -183,7 +212,7 @@ class ConnectorRunner:
 
     async def call_read(
         self, config: SecretDict, catalog: ConfiguredAirbyteCatalog, raise_container_error: bool = False, enable_caching: bool = True
-    ) -> List[AirbyteMessage]:
+    ) -> ConnectorOutput:
         return await self._run(
             ["read", "--config", self.IN_CONTAINER_CONFIG_PATH, "--catalog", self.IN_CONTAINER_CATALOG_PATH],
             raise_container_error,
@@ -199,7 +228,7 @@ class ConnectorRunner:
         state: dict,
         raise_container_error: bool = False,
         enable_caching: bool = True,
-    ) -> List[AirbyteMessage]:
+    ) -> ConnectorOutput:
         return await self._run(
             [
                 "read",
@@ -235,8 +264,8 @@ class ConnectorRunner:
         catalog: dict = None,
         state: Union[dict, list] = None,
         enable_caching=True,
-    ) -> List[AirbyteMessage]:
-        """Run a command in the connector container and return the list of AirbyteMessages emitted by the connector.
+    ) -> ConnectorOutput:
+        """Run a command in the connector container and return the AirbyteMessages emitted by the connector.
 
         Args:
             airbyte_command (List[str]): The command to run in the connector container.
@@ -247,7 +276,7 @@ class ConnectorRunner:
             enable_caching (bool, optional): Whether to enable command output caching. Defaults to True.
 
         Returns:
-            List[AirbyteMessage]: The list of AirbyteMessages emitted by the connector.
+            ConnectorOutput: The AirbyteMessages emitted by the connector, lazily parsed from the command output.
         """
         container = self._connector_under_test_container
         current_user = (await container.with_exec(["whoami"]).stdout()).strip()
@@ -262,48 +291,59 @@ class ConnectorRunner:
         if catalog:
             container = container.with_new_file(self.IN_CONTAINER_CATALOG_PATH, contents=catalog.json(), owner=current_user)
         try:
-            output = await self._read_output_from_file(airbyte_command, container)
+            output_file_path = await self._export_output_to_file(airbyte_command, container)
         except dagger.QueryError as e:
             output_too_big = bool([error for error in e.errors if error.message.startswith("file size")])
             if output_too_big:
-                output = await self._read_output_from_file(airbyte_command, container)
+                output_file_path = await self._export_output_to_file(airbyte_command, container)
             elif raise_container_error:
                 raise e
             else:
                 if isinstance(e, dagger.ExecError):
-                    output = e.stdout + e.stderr
+                    output_file_path = self._get_local_output_file_path()
+                    output_file_path.write_text(e.stdout + e.stderr)
                 else:
                     pytest.fail(f"Failed to run command {airbyte_command} in container {self.image_tag} with error: {e}")
-        return self.parse_airbyte_messages_from_command_output(output)
+        self._persist_new_configurations_from_output_file(output_file_path)
+        return ConnectorOutput(output_file_path)
 
     async def _read_output_from_stdout(self, airbyte_command: list, container: dagger.Container) -> str:
         return await container.with_exec(airbyte_command, use_entrypoint=True).stdout()
 
-    async def _read_output_from_file(self, airbyte_command: list, container: dagger.Container) -> str:
-        local_output_file_path = f"/tmp/{str(uuid.uuid4())}"
+    @staticmethod
+    def _get_local_output_file_path() -> Path:
+        return Path(f"/tmp/{str(uuid.uuid4())}")
+
+    async def _export_output_to_file(self, airbyte_command: list, container: dagger.Container) -> Path:
+        local_output_file_path = self._get_local_output_file_path()
         entrypoint = await container.entrypoint()
         airbyte_command = entrypoint + airbyte_command
 
         container = container.with_exec(
             ["sh", "-c", " ".join(airbyte_command) + f" > {self.IN_CONTAINER_OUTPUT_PATH} 2>&1 | tee -a {self.IN_CONTAINER_OUTPUT_PATH}"]
         )
-        await container.file(self.IN_CONTAINER_OUTPUT_PATH).export(local_output_file_path)
-        output = await AnyioPath(local_output_file_path).read_text()
-        await AnyioPath(local_output_file_path).unlink()
-        return output
+        await container.file(self.IN_CONTAINER_OUTPUT_PATH).export(str(local_output_file_path))
+        return local_output_file_path
 
     def parse_airbyte_messages_from_command_output(self, command_output: str) -> List[AirbyteMessage]:
-        airbyte_messages = []
-        for line in splitlines_generator(command_output):
-            try:
-                airbyte_message = AirbyteMessage.parse_raw(line)
-                if airbyte_message.type is AirbyteMessageType.CONTROL and airbyte_message.control.type is OrchestratorType.CONNECTOR_CONFIG:
-                    self._persist_new_configuration(airbyte_message.control.connectorConfig.config, int(airbyte_message.control.emitted_at))
-                airbyte_messages.append(airbyte_message)
-            except ValidationError as exc:
-                logging.warning("Unable to parse connector's output %s, error: %s", line, exc)
+        airbyte_messages = list(parse_airbyte_messages(splitlines_generator(command_output)))
+        for airbyte_message in airbyte_messages:
+            self._persist_new_configuration_from_message(airbyte_message)
         return airbyte_messages
 
+    def _persist_new_configurations_from_output_file(self, output_file_path: Path) -> None:
+        """Persist the configurations emitted in control messages.
+        Only the lines mentioning a control message are parsed, the other messages are parsed lazily when the output is consumed.
+        """
+        with open(output_file_path) as output_file:
+            control_lines = (line.rstrip("\n") for line in output_file if AirbyteMessageType.CONTROL.value in line)
+            for airbyte_message in parse_airbyte_messages(control_lines, log_invalid_lines=False):
+                self._persist_new_configuration_from_message(airbyte_message)
+
+    def _persist_new_configuration_from_message(self, airbyte_message: AirbyteMessage) -> None:
+        if airbyte_message.type is AirbyteMessageType.CONTROL and airbyte_message.control.type is OrchestratorType.CONNECTOR_CONFIG:
+            self._persist_new_configuration(airbyte_message.control.connectorConfig.config, int(airbyte_message.control.emitted_at))
+
     def _persist_new_configuration(self, new_configuration: dict, configuration_emitted_at: int) -> Optional[Path]:
         """Store new configuration values to an updated_configurations subdir under the original configuration path.
         N.B. The new configuration will not be stored if no configuration path was passed to the ConnectorRunner.
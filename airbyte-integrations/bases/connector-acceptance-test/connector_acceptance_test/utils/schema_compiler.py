@@ -0,0 +1,247 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import numbers
+import re
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from jsonschema import Draft7Validator, FormatChecker
+
+
+SUPPORTED_KEYWORDS = {
+    "additionalProperties",
+    "allOf",
+    "anyOf",
+    "const",
+    "enum",
+    "exclusiveMaximum",
+    "exclusiveMinimum",
+    "format",
+    "items",
+    "maxItems",
+    "maxLength",
+    "maximum",
+    "minItems",
+    "minLength",
+    "minimum",
+    "not",
+    "oneOf",
+    "pattern",
+    "properties",
+    "required",
+    "type",
+}
+# Keywords validated by Draft 7 that the compiler does not handle. Any other keyword is an annotation (title, description...)
+UNSUPPORTED_KEYWORDS = set(Draft7Validator.VALIDATORS) - SUPPORTED_KEYWORDS
+
+# Type checks matching the ones of Draft7ValidatorWithStrictInteger: integers are checked the Pythonic way
+TYPE_CHECKS = {
+    "array": "isinstance({0}, list)",
+    "boolean": "isinstance({0}, bool)",
+    "integer": "isinstance({0}, int)",
+    "null": "{0} is None",
+    "number": "(isinstance({0}, Number) and not isinstance({0}, bool))",
+    "object": "isinstance({0}, dict)",
+    "string": "isinstance({0}, str)",
+}
+
+# Python limits the number of statically nested blocks in a function, deeper subschemas are validated by a function of their own
+MAX_INLINED_DEPTH = 12
+
+Schema = Union[bool, Dict[str, Any]]
+
+
+class UnsupportedSchemaError(Exception):
+    pass
+
+
+class SchemaCompiler:
+    """Compile a JSON schema into python source code checking whether an instance is valid against it, in the style of fastjsonschema.
+
+    The generated function only answers whether an instance is valid: it stops at the first failing check and does not collect errors.
+    Its result matches the one of Draft7ValidatorWithStrictInteger for the schemas it supports, it raises UnsupportedSchemaError for
+    any other schema (e.g. using $ref or patternProperties) so callers can fall back on the full Draft 7 validator.
+    """
+
+    def __init__(self, format_checker: FormatChecker):
+        self._namespace: Dict[str, Any] = {"Number": numbers.Number, "format_checker": format_checker}
+        self._functions: List[str] = []
+        self._variable_count = 0
+
+    def compile(self, schema: Schema) -> Callable[[Any], bool]:
+        function_name = self._add_function(schema)
+        exec("\n\n".join(self._functions), self._namespace)
+        return self._namespace[function_name]
+
+    @property
+    def source(self) -> str:
+        return "\n\n".join(self._functions)
+
+    def _new_name(self, prefix: str) -> str:
+        self._variable_count += 1
+        return f"{prefix}_{self._variable_count}"
+
+    def _add_constant(self, value: Any) -> str:
+        name = self._new_name("constant")
+        self._namespace[name] = value
+        return name
+
+    def _add_function(self, schema: Schema) -> str:
+        """Generate a function returning whether its argument is valid against schema, return its name."""
+        name = self._new_name("validate")
+        lines = [f"def {name}(data):"]
+        self._generate(schema, "data", 1, lines)
+        lines.append("    return True")
+        self._functions.append("\n".join(lines))
+        return name
+
+    def _generate(self, schema: Schema, variable: str, depth: int, lines: List[str]) -> None:
+        """Append the lines returning False when the value held by variable is not valid against schema."""
+        indent = "    " * depth
+
+        def emit(line: str, extra_depth: int = 0):
+            lines.append(indent + "    " * extra_depth + line)
+
+        if schema is True:
+            return
+        if schema is False:
+            emit("return False")
+            return
+        if not isinstance(schema, dict):
+            raise UnsupportedSchemaError(f"Invalid schema: {schema}")
+        if depth > MAX_INLINED_DEPTH:
+            emit(f"if not {self._add_function(schema)}({variable}):")
+            emit("return False", 1)
+            return
+        unsupported_keywords = UNSUPPORTED_KEYWORDS.intersection(schema)
+        if unsupported_keywords:
+            raise UnsupportedSchemaError(f"Unsupported keywords: {sorted(unsupported_keywords)}")
+
+        if "type" in schema:
+            types = [schema["type"]] if isinstance(schema["type"], str) else schema["type"]
+            if not isinstance(types, list) or any(type_ not in TYPE_CHECKS for type_ in types):
+                raise UnsupportedSchemaError(f"Unsupported type: {schema['type']}")
+            emit(f"if not ({' or '.join(TYPE_CHECKS[type_].format(variable) for type_ in types) or 'False'}):")
+            emit("return False", 1)
+
+        for keyword in ("enum", "const"):
+            if keyword in schema:
+                values = schema[keyword] if keyword == "enum" else [schema[keyword]]
+                # Only strings and null are compared with ==, Draft 7 does not consider True equal to 1 as python does
+                if not isinstance(values, list) or any(value is not None and not isinstance(value, str) for value in values):
+                    raise UnsupportedSchemaError(f"Unsupported {keyword}: {schema[keyword]}")
+                emit(f"if {variable} not in {self._add_constant(tuple(values))}:")
+                emit("return False", 1)
+
+        if "format" in schema:
+            emit(f"if not format_checker.conforms({variable}, {schema['format']!r}):")
+            emit("return False", 1)
+
+        self._generate_string_checks(schema, variable, emit)
+        self._generate_number_checks(schema, variable, emit)
+        self._generate_array_checks(schema, variable, depth, lines, emit)
+        self._generate_object_checks(schema, variable, depth, lines, emit)
+
+        for subschema in self._get_subschemas(schema, "allOf"):
+            self._generate(subschema, variable, depth, lines)
+        if "anyOf" in schema:
+            functions = [self._add_function(subschema) for subschema in self._get_subschemas(schema, "anyOf")]
+            emit(f"if not ({' or '.join(f'{function}({variable})' for function in functions) or 'False'}):")
+            emit("return False", 1)
+        if "oneOf" in schema:
+            functions = [self._add_function(subschema) for subschema in self._get_subschemas(schema, "oneOf")]
+            emit(f"if [{', '.join(f'{function}({variable})' for function in functions)}].count(True) != 1:")
+            emit("return False", 1)
+        if "not" in schema:
+            emit(f"if {self._add_function(schema['not'])}({variable}):")
+            emit("return False", 1)
+
+    @staticmethod
+    def _get_subschemas(schema: Dict[str, Any], keyword: str) -> List[Schema]:
+        subschemas = schema.get(keyword, [])
+        if not isinstance(subschemas, list):
+            raise UnsupportedSchemaError(f"Invalid {keyword}: {subschemas}")
+        return subschemas
+
+    @staticmethod
+    def _get_number(schema: Dict[str, Any], keyword: str) -> Optional[Union[int, float]]:
+        value = schema.get(keyword)
+        if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+            raise UnsupportedSchemaError(f"Invalid {keyword}: {value}")
+        return value
+
+    def _generate_string_checks(self, schema: Dict[str, Any], variable: str, emit: Callable) -> None:
+        min_length, max_length = self._get_number(schema, "minLength"), self._get_number(schema, "maxLength")
+        if min_length is not None:
+            emit(f"if isinstance({variable}, str) and len({variable}) < {min_length!r}:")
+            emit("return False", 1)
+        if max_length is not None:
+            emit(f"if isinstance({variable}, str) and len({variable}) > {max_length!r}:")
+            emit("return False", 1)
+        if "pattern" in schema:
+            pattern = self._add_constant(re.compile(schema["pattern"]))
+            emit(f"if isinstance({variable}, str) and not {pattern}.search({variable}):")
+            emit("return False", 1)
+
+    def _generate_number_checks(self, schema: Dict[str, Any], variable: str, emit: Callable) -> None:
+        comparisons = {"minimum": "<", "maximum": ">", "exclusiveMinimum": "<=", "exclusiveMaximum": ">="}
+        for keyword, failing_operator in comparisons.items():
+            limit = self._get_number(schema, keyword)
+            if limit is not None:
+                emit(f"if {TYPE_CHECKS['number'].format(variable)} and {variable} {failing_operator} {limit!r}:")
+                emit("return False", 1)
+
+    def _generate_array_checks(self, schema: Dict[str, Any], variable: str, depth: int, lines: List[str], emit: Callable) -> None:
+        min_items, max_items = self._get_number(schema, "minItems"), self._get_number(schema, "maxItems")
+        items = schema.get("items", True)
+        if min_items is None and max_items is None and items is True:
+            return
+        emit(f"if isinstance({variable}, list):")
+        if min_items is not None:
+            emit(f"if len({variable}) < {min_items!r}:", 1)
+            emit("return False", 2)
+        if max_items is not None:
+            emit(f"if len({variable}) > {max_items!r}:", 1)
+            emit("return False", 2)
+        if isinstance(items, list):
+            for index, item_schema in enumerate(items):
+                item = self._new_name("data")
+                emit(f"if len({variable}) > {index}:", 1)
+                emit(f"{item} = {variable}[{index}]", 2)
+                self._generate(item_schema, item, depth + 2, lines)
+        elif items is not True:
+            item = self._new_name("data")
+            emit(f"for {item} in {variable}:", 1)
+            self._generate(items, item, depth + 2, lines)
+        emit("pass", 1)
+
+    def _generate_object_checks(self, schema: Dict[str, Any], variable: str, depth: int, lines: List[str], emit: Callable) -> None:
+        properties = schema.get("properties", {})
+        required = schema.get("required", [])
+        additional_properties = schema.get("additionalProperties", True)
+        if not isinstance(properties, dict) or not isinstance(required, list):
+            raise UnsupportedSchemaError(f"Invalid properties or required: {properties}, {required}")
+        if not properties and not required and additional_properties is True:
+            return
+        emit(f"if isinstance({variable}, dict):")
+        for name in required:
+            emit(f"if {name!r} not in {variable}:", 1)
+            emit("return False", 2)
+        for name, property_schema in properties.items():
+            value = self._new_name("data")
+            emit(f"if {name!r} in {variable}:", 1)
+            emit(f"{value} = {variable}[{name!r}]", 2)
+            self._generate(property_schema, value, depth + 2, lines)
+        if additional_properties is not True:
+            known_properties = self._add_constant(frozenset(properties))
+            key = self._new_name("key")
+            emit(f"for {key} in {variable}:", 1)
+            emit(f"if {key} not in {known_properties}:", 2)
+            self._generate(additional_properties, f"{variable}[{key}]", depth + 3, lines)
+        emit("pass", 1)
+
+
+def compile_schema(schema: Schema, format_checker: FormatChecker) -> Callable[[Any], bool]:
+    """Return a function checking whether an instance is valid against schema, raise UnsupportedSchemaError if it can't be compiled."""
+    return SchemaCompiler(format_checker).compile(schema)
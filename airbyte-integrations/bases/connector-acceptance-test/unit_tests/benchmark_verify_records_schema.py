@@ -0,0 +1,114 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Micro-benchmark of the record schema validation, comparing the compiled validation path of `verify_records_schema` to the Draft 7
+validator collecting the errors of every record it was using before.
+
+It is not collected by pytest. To run it from the connector-acceptance-test directory, in the project's poetry environment:
+```
+poetry install
+poetry run python -m unit_tests.benchmark_verify_records_schema --records 1000000
+```
+"""
+
+import argparse
+import time
+
+from connector_acceptance_test.utils.asserts import CustomFormatChecker, Draft7ValidatorWithStrictInteger, verify_records_schema
+
+from airbyte_protocol.models import (
+    AirbyteRecordMessage,
+    AirbyteStream,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    DestinationSyncMode,
+    SyncMode,
+)
+
+
+STREAM_NAME = "benchmark"
+SCHEMA = {
+    "type": ["null", "object"],
+    "properties": {
+        "id": {"type": "integer"},
+        "name": {"type": ["null", "string"]},
+        "email": {"type": ["null", "string"]},
+        "score": {"type": ["null", "number"]},
+        "active": {"type": ["null", "boolean"]},
+        "created_at": {"type": ["null", "string"], "format": "date-time"},
+        "status": {"type": ["null", "string"], "enum": ["new", "active", "churned", None]},
+        "tags": {"type": ["null", "array"], "items": {"type": ["null", "string"]}},
+        "address": {
+            "type": ["null", "object"],
+            "properties": {
+                "street": {"type": ["null", "string"]},
+                "city": {"type": ["null", "string"]},
+                "zip_code": {"type": ["null", "string"]},
+            },
+        },
+    },
+}
+
+
+def generate_records(count: int):
+    statuses = ["new", "active", "churned", None]
+    for i in range(count):
+        yield AirbyteRecordMessage(
+            stream=STREAM_NAME,
+            data={
+                "id": i,
+                "name": f"name_{i}",
+                "email": f"user_{i}@example.com",
+                "score": i / 7,
+                "active": i % 2 == 0,
+                "created_at": f"2023-01-{i % 28 + 1:02d}T12:00:00Z",
+                "status": statuses[i % len(statuses)],
+                "tags": [f"tag_{i % 10}", f"tag_{i % 3}"],
+                "address": {"street": f"{i} main street", "city": "Paris", "zip_code": f"{i % 100000:05d}"},
+            },
+            emitted_at=0,
+        )
+
+
+def verify_records_schema_with_draft7(records, catalog):
+    """Previous implementation: every record goes through the Draft 7 validator collecting its errors"""
+    validator = Draft7ValidatorWithStrictInteger(catalog.streams[0].stream.json_schema, format_checker=CustomFormatChecker())
+    errors = {}
+    for record in records:
+        for error in validator.iter_errors(record.data):
+            errors[str(error.schema_path)] = error
+    return errors
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Benchmark the validation of records against their stream schema")
+    parser.add_argument("--records", type=int, default=1_000_000, help="number of records of the synthetic stream")
+    parser.add_argument("--batch-size", type=int, default=1000, help="number of records validated at once, as done by the read test")
+    parsed_args = parser.parse_args(args)
+
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(name=STREAM_NAME, json_schema=SCHEMA, supported_sync_modes=[SyncMode.full_refresh]),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.append,
+            )
+        ]
+    )
+    records = list(generate_records(parsed_args.records))
+    batches = [records[i : i + parsed_args.batch_size] for i in range(0, len(records), parsed_args.batch_size)]
+
+    timings = {}
+    for name, verify in [("draft7", verify_records_schema_with_draft7), ("compiled", verify_records_schema)]:
+        start = time.perf_counter()
+        for batch in batches:
+            assert not verify(batch, catalog)
+        timings[name] = time.perf_counter() - start
+        print(f"{name:>10}: {timings[name]:.2f}s ({parsed_args.records / timings[name]:,.0f} records/s)")
+    print(f"   speedup: {timings['draft7'] / timings['compiled']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@
 #
 
 import pytest
-from connector_acceptance_test.utils.asserts import verify_records_schema
+from connector_acceptance_test.utils.asserts import Draft7ValidatorWithStrictInteger, verify_records_schema
 
 from airbyte_protocol.models import (
     AirbyteRecordMessage,
@@ -88,6 +88,18 @@ def test_verify_records_schema(configured_catalog: ConfiguredAirbyteCatalog):
     ]
 
 
+def test_verify_records_schema_only_collects_errors_of_invalid_records(mocker, configured_catalog: ConfiguredAirbyteCatalog):
+    iter_errors = mocker.spy(Draft7ValidatorWithStrictInteger, "iter_errors")
+    records = [
+        AirbyteRecordMessage(stream="my_stream", data={"text": "text", "number": number}, emitted_at=0) for number in [1, 2.5, "3", 4]
+    ]
+
+    streams_with_errors = verify_records_schema(records, configured_catalog)
+
+    assert [error.message for error in streams_with_errors["my_stream"].values()] == ["'3' is not of type 'number'"]
+    assert iter_errors.call_count == 1
+
+
 @pytest.mark.parametrize(
     "record, configured_catalog, valid",
     [
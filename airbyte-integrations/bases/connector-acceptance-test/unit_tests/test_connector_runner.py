@@ -73,6 +73,40 @@ class TestContainerRunner:
         runner._persist_new_configuration.assert_called_once_with(new_configuration, 1)
         mock_logging.warning.assert_called_once()
 
+    def test_connector_output_is_parsed_lazily_from_file(self, mocker, tmp_path):
+        new_configuration = {"field_a": "new_value_a"}
+        mock_logging = mocker.MagicMock()
+        mocker.patch.object(connector_runner, "logging", mock_logging)
+        record_message = AirbyteMessage(
+            type=AirbyteMessageType.RECORD, record=AirbyteRecordMessage(stream="test_stream", data={"foo": "bar"}, emitted_at=1.0)
+        )
+        control_message = AirbyteMessage(
+            type=AirbyteMessageType.CONTROL,
+            control=AirbyteControlMessage(
+                type=OrchestratorType.CONNECTOR_CONFIG,
+                emitted_at=1.0,
+                connectorConfig=AirbyteControlConnectorConfigMessage(config=new_configuration),
+            ),
+        )
+        output_file_path = tmp_path / "output"
+        output_file_path.write_text(
+            "\n".join([record_message.json(exclude_unset=False), control_message.json(exclude_unset=False), "invalid message"]) + "\n"
+        )
+
+        mocker.patch.object(connector_runner.ConnectorRunner, "_persist_new_configuration")
+        runner = connector_runner.ConnectorRunner(mocker.Mock())
+        runner._persist_new_configurations_from_output_file(output_file_path)
+        runner._persist_new_configuration.assert_called_once_with(new_configuration, 1)
+
+        output = connector_runner.ConnectorOutput(output_file_path)
+        assert [message.type for message in output] == [AirbyteMessageType.RECORD, AirbyteMessageType.CONTROL]
+        # The output can be consumed several times, invalid lines are only reported once
+        assert [message.type for message in output] == [AirbyteMessageType.RECORD, AirbyteMessageType.CONTROL]
+        mock_logging.warning.assert_called_once()
+
+        del output
+        assert not output_file_path.exists()
+
     @pytest.mark.parametrize(
         "pass_configuration_path, old_configuration, new_configuration, new_configuration_emitted_at, expect_new_configuration",
         [
@@ -0,0 +1,97 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import pytest
+from connector_acceptance_test.utils.asserts import CustomFormatChecker, Draft7ValidatorWithStrictInteger
+from connector_acceptance_test.utils.schema_compiler import UnsupportedSchemaError, compile_schema
+from hypothesis import HealthCheck, given, settings
+from hypothesis import strategies as st
+from hypothesis_jsonschema import from_schema
+
+
+SCHEMAS = [
+    {"type": ["null", "object"], "properties": {"a": {"type": ["null", "string"]}, "b": {"type": "integer"}}},
+    {"type": "object", "properties": {"a": {"type": "number", "minimum": 0, "exclusiveMaximum": 10}}, "required": ["a"]},
+    {"type": "object", "properties": {"a": {"type": "string", "format": "date-time"}, "b": {"type": "string", "format": "date"}}},
+    {"type": "object", "properties": {"a": {"type": "string", "pattern": "^[a-z]+$", "minLength": 2, "maxLength": 4}}},
+    {"type": "object", "properties": {"a": {"enum": ["x", "y", None]}, "b": {"const": "z"}}},
+    {"type": "object", "properties": {"a": {"type": "array", "items": {"type": "integer"}, "minItems": 1, "maxItems": 3}}},
+    {"type": "object", "properties": {"a": {"type": "array", "items": [{"type": "string"}, {"type": "boolean"}]}}},
+    {"type": "object", "properties": {"a": {"anyOf": [{"type": "string"}, {"type": "integer"}]}}},
+    {"type": "object", "properties": {"a": {"oneOf": [{"type": "number"}, {"type": "integer"}]}}},
+    {"type": "object", "properties": {"a": {"not": {"type": "string"}}, "b": {"allOf": [{"type": "integer"}, {"minimum": 3}]}}},
+    {"type": "object", "properties": {"a": {"type": "object", "properties": {"b": {"type": "string"}}, "additionalProperties": False}}},
+    {"type": "object", "additionalProperties": {"type": "integer"}, "properties": {"a": {"type": "string"}}},
+    {"type": "object", "properties": {"a": False, "b": True}},
+]
+
+INSTANCES = [
+    None,
+    {},
+    {"a": None},
+    {"a": "ab", "b": 1},
+    {"a": "2021-08-10T12:43:15Z", "b": "2020-12-20"},
+    {"a": "2018-21-13T20:20:39+00:00", "b": "2020-20-20"},
+    {"a": "abcde"},
+    {"a": "AB"},
+    {"a": 1.0, "b": True},
+    {"a": 5, "b": 2},
+    {"a": 10},
+    {"a": -1},
+    {"a": "x", "b": "z"},
+    {"a": "w", "b": "y"},
+    {"a": [1, 2]},
+    {"a": []},
+    {"a": [1, 2, 3, 4]},
+    {"a": ["x", True, 1]},
+    {"a": [1, "x"]},
+    {"a": True},
+    {"a": 1.5},
+    {"a": {"b": "x"}},
+    {"a": {"b": "x", "c": 1}},
+    {"a": "x", "c": 1, "d": "y"},
+    {"b": 1},
+]
+
+
+@pytest.mark.parametrize("schema", SCHEMAS)
+def test_compiled_schema_matches_draft7_validator(schema):
+    validator = Draft7ValidatorWithStrictInteger(schema, format_checker=CustomFormatChecker())
+    is_valid = compile_schema(schema, CustomFormatChecker())
+    for instance in INSTANCES:
+        assert is_valid(instance) == validator.is_valid(instance), f"{instance} against {schema}"
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        {"type": "object", "properties": {"a": {"$ref": "#/definitions/a"}}, "definitions": {"a": {"type": "string"}}},
+        {"type": "object", "patternProperties": {"^a": {"type": "string"}}},
+        {"type": "object", "properties": {"a": {"enum": [1, 2]}}},
+        {"type": "object", "properties": {"a": {"type": "unknown"}}},
+    ],
+)
+def test_unsupported_schemas_are_not_compiled(schema):
+    with pytest.raises(UnsupportedSchemaError):
+        compile_schema(schema, CustomFormatChecker())
+
+
+def test_deeply_nested_schema():
+    schema = {"type": "string"}
+    instance = "leaf"
+    for _ in range(30):
+        schema = {"type": "object", "properties": {"child": schema}}
+        instance = {"child": instance}
+    is_valid = compile_schema(schema, CustomFormatChecker())
+    assert is_valid(instance)
+    assert not is_valid({"child": {"child": 1}})
+
+
+@settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+@given(data=st.data())
+def test_compiled_schema_matches_draft7_validator_on_generated_instances(data):
+    schema = data.draw(st.sampled_from(SCHEMAS))
+    instance = data.draw(from_schema(schema))
+    validator = Draft7ValidatorWithStrictInteger(schema, format_checker=CustomFormatChecker())
+    assert compile_schema(schema, CustomFormatChecker())(instance) == validator.is_valid(instance)
@@ -175,6 +175,48 @@ class StreamWriter:
 
         return record
 
+    def _can_cast_column_at_once(self, values: List[Any], schema_entry: Dict[str, Any]) -> bool:
+        """
+        Helper that tells whether a column can be casted with a single vectorized pandas call.
+        Only timestamp and numeric columns are, when they hold the python types for which
+        the vectorized cast gives the same result as _json_schema_cast_value.
+        """
+        typ = self._get_json_schema_type(schema_entry.get("type"))
+
+        if typ == "string" and schema_entry.get("format") == "date-time":
+            return all(value is None or isinstance(value, str) for value in values)
+
+        if typ == "integer" or (typ == "number" and not self._config.glue_catalog_float_as_decimal):
+            return all(value is None or (isinstance(value, (str, int, float)) and not isinstance(value, bool)) for value in values)
+
+        return False
+
+    def _json_schema_cast_column(self, values: List[Any], schema_entry: Dict[str, Any]) -> Union[pd.Series, List[Any]]:
+        if self._can_cast_column_at_once(values, schema_entry):
+            column = pd.Series(values, dtype="object")
+            if schema_entry.get("format") == "date-time":
+                return pd.to_datetime(column, errors="coerce", utc=True, format="mixed")
+            return pd.to_numeric(column, errors="coerce")
+
+        return [self._json_schema_cast_value(value, schema_entry) for value in values]
+
+    def _json_schema_cast_records(self, records: List[Dict[str, Any]]) -> pd.DataFrame:
+        """
+        Columnar counterpart of _json_schema_cast, building the dataframe of the buffered records one column at a time.
+        Timestamp and numeric columns are casted at once instead of value by value,
+        values of other columns go through _json_schema_cast_value.
+        """
+        if not records:
+            return pd.DataFrame()
+
+        # same column order as a dataframe built from records casted one by one:
+        # keys of the first record, then the schema keys it is missing
+        columns = list(records[0].keys()) + [key for key in self._schema.keys() if key not in records[0]]
+
+        return pd.DataFrame(
+            {column: self._json_schema_cast_column([record.get(column) for record in records], self._schema[column]) for column in columns}
+        )
+
     def _get_non_null_json_schema_types(self, typ: Union[str, List[str]]) -> Union[str, List[str]]:
         if isinstance(typ, list):
             return list(filter(lambda x: x != "null", typ))
@@ -370,8 +412,8 @@ class StreamWriter:
         return self._configured_stream.cursor_field
 
     def append_message(self, message: Dict[str, Any]):
+        # values are casted column by column when flushing
         clean_message = self._drop_additional_top_level_properties(message)
-        clean_message = self._json_schema_cast(clean_message)
         self._messages.append(clean_message)
 
     def reset(self):
@@ -384,7 +426,7 @@ class StreamWriter:
     def flush(self, partial: bool = False):
         logger.debug(f"Flushing {len(self._messages)} messages to table {self._database}:{self._table}")
 
-        df = pd.DataFrame(self._messages)
+        df = self._json_schema_cast_records(self._messages)
         # best effort to convert pandas types
         df = df.astype(self._get_pandas_dtypes_from_json_schema(df), errors="ignore")
 
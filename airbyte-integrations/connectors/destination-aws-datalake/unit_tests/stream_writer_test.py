@@ -730,6 +730,39 @@ def test_json_schema_cast_bad_values():
     assert pd.isna(created_time)
 
 
+def test_json_schema_cast_records():
+    config = get_config()
+    for glue_catalog_float_as_decimal in [False, True]:
+        config["glue_catalog_float_as_decimal"] = glue_catalog_float_as_decimal
+        writer = get_big_schema_writer(config)
+        records = [
+            {
+                "appId": "123",
+                "appName": "Airbyte",
+                "bounced": "true",
+                "percentage": "10.5",
+                "location": {"city": "Paris", "latitude": "48.85", "longitude": None},
+                "sentAt": "2021-01-01T00:00:00Z",
+                "status": 1,
+                "read": 0,
+            },
+            {"appId": None, "percentage": 3, "sentAt": "not a date", "status": "bad", "questions": [{"id": "1"}]},
+            {"appId": 12.0, "percentage": None, "sentAt": "2021-06-01T10:00:00+02:00", "status": True},
+        ]
+
+        expected = pd.DataFrame([writer._json_schema_cast(dict(record)) for record in records])
+        result = writer._json_schema_cast_records(records)
+
+        assert list(result.columns) == list(expected.columns)
+        for column in expected.columns:
+            assert result[column].tolist() == expected[column].tolist() or (
+                result[column].isna().tolist() == expected[column].isna().tolist()
+                and result[column].dropna().tolist() == expected[column].dropna().tolist()
+            ), column
+
+    assert writer._json_schema_cast_records([]).empty
+
+
 def test_json_dict_encoder():
     dt = "2023-08-01T23:32:11Z"
     dt = pd.to_datetime(dt, utc=True)
@@ -14,11 +14,13 @@ class WriteBufferMixin:
     logger = AirbyteLogger()
     # intervals after which the records_buffer should be cleaned up for selected stream
     flush_interval = 500  # records count
-    flush_interval_size_in_kb = 10 ^ 8  # memory allocation ~ 97656 Kb or 95 Mb
+    flush_interval_size_in_kb = 10**8 / 1024  # payload size ~ 97656 Kb or 95 Mb
 
     def __init__(self):
         # Buffer for input records
         self.records_buffer = {}
+        # Size of the buffered values in bytes, per stream
+        self.records_buffer_size = {}
         # Placeholder for streams metadata
         self.stream_info = {}
 
@@ -39,6 +41,7 @@ class WriteBufferMixin:
         """
         stream = configured_stream.stream
         self.records_buffer[stream.name] = []
+        self.records_buffer_size[stream.name] = 0
         self.stream_info[stream.name] = {
             "headers": sorted(list(stream.json_schema.get("properties").keys())),
             "is_set": False,
@@ -50,18 +53,27 @@ class WriteBufferMixin:
 
         1) normalizes input record
         2) coerces normalized record to str
-        3) gets values as list of record values from record mapping.
+        3) gets values as list of record values from record mapping
+        4) accounts the encoded size of the values in `records_buffer_size`.
         """
 
         norm_record = self._normalize_record(stream_name, record)
         norm_values = list(map(str, norm_record.values()))
         self.records_buffer[stream_name].append(norm_values)
+        self.records_buffer_size[stream_name] += sum(len(value.encode("utf-8")) for value in norm_values)
+
+    def buffer_size_in_kb(self, stream_name: str) -> float:
+        """
+        Returns the size of the values buffered for input stream in Kb, as they will be sent in the write request.
+        """
+        return self.records_buffer_size[stream_name] / 1024
 
     def clear_buffer(self, stream_name: str):
         """
         Cleans up the `records_buffer` values, belonging to input stream.
         """
         self.records_buffer[stream_name].clear()
+        self.records_buffer_size[stream_name] = 0
 
     def _normalize_record(self, stream_name: str, record: Mapping) -> Mapping[str, Any]:
         """
@@ -2,7 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from typing import List, Mapping
+from typing import List, Mapping, Tuple
 
 from pygsheets import Spreadsheet, Worksheet
 from pygsheets.client import Client as pygsheets_client
@@ -84,15 +84,45 @@ class GoogleSheets:
 
         return rows_to_delete
 
+    @staticmethod
+    def coalesce_rows(rows_list: List[int]) -> List[Tuple[int, int]]:
+        """
+        Groups the row indexes into contiguous ranges, ordered from the bottom of the worksheet to the top.
+        Returns: List of (first_row, rows_count) tuples.
+            [99, 5, 4, 1] -> [(99, 1), (4, 2), (1, 1)]
+        """
+        ranges = []
+        for row in sorted(set(rows_list), reverse=True):
+            if ranges and ranges[-1][0] == row + 1:
+                ranges[-1] = (row, ranges[-1][1] + 1)
+            else:
+                ranges.append((row, 1))
+        return ranges
+
     def remove_duplicates(self, stream: Worksheet, rows_list: list):
         """
         Removes duplicated rows, provided by `rows_list` as list of indexes.
 
-        We are working with delete operation in offline mode, to decrease the number of API calls.
-        1) Unlink the spreadsheet (make it for offline use)
-        2) Perform delete operation and update the actual row index
-        3) Link the spreadsheet (sync with online version) using batch_update method.
+        Adjacent rows are coalesced into ranges and all of them are deleted with a single `batchUpdate` call.
+        The ranges are deleted from the bottom up, so the requests applied earlier do not shift the indexes
+        of the ones applied later.
         """
-        stream.unlink()
-        [stream.delete_rows(row, 1) for row in rows_list]
-        stream.link()
+        ranges = self.coalesce_rows(rows_list)
+        if not ranges:
+            return
+        requests = [
+            {
+                "deleteDimension": {
+                    "range": {
+                        "sheetId": stream.id,
+                        "dimension": "ROWS",
+                        "startIndex": first_row - 1,
+                        "endIndex": first_row - 1 + rows_count,
+                    }
+                }
+            }
+            for first_row, rows_count in ranges
+        ]
+        self.client.sheet.batch_update(stream.spreadsheet.id, requests)
+        # keep the local copy of the worksheet properties in sync, like `Worksheet.delete_rows` does
+        stream.jsonSheet["properties"]["gridProperties"]["rowCount"] = stream.rows - sum(rows_count for _, rows_count in ranges)
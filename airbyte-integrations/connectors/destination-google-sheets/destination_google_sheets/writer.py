@@ -40,8 +40,7 @@ class GoogleSheetsWriter(WriteBufferMixin):
         3) cleans-up the records_buffer belonging to input stream
         """
         # get the size of records_buffer for target stream in Kb
-        # TODO unit test flush triggers
-        records_buffer_size_in_kb = self.records_buffer[stream_name].__sizeof__() / 1024
+        records_buffer_size_in_kb = self.buffer_size_in_kb(stream_name)
         if len(self.records_buffer[stream_name]) == self.flush_interval or records_buffer_size_in_kb > self.flush_interval_size_in_kb:
             self.write_from_queue(stream_name)
             self.clear_buffer(stream_name)
@@ -110,7 +109,7 @@ class GoogleSheetsWriter(WriteBufferMixin):
     def deduplicate_records(self, configured_stream: AirbyteStream):
         """
         Finds and removes duplicated records for target stream, using `primary_key`.
-        Processing the worksheet happens offline and sync it afterwards to reduce API calls rate
+        All the duplicated rows are removed with a single batch request to reduce API calls rate.
         If rate limits are hit while deduplicating, it will be handeled automatically, the operation continues after backoff.
         """
         primary_key: str = configured_stream.primary_key[0][0]
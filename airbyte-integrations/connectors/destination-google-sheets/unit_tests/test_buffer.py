@@ -0,0 +1,40 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from unittest.mock import MagicMock
+
+from destination_google_sheets.buffer import WriteBufferMixin
+
+
+def _buffer_with_stream(stream_name: str) -> WriteBufferMixin:
+    buffer = WriteBufferMixin()
+    configured_stream = MagicMock()
+    configured_stream.stream.name = stream_name
+    configured_stream.stream.json_schema = {"properties": {"id": {}, "name": {}}}
+    buffer.init_buffer_stream(configured_stream)
+    return buffer
+
+
+def test_buffer_size_counts_encoded_values():
+    buffer = _buffer_with_stream("stream_1")
+    buffer.add_to_buffer("stream_1", {"id": 1, "name": "é" * 1024})
+    buffer.add_to_buffer("stream_1", {"id": 22})
+
+    # "1" + 2048 bytes of utf-8 encoded "é" + "22" + "" (missing "name")
+    assert buffer.records_buffer_size["stream_1"] == 2051
+    assert buffer.buffer_size_in_kb("stream_1") == 2051 / 1024
+
+
+def test_clear_buffer_resets_size():
+    buffer = _buffer_with_stream("stream_1")
+    buffer.add_to_buffer("stream_1", {"id": 1, "name": "value"})
+    buffer.clear_buffer("stream_1")
+
+    assert buffer.records_buffer["stream_1"] == []
+    assert buffer.buffer_size_in_kb("stream_1") == 0
+
+
+def test_flush_interval_size():
+    # ~ 95 Mb, expressed in Kb
+    assert WriteBufferMixin.flush_interval_size_in_kb == 97656.25
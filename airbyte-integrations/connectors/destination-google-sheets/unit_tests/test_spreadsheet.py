@@ -0,0 +1,46 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from unittest.mock import MagicMock
+
+import pytest
+from destination_google_sheets.spreadsheet import GoogleSheets
+
+
+@pytest.mark.parametrize(
+    "rows_list, expected",
+    [
+        ([], []),
+        ([6, 5, 3], [(5, 2), (3, 1)]),
+        ([99, 5, 4, 1], [(99, 1), (4, 2), (1, 1)]),
+        ([2, 3, 4, 4], [(2, 3)]),
+    ],
+    ids=["empty", "adjacent_rows", "mixed_rows", "unordered_with_repeats"],
+)
+def test_coalesce_rows(rows_list, expected):
+    assert GoogleSheets.coalesce_rows(rows_list) == expected
+
+
+def test_remove_duplicates_sends_single_batch_update():
+    client = MagicMock()
+    stream = MagicMock(id=7, rows=10, jsonSheet={"properties": {"gridProperties": {"rowCount": 10}}})
+    stream.spreadsheet.id = "spreadsheet_id"
+
+    GoogleSheets(client, "spreadsheet_id").remove_duplicates(stream, [6, 5, 3])
+
+    client.sheet.batch_update.assert_called_once_with(
+        "spreadsheet_id",
+        [
+            {"deleteDimension": {"range": {"sheetId": 7, "dimension": "ROWS", "startIndex": 4, "endIndex": 6}}},
+            {"deleteDimension": {"range": {"sheetId": 7, "dimension": "ROWS", "startIndex": 2, "endIndex": 3}}},
+        ],
+    )
+    assert stream.jsonSheet["properties"]["gridProperties"]["rowCount"] == 7
+    stream.delete_rows.assert_not_called()
+
+
+def test_remove_duplicates_without_rows_is_noop():
+    client = MagicMock()
+    GoogleSheets(client, "spreadsheet_id").remove_duplicates(MagicMock(), [])
+    client.sheet.batch_update.assert_not_called()
@@ -2,11 +2,15 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
+import logging
 import os
+import time
 import uuid
-from typing import Optional
+from typing import Iterable, List, Optional, Tuple
 
 import urllib3
+from grpc import StatusCode
 from pinecone import PineconeException
 from pinecone.grpc import PineconeGRPC
 
@@ -18,11 +22,34 @@ from airbyte_cdk.models.airbyte_protocol import ConfiguredAirbyteCatalog, Destin
 from destination_pinecone.config import PineconeIndexingModel
 
 
-# large enough to speed up processing, small enough to not hit pinecone request limits
-PINECONE_BATCH_SIZE = 40
+# upserts are batched by their serialized size, kept below the 2MB limit of pinecone requests with some headroom for the envelope
+MAX_REQUEST_SIZE_BYTES = 2 * 1024 * 1024
+REQUEST_SIZE_SAFETY_FACTOR = 0.8
+# pinecone does not accept more vectors than this in a single upsert, whatever their size
+MAX_VECTORS_PER_UPSERT = 1000
+# size of the protobuf framing of a vector on top of its id, values and metadata
+VECTOR_OVERHEAD_BYTES = 16
+# vector values are sent as packed float32 over gRPC
+BYTES_PER_DIMENSION = 4
 
-# do not flood the server with too many connections in parallel
-PARALLELISM_LIMIT = 4
+# number of upserts sent in parallel, adjusted by the indexer depending on how the index responds
+INITIAL_PARALLELISM = 4
+MIN_PARALLELISM = 1
+MAX_PARALLELISM = 32
+# a wave of upserts is considered fast when its latency is within this factor of the best latency observed so far
+FAST_RESPONSE_LATENCY_FACTOR = 2.0
+
+# upserts rejected because the index is overloaded are retried after an exponential backoff
+MAX_UPSERT_ATTEMPTS = 5
+THROTTLING_BACKOFF_SECONDS = 1.0
+# statuses of an overloaded index; other errors, e.g. 500 / INTERNAL, are not retried
+THROTTLING_HTTP_STATUSES = {429, 503, 504}
+# gRPC counterparts of the http statuses above
+THROTTLING_GRPC_STATUS_CODES = {
+    StatusCode.RESOURCE_EXHAUSTED,
+    StatusCode.UNAVAILABLE,
+    StatusCode.DEADLINE_EXCEEDED,
+}
 
 MAX_METADATA_SIZE = 40_960 - 10_000
 
@@ -31,6 +58,58 @@ MAX_IDS_PER_DELETE = 1000
 AIRBYTE_TAG = "airbyte"
 AIRBYTE_TEST_TAG = "airbyte_test"
 
+logger = logging.getLogger("airbyte")
+
+PineconeVector = Tuple[str, List[float], dict]
+
+
+def is_throttling_error(exception: BaseException) -> bool:
+    """
+    Whether an upsert failed because the index is overloaded (429, 503 or 504), rather than because of the request itself.
+    The gRPC client wraps the gRPC error in a PineconeException, so the chain of causes is inspected as well.
+    """
+    while exception is not None:
+        status = getattr(exception, "status", None)
+        if isinstance(status, int):
+            return status in THROTTLING_HTTP_STATUSES
+        code = getattr(exception, "code", None)
+        if callable(code) and code() in THROTTLING_GRPC_STATUS_CODES:
+            return True
+        exception = exception.__cause__
+    return False
+
+
+class AimdParallelismController:
+    """
+    Additive increase / multiplicative decrease of the number of upserts sent in parallel.
+
+    The parallelism grows by one after each wave of upserts answered successfully and fast, i.e. within
+    FAST_RESPONSE_LATENCY_FACTOR times the best latency observed so far. It is halved as soon as the index
+    throttles a wave, so it converges towards the capacity of the index instead of using a fixed value.
+    """
+
+    def __init__(
+        self,
+        initial: int = INITIAL_PARALLELISM,
+        minimum: int = MIN_PARALLELISM,
+        maximum: int = MAX_PARALLELISM,
+        fast_latency_factor: float = FAST_RESPONSE_LATENCY_FACTOR,
+    ):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.fast_latency_factor = fast_latency_factor
+        self.parallelism = max(minimum, min(maximum, initial))
+        self.best_latency: Optional[float] = None
+
+    def on_success(self, latency: float):
+        if self.best_latency is None or latency < self.best_latency:
+            self.best_latency = latency
+        if latency <= self.best_latency * self.fast_latency_factor:
+            self.parallelism = min(self.maximum, self.parallelism + 1)
+
+    def on_throttled(self):
+        self.parallelism = max(self.minimum, self.parallelism // 2)
+
 
 class PineconeIndexer(Indexer):
     config: PineconeIndexingModel
@@ -44,6 +123,7 @@ class PineconeIndexer(Indexer):
 
         self.pinecone_index = self.pc.Index(config.index)
         self.embedding_dimensions = embedding_dimensions
+        self.parallelism_controller = AimdParallelismController()
 
     def determine_spec_type(self, index_name):
         description = self.pc.describe_index(index_name)
@@ -135,16 +215,73 @@ class PineconeIndexer(Indexer):
                 metadata["text"] = chunk.page_content
             prefix = streamName
             pinecone_docs.append((prefix + "#" + str(uuid.uuid4()), chunk.embedding, metadata))
-        serial_batches = create_chunks(pinecone_docs, batch_size=PINECONE_BATCH_SIZE * PARALLELISM_LIMIT)
-        for batch in serial_batches:
-            async_results = []
-            for ids_vectors_chunk in create_chunks(batch, batch_size=PINECONE_BATCH_SIZE):
-                async_result = self.pinecone_index.upsert(
-                    vectors=ids_vectors_chunk, async_req=True, show_progress=False, namespace=namespace
-                )
-                async_results.append(async_result)
-            # Wait for and retrieve responses (this raises in case of error)
-            [async_result.result() for async_result in async_results]
+        # batches waiting to be upserted, along with the number of times the index throttled them
+        pending_batches = [(batch, 0) for batch in self._create_request_batches(pinecone_docs)]
+        while pending_batches:
+            wave = pending_batches[: self.parallelism_controller.parallelism]
+            throttled_batches = self._upsert_wave(wave, namespace)
+            pending_batches = throttled_batches + pending_batches[len(wave) :]
+            if throttled_batches:
+                attempts = max(attempts for _, attempts in throttled_batches)
+                time.sleep(THROTTLING_BACKOFF_SECONDS * 2 ** (attempts - 1))
+
+    def _estimate_vector_size(self, vector: PineconeVector) -> int:
+        vector_id, values, metadata = vector
+        return (
+            len(vector_id.encode("utf-8"))
+            + BYTES_PER_DIMENSION * len(values)
+            + len(json.dumps(metadata, default=str).encode("utf-8"))
+            + VECTOR_OVERHEAD_BYTES
+        )
+
+    def _create_request_batches(self, vectors: List[PineconeVector]) -> Iterable[Tuple[PineconeVector, ...]]:
+        """
+        Split the vectors into upsert requests as large as allowed by the request size limit of pinecone,
+        so that small vectors are sent in few requests and large vectors or metadata do not exceed the limit.
+        """
+        max_batch_size = MAX_REQUEST_SIZE_BYTES * REQUEST_SIZE_SAFETY_FACTOR
+        batch: List[PineconeVector] = []
+        batch_size = 0
+        for vector in vectors:
+            vector_size = self._estimate_vector_size(vector)
+            if batch and (batch_size + vector_size > max_batch_size or len(batch) >= MAX_VECTORS_PER_UPSERT):
+                yield tuple(batch)
+                batch, batch_size = [], 0
+            batch.append(vector)
+            batch_size += vector_size
+        if batch:
+            yield tuple(batch)
+
+    def _upsert_wave(
+        self, batches: List[Tuple[Tuple[PineconeVector, ...], int]], namespace: Optional[str]
+    ) -> List[Tuple[Tuple[PineconeVector, ...], int]]:
+        """
+        Upsert batches in parallel, wait for all of them and report the outcome to the parallelism controller.
+        Return the batches throttled by the index so they are retried, raise on any other error.
+        """
+        start = time.monotonic()
+        async_results = [
+            self.pinecone_index.upsert(vectors=batch, async_req=True, show_progress=False, namespace=namespace) for batch, _ in batches
+        ]
+        throttled_batches = []
+        for (batch, attempts), async_result in zip(batches, async_results):
+            try:
+                # Wait for and retrieve responses (this raises in case of error)
+                async_result.result()
+            except Exception as e:
+                if not is_throttling_error(e) or attempts + 1 >= MAX_UPSERT_ATTEMPTS:
+                    raise
+                throttled_batches.append((batch, attempts + 1))
+
+        if throttled_batches:
+            self.parallelism_controller.on_throttled()
+            logger.warning(
+                f"Pinecone throttled {len(throttled_batches)} of {len(batches)} upserts, "
+                f"retrying with a parallelism of {self.parallelism_controller.parallelism}"
+            )
+        else:
+            self.parallelism_controller.on_success(time.monotonic() - start)
+        return throttled_batches
 
     def delete(self, delete_ids, namespace, stream):
         filter = {METADATA_RECORD_ID_FIELD: {"$in": delete_ids}}
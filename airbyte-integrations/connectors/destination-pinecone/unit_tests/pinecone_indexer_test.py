@@ -5,10 +5,11 @@
 import os
 from unittest.mock import ANY, MagicMock, Mock, call, patch
 
+import grpc
 import pytest
 import urllib3
 from destination_pinecone.config import PineconeIndexingModel
-from destination_pinecone.indexer import PineconeIndexer
+from destination_pinecone.indexer import MAX_REQUEST_SIZE_BYTES, AimdParallelismController, PineconeIndexer, is_throttling_error
 from pinecone import IndexDescription, exceptions
 from pinecone.grpc import PineconeGRPC
 from pinecone.models import IndexList
@@ -232,25 +233,176 @@ def test_pinecone_index_empty_batch():
 
 def test_pinecone_index_upsert_batching():
     indexer = create_pinecone_indexer()
+    # each vector weighs about 100KB, so a request holds 16 of them
     indexer.index(
-        [Mock(page_content=f"test {i}", metadata={"_ab_stream": "abc"}, embedding=[i, i, i]) for i in range(50)],
+        [Mock(page_content=f"{i:03d}" + "a" * 100_000, metadata={"_ab_stream": "abc"}, embedding=[i, i, i]) for i in range(50)],
         "ns1",
         "some_stream",
     )
-    assert indexer.pinecone_index.upsert.call_count == 2
-    for i in range(40):
-        assert indexer.pinecone_index.upsert.call_args_list[0].kwargs["vectors"][i] == (
-            ANY,
-            [i, i, i],
-            {"_ab_stream": "abc", "text": f"test {i}"},
-        )
-    for i in range(40, 50):
-        assert indexer.pinecone_index.upsert.call_args_list[1].kwargs["vectors"][i - 40] == (
-            ANY,
-            [i, i, i],
-            {"_ab_stream": "abc", "text": f"test {i}"},
+    batches = [upsert_call.kwargs["vectors"] for upsert_call in indexer.pinecone_index.upsert.call_args_list]
+    assert [len(batch) for batch in batches] == [16, 16, 16, 2]
+    assert [vector[1] for batch in batches for vector in batch] == [[i, i, i] for i in range(50)]
+    for batch in batches:
+        assert sum(indexer._estimate_vector_size(vector) for vector in batch) <= MAX_REQUEST_SIZE_BYTES
+
+
+def test_pinecone_index_upsert_batching_vector_count_limit():
+    indexer = create_pinecone_indexer()
+    indexer.index(
+        [Mock(page_content=f"test {i}", metadata={"_ab_stream": "abc"}, embedding=[i, i, i]) for i in range(2500)],
+        "ns1",
+        "some_stream",
+    )
+    assert [len(upsert_call.kwargs["vectors"]) for upsert_call in indexer.pinecone_index.upsert.call_args_list] == [1000, 1000, 500]
+
+
+class FakeThrottlingError(Exception):
+    status = 429
+
+
+class FakeFuture:
+    def __init__(self, index: "FakePineconeIndex", throttled: bool):
+        self.index = index
+        self.throttled = throttled
+
+    def result(self):
+        # the upserts in flight are answered in parallel, after the latency of the index
+        if self.index.in_flight == self.index.submitted:
+            self.index.clock += self.index.latency
+        self.index.in_flight -= 1
+        if self.index.in_flight == 0:
+            self.index.submitted = 0
+        if self.throttled:
+            raise FakeThrottlingError()
+
+
+class FakePineconeIndex:
+    """
+    An index answering upserts after a given latency, which throttles the upserts sent while more than `capacity` are in flight.
+    Time is simulated so the convergence of the parallelism can be tested without waiting.
+    """
+
+    def __init__(self, capacity: int, latency: float):
+        self.capacity = capacity
+        self.latency = latency
+        self.clock = 0.0
+        self.in_flight = 0
+        self.submitted = 0
+        self.upserted_ids = []
+
+    def upsert(self, vectors, async_req, show_progress, namespace):
+        self.in_flight += 1
+        self.submitted += 1
+        throttled = self.in_flight > self.capacity
+        if not throttled:
+            self.upserted_ids.extend(vector[0] for vector in vectors)
+        return FakeFuture(self, throttled)
+
+
+@pytest.mark.parametrize("capacity", [2, 4, 10])
+def test_pinecone_index_parallelism_converges_to_index_capacity(capacity):
+    indexer = create_pinecone_indexer()
+    indexer.pinecone_index = FakePineconeIndex(capacity=capacity, latency=0.1)
+    parallelism = []
+
+    def record_parallelism(batches, namespace):
+        parallelism.append(indexer.parallelism_controller.parallelism)
+        return upsert_wave(batches, namespace)
+
+    upsert_wave = indexer._upsert_wave
+    with patch.object(indexer, "_upsert_wave", side_effect=record_parallelism), patch("destination_pinecone.indexer.time") as mock_time:
+        mock_time.monotonic.side_effect = lambda: indexer.pinecone_index.clock
+        indexer.index(
+            [Mock(page_content="a" * 100_000, metadata={}, embedding=[i, i, i]) for i in range(16 * 300)],
+            "ns1",
+            "some_stream",
         )
 
+    # every vector is upserted exactly once, despite the throttled upserts
+    assert len(indexer.pinecone_index.upserted_ids) == len(set(indexer.pinecone_index.upserted_ids)) == 16 * 300
+    # the additive increase probes the capacity of the index and the multiplicative decrease brings the parallelism back under it
+    converged_parallelism = parallelism[len(parallelism) // 2 :]
+    assert max(converged_parallelism) == capacity + 1
+    assert min(converged_parallelism) == max(1, (capacity + 1) // 2)
+
+
+def test_pinecone_index_raises_after_too_many_throttled_attempts():
+    indexer = create_pinecone_indexer()
+    indexer.pinecone_index = FakePineconeIndex(capacity=0, latency=0.1)
+    with patch("destination_pinecone.indexer.time"), pytest.raises(FakeThrottlingError):
+        indexer.index([Mock(page_content="test", metadata={}, embedding=[1, 2, 3])], "ns1", "some_stream")
+    assert indexer.parallelism_controller.parallelism == 1
+
+
+def test_pinecone_index_does_not_retry_other_errors():
+    indexer = create_pinecone_indexer()
+    indexer.pinecone_index.upsert.return_value.result.side_effect = exceptions.PineconeException("invalid vector")
+    with pytest.raises(exceptions.PineconeException):
+        indexer.index([Mock(page_content="test", metadata={}, embedding=[1, 2, 3])], "ns1", "some_stream")
+    assert indexer.pinecone_index.upsert.call_count == 1
+
+
+class FakeRpcError(Exception):
+    def __init__(self, code: grpc.StatusCode):
+        self._code = code
+
+    def code(self):
+        return self._code
+
+
+def grpc_future_error(code: grpc.StatusCode) -> exceptions.PineconeException:
+    # the gRPC client raises a PineconeException caused by the gRPC error
+    try:
+        raise exceptions.PineconeException("upsert failed") from FakeRpcError(code)
+    except exceptions.PineconeException as e:
+        return e
+
+
+@pytest.mark.parametrize(
+    "exception, expected",
+    [
+        (grpc_future_error(grpc.StatusCode.RESOURCE_EXHAUSTED), True),
+        (grpc_future_error(grpc.StatusCode.UNAVAILABLE), True),
+        (grpc_future_error(grpc.StatusCode.DEADLINE_EXCEEDED), True),
+        (grpc_future_error(grpc.StatusCode.INVALID_ARGUMENT), False),
+        (grpc_future_error(grpc.StatusCode.INTERNAL), False),
+        (grpc_future_error(grpc.StatusCode.UNKNOWN), False),
+        (exceptions.PineconeApiException(status=429), True),
+        (exceptions.PineconeApiException(status=503), True),
+        (exceptions.PineconeApiException(status=400), False),
+        (exceptions.PineconeApiException(status=500), False),
+        (exceptions.PineconeException("invalid vector"), False),
+    ],
+)
+def test_is_throttling_error(exception, expected):
+    assert is_throttling_error(exception) == expected
+
+
+@pytest.mark.parametrize(
+    "latencies, expected_parallelism",
+    [
+        ([1.0, 1.0, 1.0], 7),
+        ([1.0, 5.0, 5.0], 5),
+        ([1.0, 1.5, 0.5], 7),
+    ],
+)
+def test_aimd_parallelism_controller_additive_increase(latencies, expected_parallelism):
+    controller = AimdParallelismController(initial=4)
+    for latency in latencies:
+        controller.on_success(latency)
+    assert controller.parallelism == expected_parallelism
+
+
+def test_aimd_parallelism_controller_multiplicative_decrease():
+    controller = AimdParallelismController(initial=20, maximum=20)
+    controller.on_success(1.0)
+    assert controller.parallelism == 20
+    controller.on_throttled()
+    assert controller.parallelism == 10
+    for _ in range(10):
+        controller.on_throttled()
+    assert controller.parallelism == 1
+
 
 def generate_catalog():
     return ConfiguredAirbyteCatalog.parse_obj(
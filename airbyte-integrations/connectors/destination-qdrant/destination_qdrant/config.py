@@ -40,6 +40,18 @@ class QdrantIndexingConfigModel(BaseModel):
         description="The Distance metric used to measure similarities among vectors. This field is only used if the collection defined in the does not exist yet and is created automatically by the connector.",
     )
     text_field: str = Field(title="Text Field", description="The field in the payload that contains the embedded text", default="text")
+    upload_batch_size: int = Field(
+        title="Upload Batch Size",
+        description="The number of points sent to Qdrant in each upload request",
+        default=64,
+        gt=0,
+    )
+    upload_parallelism: int = Field(
+        title="Upload Parallelism",
+        description="The number of parallel processes uploading points to Qdrant. Uploads are sent sequentially when set to 1",
+        default=1,
+        gt=0,
+    )
 
     class Config:
         title = "Indexing"
@@ -8,9 +8,8 @@ from typing import Any, Iterable, Mapping
 from airbyte_cdk.destinations import Destination
 from airbyte_cdk.destinations.vector_db_based.document_processor import DocumentProcessor
 from airbyte_cdk.destinations.vector_db_based.embedder import Embedder, create_from_config
-from airbyte_cdk.destinations.vector_db_based.indexer import Indexer
 from airbyte_cdk.destinations.vector_db_based.writer import Writer
-from airbyte_cdk.models import AirbyteConnectionStatus, AirbyteMessage, ConfiguredAirbyteCatalog, ConnectorSpecification, Status
+from airbyte_cdk.models import AirbyteConnectionStatus, AirbyteMessage, ConfiguredAirbyteCatalog, ConnectorSpecification, Status, Type
 from airbyte_cdk.models.airbyte_protocol import DestinationSyncMode
 from destination_qdrant.config import ConfigModel
 from destination_qdrant.indexer import QdrantIndexer
@@ -20,7 +19,7 @@ BATCH_SIZE = 256
 
 
 class DestinationQdrant(Destination):
-    indexer: Indexer
+    indexer: QdrantIndexer
     embedder: Embedder
 
     def _init_indexer(self, config: ConfigModel):
@@ -35,7 +34,11 @@ class DestinationQdrant(Destination):
         writer = Writer(
             config_model.processing, self.indexer, self.embedder, batch_size=BATCH_SIZE, omit_raw_text=config_model.omit_raw_text
         )
-        yield from writer.write(configured_catalog, input_messages)
+        for message in writer.write(configured_catalog, input_messages):
+            if message.type == Type.STATE:
+                # the indexer uploads batches in the background, they have to be written before the state is checkpointed
+                self.indexer.flush()
+            yield message
 
     def check(self, logger: logging.Logger, config: Mapping[str, Any]) -> AirbyteConnectionStatus:
         parsed_config = ConfigModel.parse_obj(config)
@@ -4,7 +4,9 @@
 
 
 import uuid
-from typing import List, Optional
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
 
 from qdrant_client import QdrantClient, models
 from qdrant_client.conversions.common_types import PointsSelector
@@ -24,6 +26,19 @@ DISTANCE_METRIC_MAP = {
     "euc": Distance.EUCLID,
 }
 
+# position of a chunk among the chunks of its record, stored on points whose id is derived from their record id
+METADATA_CHUNK_INDEX_FIELD = "_ab_chunk_index"
+
+POINT_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "https://airbyte.com/destinations/qdrant")
+
+
+def create_point_id(record_id: str, chunk_index: int) -> str:
+    """
+    Deterministic id of a chunk of a record, so that syncing a record again overwrites its points in place.
+    The record id already includes the stream identifier.
+    """
+    return str(uuid.uuid5(POINT_ID_NAMESPACE, f"{record_id}#{chunk_index}"))
+
 
 class QdrantIndexer(Indexer):
     config: QdrantIndexingConfigModel
@@ -31,6 +46,13 @@ class QdrantIndexer(Indexer):
     def __init__(self, config: QdrantIndexingConfigModel, embedding_dimensions: int):
         super().__init__(config)
         self.embedding_dimensions = embedding_dimensions
+        # uploads run in the background so they overlap with the embedding of the next batch, flush waits for them
+        self._upload_executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_upload: Optional[Future] = None
+        # deduped streams holding points written with random ids, which can only be deleted by filtering on their record id
+        self._streams_with_random_point_ids: Set[Tuple[Optional[str], str]] = set()
+        # records which will be indexed again, their stale points are deleted once their new number of chunks is known
+        self._records_to_reindex: Dict[Tuple[Optional[str], str], List[str]] = defaultdict(list)
 
     def check(self) -> Optional[str]:
         auth_method_mode = self.config.auth_method.mode
@@ -88,9 +110,36 @@ class QdrantIndexer(Indexer):
             self._client.create_payload_index(
                 collection_name=self.config.collection, field_name=field, field_schema=PayloadSchemaType.KEYWORD
             )
+        self._streams_with_random_point_ids = {
+            (stream.stream.namespace, stream.stream.name)
+            for stream in catalog.streams
+            if stream.destination_sync_mode == DestinationSyncMode.append_dedup
+            and self._has_points_with_random_ids(create_stream_identifier(stream.stream))
+        }
+
+    def _has_points_with_random_ids(self, stream_identifier: str) -> bool:
+        """
+        Whether the stream holds points written before their ids were derived from their record id, as they have no chunk index.
+        """
+        points, _ = self._client.scroll(
+            collection_name=self.config.collection,
+            scroll_filter=models.Filter(
+                must=[
+                    models.FieldCondition(key=METADATA_STREAM_FIELD, match=models.MatchValue(value=stream_identifier)),
+                    models.IsEmptyCondition(is_empty=models.PayloadField(key=METADATA_CHUNK_INDEX_FIELD)),
+                ]
+            ),
+            limit=1,
+            with_payload=False,
+            with_vectors=False,
+        )
+        return len(points) > 0
 
     def delete(self, delete_ids, namespace, stream):
-        if len(delete_ids) > 0:
+        if len(delete_ids) == 0:
+            return
+        if (namespace, stream) in self._streams_with_random_point_ids:
+            self._wait_for_pending_upload()
             self._delete_for_filter(
                 models.FilterSelector(
                     filter=models.Filter(
@@ -100,24 +149,112 @@ class QdrantIndexer(Indexer):
                     )
                 )
             )
+        else:
+            # the points of these records are overwritten in place by index, which only deletes the chunks they no longer have
+            self._records_to_reindex[(namespace, stream)].extend(delete_ids)
 
     def index(self, document_chunks, namespace, stream):
         entities = []
+        # chunks of the last version of each record of the batch, a record synced twice in a batch is only indexed once
+        record_chunks: Dict[str, Tuple[object, list]] = {}
         for i in range(len(document_chunks)):
             chunk = document_chunks[i]
             payload = chunk.metadata
             if chunk.page_content is not None:
                 payload[self.config.text_field] = chunk.page_content
-            entities.append(
-                models.Record(
-                    id=str(uuid.uuid4()),
-                    payload=payload,
-                    vector=chunk.embedding,
+            record_id = payload.get(METADATA_RECORD_ID_FIELD)
+            if record_id is None:
+                entities.append(
+                    models.Record(
+                        id=str(uuid.uuid4()),
+                        payload=payload,
+                        vector=chunk.embedding,
+                    )
+                )
+            else:
+                if record_id not in record_chunks or record_chunks[record_id][0] is not chunk.record:
+                    record_chunks[record_id] = (chunk.record, [])
+                record_chunks[record_id][1].append(chunk)
+
+        for record_id, (_, chunks) in record_chunks.items():
+            for chunk_index, chunk in enumerate(chunks):
+                chunk.metadata[METADATA_CHUNK_INDEX_FIELD] = chunk_index
+                entities.append(
+                    models.Record(
+                        id=create_point_id(record_id, chunk_index),
+                        payload=chunk.metadata,
+                        vector=chunk.embedding,
+                    )
+                )
+
+        # the previous upload has to land before looking for stale points, it may hold older versions of the same records
+        self._wait_for_pending_upload()
+        self._delete_stale_points(
+            self._records_to_reindex.pop((namespace, stream), []),
+            {record_id: len(chunks) for record_id, (_, chunks) in record_chunks.items()},
+        )
+        self._pending_upload = self._upload_executor.submit(
+            self._client.upload_records,
+            collection_name=self.config.collection,
+            records=entities,
+            batch_size=self.config.upload_batch_size,
+            parallel=self.config.upload_parallelism,
+        )
+
+    def _delete_stale_points(self, record_ids: List[str], chunk_counts: Dict[str, int]) -> None:
+        """
+        Delete the points of records left over from a previous version with more chunks, or of records which are not indexed anymore.
+        A record has stale points if its point following its new last chunk exists, which is checked by id instead of running
+        a filtered delete for every record.
+        """
+        if not record_ids:
+            return
+        record_ids = list(dict.fromkeys(record_ids))
+        next_point_ids = {create_point_id(record_id, chunk_counts.get(record_id, 0)): record_id for record_id in record_ids}
+        existing_points = self._client.retrieve(
+            collection_name=self.config.collection, ids=list(next_point_ids), with_payload=False, with_vectors=False
+        )
+        shrunk_record_ids = [next_point_ids[str(point.id)] for point in existing_points]
+        if not shrunk_record_ids:
+            return
+        self._delete_for_filter(
+            models.FilterSelector(
+                filter=models.Filter(
+                    should=[
+                        models.Filter(
+                            must=[models.FieldCondition(key=METADATA_RECORD_ID_FIELD, match=models.MatchValue(value=record_id))],
+                            must_not=[models.HasIdCondition(has_id=self._get_point_ids(record_id, chunk_counts.get(record_id, 0)))]
+                            if chunk_counts.get(record_id)
+                            else None,
+                        )
+                        for record_id in shrunk_record_ids
+                    ]
                 )
             )
-        self._client.upload_records(collection_name=self.config.collection, records=entities)
+        )
+
+    @staticmethod
+    def _get_point_ids(record_id: str, chunk_count: int) -> List[str]:
+        return [create_point_id(record_id, chunk_index) for chunk_index in range(chunk_count)]
+
+    def _wait_for_pending_upload(self) -> None:
+        # raises if the upload failed
+        if self._pending_upload is not None:
+            pending_upload, self._pending_upload = self._pending_upload, None
+            pending_upload.result()
+
+    def flush(self) -> None:
+        """
+        Write everything received so far: wait for the background upload, and delete the points of records which were not indexed again.
+        Has to be called before a state message is emitted, as the state marks the records before it as written.
+        """
+        self._wait_for_pending_upload()
+        for record_ids in self._records_to_reindex.values():
+            self._delete_stale_points(record_ids, {})
+        self._records_to_reindex.clear()
 
     def post_sync(self) -> List[AirbyteMessage]:
+        self.flush()
         try:
             self._client.close()
             return [
@@ -9,7 +9,20 @@ from unittest.mock import MagicMock, Mock, patch
 from destination_qdrant.config import ConfigModel
 from destination_qdrant.destination import DestinationQdrant
 
-from airbyte_cdk.models import ConnectorSpecification, Status
+from airbyte_cdk.destinations.vector_db_based.document_processor import Chunk
+from airbyte_cdk.models import (
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    AirbyteStateMessage,
+    AirbyteStream,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    ConnectorSpecification,
+    DestinationSyncMode,
+    Status,
+    SyncMode,
+    Type,
+)
 
 
 class TestDestinationQdrant(unittest.TestCase):
@@ -95,6 +108,43 @@ class TestDestinationQdrant(unittest.TestCase):
         MockedWriter.assert_called_once_with(self.config_model.processing, mock_indexer, mock_embedder, batch_size=256, omit_raw_text=False)
         mock_writer.write.assert_called_once_with(configured_catalog, input_messages)
 
+    @patch("airbyte_cdk.destinations.vector_db_based.writer.DocumentProcessor")
+    @patch("destination_qdrant.indexer.QdrantClient")
+    @patch("destination_qdrant.destination.create_from_config")
+    def test_write_raises_upload_errors_before_emitting_state(self, MockedEmbedder, MockedQdrantClient, MockedDocumentProcessor):
+        MockedDocumentProcessor.return_value.process.side_effect = lambda record: (
+            [Chunk(page_content="some text", metadata={"_ab_stream": "example_stream"}, record=record)],
+            None,
+        )
+        mock_embedder = Mock(embedding_dimensions=3)
+        mock_embedder.embed_documents.side_effect = lambda documents: [[0.1, 0.2, 0.3] for _ in documents]
+        MockedEmbedder.return_value = mock_embedder
+        MockedQdrantClient.return_value.upload_records.side_effect = Exception("upload failed")
+
+        configured_catalog = ConfiguredAirbyteCatalog(
+            streams=[
+                ConfiguredAirbyteStream(
+                    stream=AirbyteStream(name="example_stream", json_schema={}, supported_sync_modes=[SyncMode.full_refresh]),
+                    sync_mode=SyncMode.full_refresh,
+                    destination_sync_mode=DestinationSyncMode.append,
+                )
+            ]
+        )
+        input_messages = [
+            AirbyteMessage(
+                type=Type.RECORD, record=AirbyteRecordMessage(stream="example_stream", data={"str_col": "some text"}, emitted_at=0)
+            ),
+            AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={"cursor": 1})),
+        ]
+
+        output_messages = []
+        with self.assertRaisesRegex(Exception, "upload failed"):
+            for message in DestinationQdrant().write(self.config, configured_catalog, input_messages):
+                output_messages.append(message)
+
+        MockedQdrantClient.return_value.upload_records.assert_called_once()
+        self.assertEqual(output_messages, [])
+
     def test_spec(self):
         destination = DestinationQdrant()
         result = destination.spec()
@@ -3,10 +3,10 @@
 #
 
 import unittest
-from unittest.mock import Mock, call
+from unittest.mock import ANY, Mock, call
 
 from destination_qdrant.config import QdrantIndexingConfigModel
-from destination_qdrant.indexer import QdrantIndexer
+from destination_qdrant.indexer import QdrantIndexer, create_point_id
 from qdrant_client import models
 
 from airbyte_cdk.destinations.vector_db_based.utils import format_exception
@@ -28,6 +28,8 @@ class TestQdrantIndexer(unittest.TestCase):
         self.qdrant_indexer = QdrantIndexer(self.mock_config, 100)
         self.qdrant_indexer._create_client = Mock()
         self.qdrant_indexer._client = Mock()
+        self.qdrant_indexer._client.scroll.return_value = ([], None)
+        self.qdrant_indexer._client.retrieve.return_value = []
 
     def test_check_gets_existing_collection(self):
         mock_collections = Mock(collections=[Mock()])
@@ -154,10 +156,13 @@ class TestQdrantIndexer(unittest.TestCase):
             None,
             "some_stream",
         )
+        self.qdrant_indexer._wait_for_pending_upload()
 
         self.qdrant_indexer._client.upload_records.assert_called_once()
 
     def test_index_calls_delete(self):
+        # streams holding points with random ids can only delete them by filtering on their record id
+        self.qdrant_indexer._streams_with_random_point_ids = {(None, "some_stream")}
         self.qdrant_indexer.delete(["some_id", "another_id"], None, "some_stream")
 
         self.qdrant_indexer._client.delete.assert_called_with(
@@ -172,6 +177,143 @@ class TestQdrantIndexer(unittest.TestCase):
             ),
         )
 
+    def _create_record_chunks(self, record_id, texts, record=None):
+        record = record or Mock()
+        return [
+            Mock(metadata={"_ab_record_id": record_id, "_ab_stream": "some_stream"}, page_content=text, embedding=[1.0, 2.0], record=record)
+            for text in texts
+        ]
+
+    def _get_uploaded_records(self):
+        self.qdrant_indexer._wait_for_pending_upload()
+        return self.qdrant_indexer._client.upload_records.call_args.kwargs["records"]
+
+    def test_index_uses_deterministic_point_ids(self):
+        self.qdrant_indexer.index(
+            self._create_record_chunks("some_stream_1", ["a", "b"]) + self._create_record_chunks("some_stream_2", ["c"]),
+            None,
+            "some_stream",
+        )
+
+        records = self._get_uploaded_records()
+        self.assertEqual(
+            [record.id for record in records],
+            [create_point_id("some_stream_1", 0), create_point_id("some_stream_1", 1), create_point_id("some_stream_2", 0)],
+        )
+        self.assertEqual([record.payload["_ab_chunk_index"] for record in records], [0, 1, 0])
+        self.assertEqual([record.payload["text"] for record in records], ["a", "b", "c"])
+        self.assertEqual(create_point_id("some_stream_1", 0), create_point_id("some_stream_1", 0))
+        self.assertNotEqual(create_point_id("some_stream_1", 0), create_point_id("some_stream_10", 0))
+
+    def test_index_keeps_the_last_version_of_a_record_in_a_batch(self):
+        self.qdrant_indexer.index(
+            self._create_record_chunks("some_stream_1", ["old a", "old b", "old c"])
+            + self._create_record_chunks("some_stream_1", ["new a"]),
+            None,
+            "some_stream",
+        )
+
+        records = self._get_uploaded_records()
+        self.assertEqual([(record.id, record.payload["text"]) for record in records], [(create_point_id("some_stream_1", 0), "new a")])
+
+    def test_index_uploads_in_the_background_with_configured_batch_size_and_parallelism(self):
+        self.mock_config.upload_batch_size = 128
+        self.mock_config.upload_parallelism = 4
+        self.qdrant_indexer.index(self._create_record_chunks("some_stream_1", ["a"]), None, "some_stream")
+
+        self.assertIsNotNone(self.qdrant_indexer._pending_upload)
+        self.qdrant_indexer._wait_for_pending_upload()
+        self.qdrant_indexer._client.upload_records.assert_called_once_with(
+            collection_name=self.mock_config.collection, records=ANY, batch_size=128, parallel=4
+        )
+
+    def test_upload_errors_are_raised(self):
+        self.qdrant_indexer._client.upload_records.side_effect = Exception("upload failed")
+        self.qdrant_indexer.index(self._create_record_chunks("some_stream_1", ["a"]), None, "some_stream")
+
+        with self.assertRaises(Exception):
+            self.qdrant_indexer.index(self._create_record_chunks("some_stream_2", ["b"]), None, "some_stream")
+
+    def test_reindexed_records_are_not_deleted_if_they_did_not_shrink(self):
+        self.qdrant_indexer.delete(["some_stream_1", "some_stream_2"], None, "some_stream")
+        self.qdrant_indexer.index(
+            self._create_record_chunks("some_stream_1", ["a", "b"]) + self._create_record_chunks("some_stream_2", ["c"]),
+            None,
+            "some_stream",
+        )
+        self.qdrant_indexer.post_sync()
+
+        self.qdrant_indexer._client.retrieve.assert_called_once_with(
+            collection_name=self.mock_config.collection,
+            ids=[create_point_id("some_stream_1", 2), create_point_id("some_stream_2", 1)],
+            with_payload=False,
+            with_vectors=False,
+        )
+        self.qdrant_indexer._client.delete.assert_not_called()
+
+    def test_stale_chunks_of_shrunk_records_are_deleted(self):
+        self.qdrant_indexer._client.retrieve.return_value = [Mock(id=create_point_id("some_stream_1", 1))]
+        self.qdrant_indexer.delete(["some_stream_1", "some_stream_2"], None, "some_stream")
+        self.qdrant_indexer.index(
+            self._create_record_chunks("some_stream_1", ["a"]) + self._create_record_chunks("some_stream_2", ["c"]), None, "some_stream"
+        )
+
+        self.qdrant_indexer._client.delete.assert_called_once_with(
+            collection_name=self.mock_config.collection,
+            points_selector=models.FilterSelector(
+                filter=models.Filter(
+                    should=[
+                        models.Filter(
+                            must=[models.FieldCondition(key="_ab_record_id", match=models.MatchValue(value="some_stream_1"))],
+                            must_not=[models.HasIdCondition(has_id=[create_point_id("some_stream_1", 0)])],
+                        )
+                    ]
+                )
+            ),
+        )
+
+    def test_records_which_are_not_indexed_again_are_deleted(self):
+        self.qdrant_indexer._client.retrieve.return_value = [Mock(id=create_point_id("some_stream_1", 0))]
+        self.qdrant_indexer.delete(["some_stream_1"], None, "some_stream")
+        self.qdrant_indexer.post_sync()
+
+        self.qdrant_indexer._client.delete.assert_called_once_with(
+            collection_name=self.mock_config.collection,
+            points_selector=models.FilterSelector(
+                filter=models.Filter(
+                    should=[
+                        models.Filter(must=[models.FieldCondition(key="_ab_record_id", match=models.MatchValue(value="some_stream_1"))])
+                    ]
+                )
+            ),
+        )
+
+    def test_pre_sync_detects_deduped_streams_with_random_point_ids(self):
+        self.qdrant_indexer._client.scroll.side_effect = lambda scroll_filter, **kwargs: (
+            [Mock()] if scroll_filter.must[0].match.value == "legacy_stream" else [],
+            None,
+        )
+        self.qdrant_indexer.pre_sync(
+            Mock(
+                streams=[
+                    Mock(
+                        destination_sync_mode=DestinationSyncMode.append_dedup,
+                        stream=AirbyteStream(name="legacy_stream", json_schema={}, supported_sync_modes=[SyncMode.incremental]),
+                    ),
+                    Mock(
+                        destination_sync_mode=DestinationSyncMode.append_dedup,
+                        stream=AirbyteStream(name="some_stream", json_schema={}, supported_sync_modes=[SyncMode.incremental]),
+                    ),
+                ]
+            )
+        )
+
+        self.assertEqual(self.qdrant_indexer._streams_with_random_point_ids, {(None, "legacy_stream")})
+        self.qdrant_indexer.delete(["some_stream_1"], None, "some_stream")
+        self.qdrant_indexer._client.delete.assert_not_called()
+        self.qdrant_indexer.delete(["legacy_stream_1"], None, "legacy_stream")
+        self.qdrant_indexer._client.delete.assert_called_once()
+
     def test_post_sync_calls_close(self):
         result = self.qdrant_indexer.post_sync()
         self.qdrant_indexer._client.close.assert_called_once()
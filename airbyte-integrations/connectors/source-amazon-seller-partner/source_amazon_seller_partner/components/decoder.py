@@ -3,20 +3,141 @@
 #
 import csv
 import gzip
+import io
 import json
 import logging
+import xml.etree.ElementTree as ElementTree
 from dataclasses import InitVar, dataclass
-from io import StringIO
-from typing import Any, Generator, List, Mapping, MutableMapping
+from typing import IO, Any, Dict, Generator, Iterator, List, Mapping, MutableMapping, Set, Tuple
 
 import requests
-import xmltodict
 
 from airbyte_cdk.sources.declarative.decoders.decoder import Decoder
 
 
 logger = logging.getLogger("airbyte")
 
+GZIP_MAGIC_NUMBER = b"\x1f\x8b"
+# Size of the chunks read from the network and of the buffers of the decompression and decoding layers
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+REPORT_ENCODING = "iso-8859-1"
+
+
+class ResponseContentReader(io.RawIOBase):
+    """
+    Binary file object reading the body of a response chunk by chunk. It relies on `response.iter_content` so it works with
+    streamed responses as well as with responses whose content has already been loaded.
+    """
+
+    def __init__(self, response: requests.Response):
+        self._chunks = response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE)
+        self._chunk = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._chunk:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._chunk = memoryview(chunk)
+        size = min(len(buffer), len(self._chunk))
+        buffer[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        return size
+
+
+def open_report_document(response: requests.Response) -> IO[str]:
+    """
+    Returns the report document of a response as a text stream: the body is read from the network, decompressed if it is
+    gzipped and decoded lazily, so neither the compressed nor the decompressed document is ever held in memory.
+    Uncompressed documents are supported as well.
+    """
+    document = io.BufferedReader(ResponseContentReader(response), buffer_size=DOWNLOAD_CHUNK_SIZE)
+    if document.peek(len(GZIP_MAGIC_NUMBER))[: len(GZIP_MAGIC_NUMBER)] == GZIP_MAGIC_NUMBER:
+        document = io.BufferedReader(gzip.GzipFile(fileobj=document, mode="rb"), buffer_size=DOWNLOAD_CHUNK_SIZE)
+    return io.TextIOWrapper(document, encoding=REPORT_ENCODING, newline="")
+
+
+def xml_name(name: str, prefixes: Mapping[str, str]) -> str:
+    """
+    Converts a `{namespace}local` name of ElementTree back to the `prefix:local` name of the document, as xmltodict
+    (which does not process namespaces by default) names elements and attributes. Names of the default namespace have no prefix.
+    """
+    if name[0] != "{":
+        return name
+    namespace, local_name = name[1:].split("}", 1)
+    prefix = prefixes.get(namespace)
+    return f"{prefix}:{local_name}" if prefix else local_name
+
+
+def xml_element_to_dict(
+    element: ElementTree.Element, attr_prefix: str, cdata_key: str, force_list: Set[str], prefixes: Mapping[str, str]
+) -> Any:
+    """
+    Converts an element the same way xmltodict.parse does: elements without attributes and children become their stripped
+    text (or None), other elements a dict of their attributes, children and text, repeated or `force_list` children a list.
+    `prefixes` maps the namespaces of the document to their prefix, see xml_name.
+    """
+    item = {attr_prefix + xml_name(name, prefixes): value for name, value in element.attrib.items()}
+    text = element.text or ""
+    for child in element:
+        value = xml_element_to_dict(child, attr_prefix, cdata_key, force_list, prefixes)
+        tag = xml_name(child.tag, prefixes)
+        if tag in item:
+            if isinstance(item[tag], list):
+                item[tag].append(value)
+            else:
+                item[tag] = [item[tag], value]
+        else:
+            item[tag] = [value] if tag in force_list else value
+        text += child.tail or ""
+    text = text.strip() or None
+    if not item:
+        return text
+    if text:
+        item[cdata_key] = text
+    return item
+
+
+def iter_xml_elements(
+    document: IO[str], root_tag: str, element_tag: str, attr_prefix: str, cdata_key: str, force_list: Set[str] = frozenset()
+) -> Iterator[Any]:
+    """
+    Parses the `element_tag` children of the `root_tag` root element one at a time and yields each of them converted by
+    xml_element_to_dict. Processed elements are cleared so memory usage does not grow with the size of the document.
+
+    Tags are matched and converted with the prefixes of the document, and namespace declarations are kept as `xmlns`
+    attributes, as xmltodict does.
+    """
+    depth = 0
+    root = None
+    prefixes: Dict[str, str] = {}
+    declarations: List[Tuple[str, str]] = []
+    for event, element in ElementTree.iterparse(document, events=("start-ns", "start", "end")):
+        if event == "start-ns":
+            prefix, namespace = element
+            prefixes[namespace] = prefix
+            declarations.append((prefix, namespace))
+            continue
+
+        if event == "start":
+            for prefix, namespace in declarations:
+                element.set(f"xmlns:{prefix}" if prefix else "xmlns", namespace)
+            declarations.clear()
+            if root is None:
+                if xml_name(element.tag, prefixes) != root_tag:
+                    return
+                root = element
+            depth += 1
+            continue
+
+        depth -= 1
+        if depth == 1 and xml_name(element.tag, prefixes) == element_tag:
+            yield xml_element_to_dict(element, attr_prefix, cdata_key, force_list, prefixes)
+            root.clear()
+
 
 @dataclass
 class GzipCsvDecoder(Decoder):
@@ -27,15 +148,11 @@ class GzipCsvDecoder(Decoder):
     parameters: InitVar[Mapping[str, Any]]
 
     def is_stream_response(self) -> bool:
-        return False
+        return True
 
     def decode(self, response: requests.Response) -> Generator[MutableMapping[str, Any], None, None]:
-        try:
-            document = gzip.decompress(response.content).decode("iso-8859-1")
-        except gzip.BadGzipFile:
-            document = response.content.decode("iso-8859-1")
-
-        yield from csv.DictReader(StringIO(document), delimiter="\t")
+        with open_report_document(response) as document:
+            yield from csv.DictReader(document, delimiter="\t")
 
 
 @dataclass
@@ -47,23 +164,17 @@ class GzipXmlDecoder(Decoder):
     parameters: InitVar[Mapping[str, Any]]
 
     def is_stream_response(self) -> bool:
-        return False
+        return True
 
     def decode(self, response: requests.Response) -> Generator[MutableMapping[str, Any], None, None]:
-        try:
-            document = gzip.decompress(response.content).decode("iso-8859-1")
-        except gzip.BadGzipFile:
-            document = response.content.decode("iso-8859-1")
-
-        try:
-            parsed = xmltodict.parse(document, attr_prefix="", cdata_key="value", force_list={"Message"})
-        except Exception as e:
-            logger.warning(f"Unable to parse the report for the stream {self.name}, error: {str(e)}")
-            return []
-
-        reports = parsed.get("AmazonEnvelope", {}).get("Message", {})
-        for report in reports:
-            yield report.get("OrderReport", {})
+        with open_report_document(response) as document:
+            try:
+                for report in iter_xml_elements(
+                    document, "AmazonEnvelope", "Message", attr_prefix="", cdata_key="value", force_list={"Message"}
+                ):
+                    yield report.get("OrderReport", {})
+            except ElementTree.ParseError as e:
+                logger.warning(f"Unable to parse the report for the stream, error: {str(e)}")
 
 
 @dataclass
@@ -76,19 +187,15 @@ class GzipJsonDecoder(Decoder):
     parameters: InitVar[Mapping[str, Any]]
 
     def is_stream_response(self) -> bool:
-        return False
+        return True
 
     def decode(self, response: requests.Response) -> Generator[MutableMapping[str, Any], None, None]:
         try:
-            document = gzip.decompress(response.content).decode("iso-8859-1")
-        except gzip.BadGzipFile:
-            document = response.content.decode("iso-8859-1")
-
-        try:
-            body_json = json.loads(document)
+            with open_report_document(response) as document:
+                body_json = json.load(document)
             yield from self.parse_body_json(body_json)
         except requests.exceptions.JSONDecodeError:
-            logger.warning(f"Response cannot be parsed into json: {response.status_code=}, {response.text=}")
+            logger.warning(f"Response cannot be parsed into json: {response.status_code=}")
             yield {}
 
     @staticmethod
@@ -109,23 +216,19 @@ class SellerFeedbackReportsGzipCsvDecoder(Decoder):
     NORMALIZED_FIELD_NAMES = ["date", "rating", "comments", "response", "order_id", "rater_email"]
 
     def is_stream_response(self) -> bool:
-        return False
+        return True
 
     def decode(self, response: requests.Response) -> Generator[MutableMapping[str, Any], None, None]:
         # csv header field names for this report differ per marketplace (are localized to marketplace language)
         # but columns come in the same order, so we set fieldnames to our custom ones
         # and raise error if original and custom header field count does not match
-        try:
-            document = gzip.decompress(response.content).decode("iso-8859-1")
-        except gzip.BadGzipFile:
-            document = response.content.decode("iso-8859-1")
+        with open_report_document(response) as document:
+            reader = csv.DictReader(document, delimiter="\t", fieldnames=self.NORMALIZED_FIELD_NAMES)
+            original_fieldnames = next(reader)
+            if len(original_fieldnames) != len(self.NORMALIZED_FIELD_NAMES):
+                raise ValueError("Original and normalized header field count does not match")
 
-        reader = csv.DictReader(StringIO(document), delimiter="\t", fieldnames=self.NORMALIZED_FIELD_NAMES)
-        original_fieldnames = next(reader)
-        if len(original_fieldnames) != len(self.NORMALIZED_FIELD_NAMES):
-            raise ValueError("Original and normalized header field count does not match")
-
-        yield from reader
+            yield from reader
 
 
 @dataclass
@@ -134,27 +237,21 @@ class GetXmlBrowseTreeDataDecoder(Decoder):
     NORMALIZED_FIELD_NAMES = ["date", "rating", "comments", "response", "order_id", "rater_email"]
 
     def is_stream_response(self) -> bool:
-        return False
+        return True
 
     def decode(self, response: requests.Response) -> Generator[MutableMapping[str, Any], None, None]:
         # csv header field names for this report differ per marketplace (are localized to marketplace language)
         # but columns come in the same order, so we set fieldnames to our custom ones
         # and raise error if original and custom header field count does not match
-        try:
-            document = gzip.decompress(response.content).decode("iso-8859-1")
-        except gzip.BadGzipFile:
-            document = response.content.decode("iso-8859-1")
-
-        try:
-            parsed = xmltodict.parse(
-                document,
-                dict_constructor=dict,
-                attr_prefix="",
-                cdata_key="text",
-                force_list={"attribute", "id", "refinementField"},
-            )
-        except Exception as e:
-            logger.warning(f"Unable to parse the report for the stream, error: {str(e)}")
-            parsed = {}
-
-        yield from parsed.get("Result", {}).get("Node", [])
+        with open_report_document(response) as document:
+            try:
+                yield from iter_xml_elements(
+                    document,
+                    "Result",
+                    "Node",
+                    attr_prefix="",
+                    cdata_key="text",
+                    force_list={"attribute", "id", "refinementField"},
+                )
+            except ElementTree.ParseError as e:
+                logger.warning(f"Unable to parse the report for the stream, error: {str(e)}")
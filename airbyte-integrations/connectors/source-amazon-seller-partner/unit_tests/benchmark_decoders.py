@@ -0,0 +1,110 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Benchmark of the report decoders over a synthetic gzipped report, measuring the throughput and the peak memory usage of the
+streaming decoders, optionally compared to decompressing and decoding the whole document in memory as they were doing before.
+
+It is not collected by pytest. To run it:
+```
+python -m unit_tests.benchmark_decoders --size-gb 2 --format csv
+python -m unit_tests.benchmark_decoders --size-gb 2 --format xml --in-memory
+```
+"""
+
+import argparse
+import csv
+import gzip
+import os
+import resource
+import tempfile
+import time
+from io import StringIO
+
+import requests
+import xmltodict
+from source_amazon_seller_partner.components import GzipCsvDecoder, GzipXmlDecoder
+
+
+CSV_HEADER = "sku\tasin\tproduct-name\tcondition\tquantity\tprice\n"
+XML_MESSAGE = (
+    "<Message><MessageID>{i}</MessageID><OrderReport><AmazonOrderID>{i:012d}</AmazonOrderID><Item><SKU>SKU-{i}</SKU>"
+    "<Title>Synthetic product {i}</Title><Quantity>{quantity}</Quantity><ItemPrice><Component><Type>Principal</Type>"
+    '<Amount currency="EUR">{price:.2f}</Amount></Component></ItemPrice></Item></OrderReport></Message>\n'
+)
+
+
+def write_report(path: str, report_format: str, size_bytes: int) -> int:
+    """Writes a gzipped report of about size_bytes uncompressed bytes, returns the number of records it holds"""
+    records = 0
+    written = 0
+    with gzip.open(path, "wt", encoding="iso-8859-1", compresslevel=1) as report:
+        if report_format == "csv":
+            written += report.write(CSV_HEADER)
+        else:
+            written += report.write('<?xml version="1.0"?>\n<AmazonEnvelope><Header><DocumentVersion>1.01</DocumentVersion></Header>\n')
+        while written < size_bytes:
+            lines = []
+            for i in range(records, records + 10_000):
+                if report_format == "csv":
+                    lines.append(f"SKU-{i}\tB{i:09d}\tSynthetic product {i}\tNew\t{i % 100}\t{i % 1000 / 7:.2f}\n")
+                else:
+                    lines.append(XML_MESSAGE.format(i=i, quantity=i % 100, price=i % 1000 / 7))
+            written += report.write("".join(lines))
+            records += len(lines)
+        if report_format == "xml":
+            report.write("</AmazonEnvelope>\n")
+    return records
+
+
+def decode_in_memory(response: requests.Response, report_format: str):
+    """Previous implementation: the compressed, the decompressed and the decoded documents are all held in memory"""
+    document = gzip.decompress(response.content).decode("iso-8859-1")
+    if report_format == "csv":
+        yield from csv.DictReader(StringIO(document), delimiter="\t")
+    else:
+        parsed = xmltodict.parse(document, attr_prefix="", cdata_key="value", force_list={"Message"})
+        for report in parsed.get("AmazonEnvelope", {}).get("Message", {}):
+            yield report.get("OrderReport", {})
+
+
+def peak_memory_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Benchmark the decoding of a synthetic gzipped report")
+    parser.add_argument("--size-gb", type=float, default=2, help="uncompressed size of the synthetic report")
+    parser.add_argument("--format", choices=["csv", "xml"], default="csv", help="format of the synthetic report")
+    parser.add_argument("--in-memory", action="store_true", help="decode the report in memory as before instead of streaming it")
+    parsed_args = parser.parse_args(args)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, f"report.{parsed_args.format}.gz")
+        expected_records = write_report(path, parsed_args.format, int(parsed_args.size_gb * 1024**3))
+        print(f"report: {expected_records:,} records, {os.path.getsize(path) / 1024**2:,.0f} MB gzipped")
+        memory_before = peak_memory_mb()
+
+        with open(path, "rb") as body:
+            response = requests.Response()
+            response.status_code = 200
+            response.raw = body
+            if parsed_args.in_memory:
+                records = decode_in_memory(response, parsed_args.format)
+            else:
+                decoder = GzipCsvDecoder if parsed_args.format == "csv" else GzipXmlDecoder
+                records = decoder(parameters={}).decode(response)
+
+            start = time.perf_counter()
+            count = sum(1 for _ in records)
+            elapsed = time.perf_counter() - start
+
+    assert count == expected_records, f"decoded {count} records out of {expected_records}"
+    print(f"{'in memory' if parsed_args.in_memory else 'streaming'}: {elapsed:.1f}s ({count / elapsed:,.0f} records/s)")
+    print(f"peak memory: {peak_memory_mb():,.0f} MB (before decoding: {memory_before:,.0f} MB)")
+
+
+if __name__ == "__main__":
+    main()
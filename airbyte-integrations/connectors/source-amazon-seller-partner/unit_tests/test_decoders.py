@@ -0,0 +1,110 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import gzip
+import io
+import os
+
+import pytest
+import requests
+import xmltodict
+from source_amazon_seller_partner.components import (
+    GetXmlBrowseTreeDataDecoder,
+    GzipCsvDecoder,
+    GzipJsonDecoder,
+    GzipXmlDecoder,
+    SellerFeedbackReportsGzipCsvDecoder,
+)
+from source_amazon_seller_partner.components.decoder import DOWNLOAD_CHUNK_SIZE
+
+
+def build_response(body: bytes, compressed: bool) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(gzip.compress(body) if compressed else body)
+    return response
+
+
+@pytest.mark.parametrize("compressed", (True, False))
+def test_gzip_csv_decoder(compressed):
+    body = "sku\tname\n1\tcaf\xe9\n2\t\"multi\nline\"\n".encode("iso-8859-1")
+    records = list(GzipCsvDecoder(parameters={}).decode(build_response(body, compressed)))
+    assert records == [{"sku": "1", "name": "caf\xe9"}, {"sku": "2", "name": "multi\nline"}]
+
+
+def test_gzip_csv_decoder_reads_lazily():
+    body = b"sku\tname\n" + b"".join(b"%d\t%s\n" % (i, os.urandom(16).hex().encode()) for i in range(200_000))
+    response = build_response(body, compressed=True)
+    records = GzipCsvDecoder(parameters={}).decode(response)
+    assert next(records)["sku"] == "0"
+    # only the first chunks of the compressed body have been read
+    assert response.raw.tell() <= 2 * DOWNLOAD_CHUNK_SIZE < len(response.raw.getvalue())
+
+
+@pytest.mark.parametrize("compressed", (True, False))
+def test_seller_feedback_decoder(compressed):
+    body = "Datum\tBewertung\tKommentare\tAntwort\tBestellnummer\tE-Mail\n2024-01-01\t5\tgood\t\t1\te\n".encode("iso-8859-1")
+    records = list(SellerFeedbackReportsGzipCsvDecoder(parameters={}).decode(build_response(body, compressed)))
+    assert records == [{"date": "2024-01-01", "rating": "5", "comments": "good", "response": "", "order_id": "1", "rater_email": "e"}]
+
+
+@pytest.mark.parametrize("compressed", (True, False))
+def test_gzip_xml_decoder(compressed):
+    body = (
+        b'<?xml version="1.0"?>\n<AmazonEnvelope><Header><DocumentVersion>1.01</DocumentVersion></Header>'
+        b'<Message><MessageID>1</MessageID><OrderReport><AmazonOrderID>1</AmazonOrderID><Item><Price type="Principal">1.5</Price></Item>'
+        b"</OrderReport></Message><Message><MessageID>2</MessageID><OrderReport><AmazonOrderID>2</AmazonOrderID></OrderReport></Message>"
+        b"</AmazonEnvelope>"
+    )
+    records = list(GzipXmlDecoder(parameters={}).decode(build_response(body, compressed)))
+    assert records == [
+        {"AmazonOrderID": "1", "Item": {"Price": {"type": "Principal", "value": "1.5"}}},
+        {"AmazonOrderID": "2"},
+    ]
+
+
+def test_gzip_xml_decoder_invalid_document():
+    body = b"<AmazonEnvelope><Message><OrderReport><AmazonOrderID>1</AmazonOrderID></OrderReport></Message><Message>"
+    assert list(GzipXmlDecoder(parameters={}).decode(build_response(body, compressed=True))) == [{"AmazonOrderID": "1"}]
+
+
+def test_browse_tree_decoder():
+    body = (
+        b"<Result><Node><browseNodeId>1</browseNodeId><childNodes count=\"1\"><id>2</id></childNodes></Node>"
+        b"<Node><browseNodeId>2</browseNodeId></Node></Result>"
+    )
+    records = list(GetXmlBrowseTreeDataDecoder(parameters={}).decode(build_response(body, compressed=True)))
+    assert records == [{"browseNodeId": "1", "childNodes": {"count": "1", "id": ["2"]}}, {"browseNodeId": "2"}]
+
+
+def test_browse_tree_decoder_with_namespaces():
+    body = (
+        b'<?xml version="1.0"?>\n<Result xmlns="http://www.amazon.com/browse" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">'
+        b'<Node><browseNodeId>1</browseNodeId><browseNodeAttributes xsi:type="attributes" count="1"><attribute name="a">x</attribute>'
+        b'</browseNodeAttributes></Node><Node xmlns:ext="http://www.amazon.com/ext"><browseNodeId>2</browseNodeId><ext:label>b</ext:label>'
+        b"</Node></Result>"
+    )
+    records = list(GetXmlBrowseTreeDataDecoder(parameters={}).decode(build_response(body, compressed=True)))
+    # namespaced names are kept with the prefixes of the document, as xmltodict does
+    assert records == [
+        {"browseNodeId": "1", "browseNodeAttributes": {"xsi:type": "attributes", "count": "1", "attribute": [{"name": "a", "text": "x"}]}},
+        {"xmlns:ext": "http://www.amazon.com/ext", "browseNodeId": "2", "ext:label": "b"},
+    ]
+    parsed = xmltodict.parse(body, attr_prefix="", cdata_key="text", force_list={"attribute", "id", "refinementField"})
+    assert records == parsed["Result"]["Node"]
+
+
+def test_gzip_xml_decoder_with_namespaces():
+    body = (
+        b'<AmazonEnvelope xmlns="http://www.amazon.com/envelope" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+        b'xsi:noNamespaceSchemaLocation="amzn-envelope.xsd"><Message><OrderReport><AmazonOrderID>1</AmazonOrderID></OrderReport></Message>'
+        b"</AmazonEnvelope>"
+    )
+    assert list(GzipXmlDecoder(parameters={}).decode(build_response(body, compressed=True))) == [{"AmazonOrderID": "1"}]
+
+
+@pytest.mark.parametrize("compressed", (True, False))
+def test_gzip_json_decoder(compressed):
+    records = list(GzipJsonDecoder(parameters={}).decode(build_response(b'{"forecastByAsin": []}', compressed)))
+    assert records == [{"forecastByAsin": []}]
@@ -2,14 +2,18 @@
 
 
 import logging
+import re
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime
 from io import IOBase
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
+from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Pattern, Tuple, Union
 
 import pytz
 from azure.core.credentials import AccessToken, TokenCredential
 from azure.core.exceptions import ResourceNotFoundError
-from azure.storage.blob import BlobServiceClient, ContainerClient
+from azure.storage.blob import BlobPrefix, BlobServiceClient, ContainerClient
 from smart_open import open
+from wcmatch import fnmatch, glob
 
 from airbyte_cdk import AirbyteTracedException, FailureType
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
@@ -70,8 +74,73 @@ class AzureOauth2Authenticator(Oauth2Authenticator, TokenCredential):
         return AccessToken(token=self.get_access_token(), expires_on=7952342400)
 
 
+class BlobGlobMatcher:
+    """
+    Matches blob names against globs that are compiled once, with the same semantics as `file_matches_globs`,
+    and tells whether a virtual directory can contain any matching blob.
+    """
+
+    def __init__(self, globs: List[str]):
+        self._patterns = [re.compile(pattern) for pattern in glob.translate(globs, flags=glob.GLOBSTAR)[0]]
+        self._segment_patterns = [self._compile_segments(glob_pattern) for glob_pattern in globs]
+
+    @staticmethod
+    def _compile_segments(glob_pattern: str) -> List[Optional[Pattern]]:
+        # None stands for a `**` segment, which matches any number of directories
+        return [None if segment == "**" else re.compile(fnmatch.translate(segment)[0][0]) for segment in glob_pattern.split("/")]
+
+    def matches(self, blob_name: str) -> bool:
+        return any(pattern.match(blob_name) for pattern in self._patterns)
+
+    def may_match_in(self, directory: str) -> bool:
+        """
+        Returns False only if no blob under the directory (a prefix ending with the delimiter) can match any of the globs.
+        """
+        directory_segments = directory.rstrip("/").split("/")
+        return any(self._may_match_in(directory_segments, segment_patterns) for segment_patterns in self._segment_patterns)
+
+    @staticmethod
+    def _may_match_in(directory_segments: List[str], segment_patterns: List[Optional[Pattern]]) -> bool:
+        for depth, directory_segment in enumerate(directory_segments):
+            if depth < len(segment_patterns) and segment_patterns[depth] is None:
+                return True
+            # the last segment of the glob matches the blob name itself
+            if depth >= len(segment_patterns) - 1 or not segment_patterns[depth].match(directory_segment):
+                return False
+        return True
+
+    def may_match_at_any_depth_in(self, directory: str) -> bool:
+        """
+        Returns True if a glob reaches a `**` segment within the directory, so that none of its subdirectories can be pruned.
+        """
+        if directory and not directory.endswith("/"):
+            return False
+        directory_segments = directory.split("/")[:-1]
+        return any(self._reaches_globstar_in(directory_segments, segment_patterns) for segment_patterns in self._segment_patterns)
+
+    @staticmethod
+    def _reaches_globstar_in(directory_segments: List[str], segment_patterns: List[Optional[Pattern]]) -> bool:
+        for depth, segment_pattern in enumerate(segment_patterns[: len(directory_segments) + 1]):
+            if segment_pattern is None:
+                return True
+            if (
+                depth == len(directory_segments)
+                or depth == len(segment_patterns) - 1
+                or not segment_pattern.match(directory_segments[depth])
+            ):
+                return False
+        return False
+
+
 class SourceAzureBlobStorageStreamReader(AbstractFileBasedStreamReader):
     _credentials = None
+    # Maximum number of virtual directories listed at the same time
+    LISTING_CONCURRENCY = 8
+    # Blobs are read in parts of DOWNLOAD_BUFFER_SIZE, each downloaded as ranged requests
+    # of DOWNLOAD_CHUNK_SIZE over up to DOWNLOAD_MAX_CONCURRENCY connections
+    DOWNLOAD_BUFFER_SIZE = 32 * 1024 * 1024
+    DOWNLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+    DOWNLOAD_MAX_CONCURRENCY = 8
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -99,7 +168,12 @@ class SourceAzureBlobStorageStreamReader(AbstractFileBasedStreamReader):
 
     @property
     def azure_blob_service_client(self):
-        return BlobServiceClient(self.account_url, credential=self._credentials)
+        return BlobServiceClient(
+            self.account_url,
+            credential=self._credentials,
+            max_single_get_size=self.DOWNLOAD_CHUNK_SIZE,
+            max_chunk_get_size=self.DOWNLOAD_CHUNK_SIZE,
+        )
 
     @property
     def azure_credentials(self) -> Union[str, AzureOauth2Authenticator, AzureClientCredentialsAuthenticator]:
@@ -128,21 +202,77 @@ class SourceAzureBlobStorageStreamReader(AbstractFileBasedStreamReader):
         prefix: Optional[str],
         logger: logging.Logger,
     ) -> Iterable[RemoteFile]:
+        """
+        Virtual directories are listed one level at a time with the `/` delimiter, starting from the prefixes of the globs.
+        Directories that cannot contain a blob matching any glob are not listed, and up to LISTING_CONCURRENCY directories are
+        listed at the same time. Once a glob reaches `**` within a directory, its whole subtree is listed flat instead.
+        """
         prefixes = [prefix] if prefix else self.get_prefixes_from_globs(globs)
-        prefixes = prefixes or [None]
+        # a prefix that starts with another one is listed as part of it
+        directory_queue = []
+        for prefix in sorted(prefixes or [""]):
+            if not directory_queue or not prefix.startswith(directory_queue[-1]):
+                directory_queue.append(prefix)
+
+        container_client = self.azure_container_client
+        glob_matcher = BlobGlobMatcher(globs)
+        start_date = datetime.strptime(self.config.start_date, self.DATE_TIME_FORMAT) if self.config.start_date else None
+        seen = set()
+        executor = ThreadPoolExecutor(max_workers=self.LISTING_CONCURRENCY, thread_name_prefix="azure-blob-listing")
+        pending_listings: Dict[Future, str] = {}
         try:
-            for prefix in prefixes:
-                for blob in self.azure_container_client.list_blobs(name_starts_with=prefix):
-                    remote_file = RemoteFile(uri=blob.name, last_modified=blob.last_modified.astimezone(pytz.utc).replace(tzinfo=None))
-                    yield from self.filter_files_by_globs_and_start_date([remote_file], globs)
+            while directory_queue or pending_listings:
+                while directory_queue and len(pending_listings) < self.LISTING_CONCURRENCY:
+                    directory = directory_queue.pop(0)
+                    listing = executor.submit(self._list_directory, container_client, directory, glob_matcher, start_date)
+                    pending_listings[listing] = directory
+
+                done, _ = wait(pending_listings, return_when=FIRST_COMPLETED)
+                for listing in done:
+                    del pending_listings[listing]
+                    remote_files, subdirectories = listing.result()
+                    directory_queue.extend(subdirectories)
+                    for remote_file in remote_files:
+                        if remote_file.uri not in seen:
+                            seen.add(remote_file.uri)
+                            yield remote_file
         except ResourceNotFoundError as e:
             raise AirbyteTracedException(failure_type=FailureType.config_error, internal_message=e.message, message=e.reason or e.message)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _list_directory(
+        container_client: ContainerClient, directory: str, glob_matcher: BlobGlobMatcher, start_date: Optional[datetime]
+    ) -> Tuple[List[RemoteFile], List[str]]:
+        """
+        Returns the blobs under the directory that match the globs and start date, and the subdirectories that
+        may contain matching blobs. Directories whose subtree cannot be pruned are listed without the delimiter.
+        """
+        remote_files, subdirectories = [], []
+        if glob_matcher.may_match_at_any_depth_in(directory):
+            items = container_client.list_blobs(name_starts_with=directory or None)
+        else:
+            items = container_client.walk_blobs(name_starts_with=directory or None, delimiter="/")
+        for item in items:
+            if isinstance(item, BlobPrefix):
+                if glob_matcher.may_match_in(item.name):
+                    subdirectories.append(item.name)
+            elif glob_matcher.matches(item.name):
+                last_modified = item.last_modified.astimezone(pytz.utc).replace(tzinfo=None)
+                if not start_date or last_modified >= start_date:
+                    remote_files.append(RemoteFile(uri=item.name, last_modified=last_modified))
+        return remote_files, subdirectories
 
     def open_file(self, file: RemoteFile, mode: FileReadMode, encoding: Optional[str], logger: logging.Logger) -> IOBase:
         try:
             result = open(
                 f"azure://{self.config.azure_blob_storage_container_name}/{file.uri}",
-                transport_params={"client": self.azure_blob_service_client},
+                transport_params={
+                    "client": self.azure_blob_service_client,
+                    "buffer_size": self.DOWNLOAD_BUFFER_SIZE,
+                    "max_concurrency": self.DOWNLOAD_MAX_CONCURRENCY,
+                },
                 mode=mode.value,
                 encoding=encoding,
             )
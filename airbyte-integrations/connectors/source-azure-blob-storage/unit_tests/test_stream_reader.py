@@ -4,13 +4,16 @@
 import datetime
 import logging
 from typing import Dict, Union
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 import freezegun
 import pytest
-from azure.storage.blob import BlobProperties, ContainerClient
+from azure.storage.blob import BlobPrefix, BlobProperties, ContainerClient
 from source_azure_blob_storage.spec import SourceAzureBlobStorageSpec
-from source_azure_blob_storage.stream_reader import AzureOauth2Authenticator, SourceAzureBlobStorageStreamReader
+from source_azure_blob_storage.stream_reader import AzureOauth2Authenticator, BlobGlobMatcher, SourceAzureBlobStorageStreamReader
+
+from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 
 
 logger = logging.Logger("")
@@ -67,3 +70,129 @@ def test_stream_reader_files_read_and_filter_by_date():
         ]
         files = list(reader.get_matching_files(globs=["**"], prefix=None, logger=logger))
         assert len(files) == 2
+
+
+def create_reader() -> SourceAzureBlobStorageStreamReader:
+    reader = SourceAzureBlobStorageStreamReader()
+    reader.config = SourceAzureBlobStorageSpec(
+        azure_blob_storage_endpoint="https://teststorage.blob.core.windows.net",
+        azure_blob_storage_account_name="account1",
+        azure_blob_storage_container_name="airbyte-source-azure-blob-storage-test",
+        credentials={"auth_type": "storage_account_key", "azure_blob_storage_account_key": "key1"},
+        streams=[],
+    )
+    return reader
+
+
+BLOB_NAMES = [
+    "root.csv",
+    "data/a.csv",
+    "data/2023/01/b.csv",
+    "data/2024/01/c.csv",
+    "data/2024/01/c.json",
+    "data/2024/02/d.csv",
+    "data/2024/02/raw/e.csv",
+    "data/.hidden/f.csv",
+    "logs/2024/01/g.csv",
+]
+
+
+def walk_blobs(name_starts_with=None, delimiter="/"):
+    prefix = name_starts_with or ""
+    subdirectories = []
+    for name in BLOB_NAMES:
+        if not name.startswith(prefix):
+            continue
+        separator = name.find(delimiter, len(prefix))
+        if separator == -1:
+            yield BlobProperties(name=name, **{"Last-Modified": datetime.datetime(2024, 1, 1)})
+        elif name[: separator + 1] not in subdirectories:
+            subdirectories.append(name[: separator + 1])
+    for subdirectory in subdirectories:
+        yield BlobPrefix(prefix=subdirectory)
+
+
+def list_blobs(name_starts_with=None):
+    for name in BLOB_NAMES:
+        if name.startswith(name_starts_with or ""):
+            yield BlobProperties(name=name, **{"Last-Modified": datetime.datetime(2024, 1, 1)})
+
+
+@pytest.mark.parametrize(
+    "globs, expected_walked_directories, expected_flat_listed_directories",
+    [
+        (["**"], [], [""]),
+        (["data/2024/*/*.csv"], ["data/2024/", "data/2024/01/", "data/2024/02/"], []),
+        (["data/*/01/*.csv"], ["data/", "data/2023/", "data/2024/", "data/2023/01/", "data/2024/01/"], []),
+        (["*/2024/01/*.csv"], ["", "data/", "logs/", "data/2024/", "logs/2024/", "data/2024/01/", "logs/2024/01/"], []),
+        (["*/**/*.csv"], [""], ["data/", "logs/"]),
+        (["data/2024/**/*.csv", "data/*.csv"], ["data/"], ["data/2024/"]),
+        (["data/a*.csv", "data/2024/01/c.csv"], ["data/a", "data/2024/01/c.csv"], []),
+        (["*.csv"], [""], []),
+    ],
+)
+def test_get_matching_files_prunes_directories(globs, expected_walked_directories, expected_flat_listed_directories):
+    reader = create_reader()
+    with patch.object(ContainerClient, "walk_blobs", side_effect=walk_blobs) as mock_walk_blobs, patch.object(
+        ContainerClient, "list_blobs", side_effect=list_blobs
+    ) as mock_list_blobs:
+        files = list(reader.get_matching_files(globs=globs, prefix=None, logger=logger))
+
+    expected_files = AbstractFileBasedStreamReader.filter_files_by_globs_and_start_date(
+        reader, [RemoteFile(uri=name, last_modified=datetime.datetime(2024, 1, 1)) for name in BLOB_NAMES], globs
+    )
+    assert sorted(file.uri for file in files) == sorted(file.uri for file in expected_files)
+    walked_directories = [call.kwargs["name_starts_with"] or "" for call in mock_walk_blobs.call_args_list]
+    assert sorted(walked_directories) == sorted(expected_walked_directories)
+    flat_listed_directories = [call.kwargs["name_starts_with"] or "" for call in mock_list_blobs.call_args_list]
+    assert sorted(flat_listed_directories) == sorted(expected_flat_listed_directories)
+
+
+@pytest.mark.parametrize(
+    "directory, expected",
+    [
+        ("data/", True),
+        ("data/2024/", True),
+        ("data/2024/01/", False),
+        ("logs/", False),
+        ("data/.hidden/", False),
+    ],
+)
+def test_blob_glob_matcher_may_match_in(directory, expected):
+    assert BlobGlobMatcher(["data/*/*.csv"]).may_match_in(directory) == expected
+
+
+@pytest.mark.parametrize(
+    "directory, expected",
+    [
+        ("", False),
+        ("data/", False),
+        ("data/2024/", True),
+        ("data/2024/01/", True),
+        ("logs/2024/", False),
+        ("data/2024", False),
+    ],
+)
+def test_blob_glob_matcher_may_match_at_any_depth_in(directory, expected):
+    assert BlobGlobMatcher(["data/*/**/*.csv"]).may_match_at_any_depth_in(directory) == expected
+
+
+def test_open_file_downloads_in_parallel_ranges():
+    reader = create_reader()
+    with patch("source_azure_blob_storage.stream_reader.open") as mock_open, patch(
+        "source_azure_blob_storage.stream_reader.BlobServiceClient"
+    ) as mock_blob_service_client:
+        reader.open_file(RemoteFile(uri="data/a.csv", last_modified=datetime.datetime(2024, 1, 1)), FileReadMode.READ, None, logger)
+
+    mock_blob_service_client.assert_called_once_with(
+        "https://teststorage.blob.core.windows.net",
+        credential=ANY,
+        max_single_get_size=4 * 1024 * 1024,
+        max_chunk_get_size=4 * 1024 * 1024,
+    )
+    mock_open.assert_called_once_with(
+        "azure://airbyte-source-azure-blob-storage-test/data/a.csv",
+        transport_params={"client": mock_blob_service_client.return_value, "buffer_size": 32 * 1024 * 1024, "max_concurrency": 8},
+        mode="r",
+        encoding=None,
+    )
@@ -3,10 +3,10 @@
 #
 
 import datetime
-from multiprocessing import current_process
 from typing import Dict, List
 
 from mimesis import Datetime, Numeric
+from mimesis.random import Random
 
 from airbyte_cdk.models import AirbyteRecordMessage, Type
 
@@ -25,17 +25,19 @@ class PurchaseGenerator:
         Yes, they *should* be able to be instance variables on this class, which should only instantiated once-per-worker, but that's not quite the case:
         * relying only on prepare as a pool initializer fails because we are calling the parent process's method, not the fork
         * Calling prepare() as part of generate() (perhaps checking if self.person is set) and then `print(self, current_process()._identity, current_process().pid)` reveals multiple object IDs in the same process, resetting the internal random counters
-        """
 
-        seed_with_offset = self.seed
-        if self.seed is not None and len(current_process()._identity) > 0:
-            seed_with_offset = self.seed + current_process()._identity[0]
+        All the generators share a single random generator, which generate() reseeds for every user when a seed is set.
+        """
 
+        global rng
         global dt
         global numeric
 
-        dt = Datetime(seed=seed_with_offset)
-        numeric = Numeric(seed=seed_with_offset)
+        rng = Random()
+        dt = Datetime()
+        numeric = Numeric()
+        for provider in (dt, numeric):
+            provider.random = rng
 
     def random_date_in_range(
         self, start_date: datetime.datetime, end_date: datetime.datetime = datetime.datetime.now()
@@ -48,11 +50,20 @@ class PurchaseGenerator:
         random_date = start_date + datetime.timedelta(days=random_number_of_days)
         return random_date
 
+    def generate_slice(self, start: int, end: int) -> List[List[AirbyteMessageWithCachedJSON]]:
+        """
+        Generate the purchases of the users of ids in [start, end), a whole slice being generated by one worker
+        """
+        return [self.generate(user_id) for user_id in range(start, end)]
+
     def generate(self, user_id: int) -> List[Dict]:
         """
         Because we are doing this work in parallel processes, we need a deterministic way to know what a purchase's ID should be given on the input of a user_id.
         tldr; Every 10 user_ids produce 10 purchases.  User ID x5 has no purchases, User ID mod x7 has 2, and everyone else has 1
         """
+        # seeding every user rather than every worker makes the generated purchases independent of the number of workers
+        if self.seed is not None:
+            rng.seed(f"{self.seed}:{user_id}")
 
         purchases: List[Dict] = []
         last_user_id_digit = int(repr(user_id)[-1])
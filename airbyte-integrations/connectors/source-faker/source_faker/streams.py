@@ -11,7 +11,7 @@ from airbyte_cdk.sources.streams import IncrementalMixin, Stream
 
 from .purchase_generator import PurchaseGenerator
 from .user_generator import UserGenerator
-from .utils import format_airbyte_time, generate_estimate, read_json
+from .utils import format_airbyte_time, generate_estimate, imap_in_order, read_json
 
 
 class Products(Stream, IncrementalMixin):
@@ -95,7 +95,8 @@ class Users(Stream, IncrementalMixin):
     def read_records(self, **kwargs) -> Iterable[Mapping[str, Any]]:
         """
         This is a multi-process implementation of read_records.
-        We make N workers (where N is the number of available CPUs) and spread out the CPU-bound work of generating records and serializing them to JSON
+        We make N workers (where N is the number of available CPUs) and spread out the CPU-bound work of generating records and serializing them to JSON.
+        Several slices are generated ahead of the one being emitted, so the workers keep generating while the records are written out.
         """
 
         if "updated_at" in self.state and not self.always_updated:
@@ -107,18 +108,14 @@ class Users(Stream, IncrementalMixin):
         yield generate_estimate(self.name, self.count, median_record_byte_size)
 
         loop_offset = 0
+        slices = ((start, min(start + self.records_per_slice, self.count)) for start in range(0, self.count, self.records_per_slice))
         with Pool(initializer=self.generator.prepare, processes=self.parallelism) as pool:
-            while loop_offset < self.count:
-                records_remaining_this_loop = min(self.records_per_slice, (self.count - loop_offset))
-                users = pool.map(self.generator.generate, range(loop_offset, loop_offset + records_remaining_this_loop))
+            for users in imap_in_order(pool, self.generator.generate_slice, slices, self.parallelism * 2):
                 for user in users:
                     updated_at = user.record.data["updated_at"]
                     loop_offset += 1
                     yield user
 
-                if records_remaining_this_loop == 0:
-                    break
-
                 self.state = {"seed": self.seed, "updated_at": updated_at, "loop_offset": loop_offset}
 
             self.state = {"seed": self.seed, "updated_at": updated_at, "loop_offset": loop_offset}
@@ -155,7 +152,8 @@ class Purchases(Stream, IncrementalMixin):
     def read_records(self, **kwargs) -> Iterable[Mapping[str, Any]]:
         """
         This is a multi-process implementation of read_records.
-        We make N workers (where N is the number of available CPUs) and spread out the CPU-bound work of generating records and serializing them to JSON
+        We make N workers (where N is the number of available CPUs) and spread out the CPU-bound work of generating records and serializing them to JSON.
+        Several slices are generated ahead of the one being emitted, so the workers keep generating while the records are written out.
         """
 
         if "updated_at" in self.state and not self.always_updated:
@@ -168,17 +166,14 @@ class Purchases(Stream, IncrementalMixin):
         yield generate_estimate(self.name, (self.count) * 1.3, median_record_byte_size)
 
         loop_offset = 0
+        slices = ((start, min(start + self.records_per_slice, self.count)) for start in range(0, self.count, self.records_per_slice))
         with Pool(initializer=self.generator.prepare, processes=self.parallelism) as pool:
-            while loop_offset < self.count:
-                records_remaining_this_loop = min(self.records_per_slice, (self.count - loop_offset))
-                carts = pool.map(self.generator.generate, range(loop_offset, loop_offset + records_remaining_this_loop))
+            for carts in imap_in_order(pool, self.generator.generate_slice, slices, self.parallelism * 2):
                 for purchases in carts:
                     loop_offset += 1
                     for purchase in purchases:
                         updated_at = purchase.record.data["updated_at"]
                         yield purchase
-                if records_remaining_this_loop == 0:
-                    break
 
                 self.state = {"seed": self.seed, "updated_at": updated_at, "loop_offset": loop_offset}
 
@@ -3,10 +3,11 @@
 #
 
 import datetime
-from multiprocessing import current_process
+from typing import List
 
 from mimesis import Address, Datetime, Person
 from mimesis.locales import Locale
+from mimesis.random import Random
 
 from airbyte_cdk.models import AirbyteRecordMessage, Type
 
@@ -25,21 +26,33 @@ class UserGenerator:
         Yes, they *should* be able to be instance variables on this class, which should only instantiated once-per-worker, but that's not quite the case:
         * relying only on prepare as a pool initializer fails because we are calling the parent process's method, not the fork
         * Calling prepare() as part of generate() (perhaps checking if self.person is set) and then `print(self, current_process()._identity, current_process().pid)` reveals multiple object IDs in the same process, resetting the internal random counters
-        """
 
-        seed_with_offset = self.seed
-        if self.seed is not None and len(current_process()._identity) > 0:
-            seed_with_offset = self.seed + current_process()._identity[0]
+        All the generators share a single random generator, which generate() reseeds for every user when a seed is set.
+        """
 
+        global rng
         global person
         global address
         global dt
 
-        person = Person(locale=Locale.EN, seed=seed_with_offset)
-        address = Address(locale=Locale.EN, seed=seed_with_offset)
-        dt = Datetime(seed=seed_with_offset)
+        rng = Random()
+        person = Person(locale=Locale.EN)
+        address = Address(locale=Locale.EN)
+        dt = Datetime()
+        for provider in (person, address, dt):
+            provider.random = rng
+
+    def generate_slice(self, start: int, end: int) -> List[AirbyteMessageWithCachedJSON]:
+        """
+        Generate the users of ids in [start, end), a whole slice being generated by one worker
+        """
+        return [self.generate(user_id) for user_id in range(start, end)]
 
     def generate(self, user_id: int):
+        # seeding every user rather than every worker makes the generated users independent of the number of workers
+        if self.seed is not None:
+            rng.seed(f"{self.seed}:{user_id}")
+
         # faker doesn't always produce unique email addresses, so to enforce uniqueness, we will append the user_id to the prefix
         email_parts = person.email().split("@")
         email = f"{email_parts[0]}+{user_id + 1}@{email_parts[1]}"
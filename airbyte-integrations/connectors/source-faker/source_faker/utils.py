@@ -4,6 +4,9 @@
 
 import datetime
 import json
+from collections import deque
+from multiprocessing.pool import Pool
+from typing import Any, Callable, Iterable, Iterator, Tuple
 
 from airbyte_cdk.models import AirbyteEstimateTraceMessage, AirbyteTraceMessage, EstimateType, TraceType
 
@@ -31,3 +34,18 @@ def generate_estimate(stream_name: str, total: int, bytes_per_row: int):
         type=EstimateType.STREAM, name=stream_name, row_estimate=round(total), byte_estimate=round(total * bytes_per_row)
     )
     return AirbyteTraceMessage(type=TraceType.ESTIMATE, emitted_at=emitted_at, estimate=estimate_message)
+
+
+def imap_in_order(pool: Pool, func: Callable, args_iterable: Iterable[Tuple], max_in_flight: int) -> Iterator[Any]:
+    """
+    Like `Pool.imap`, yield the results of func in the order of its arguments while the next tasks are being processed by the workers.
+    Unlike it, at most max_in_flight tasks are submitted ahead of the result being consumed, so that results do not pile up in memory
+    when the consumer is slower than the workers.
+    """
+    in_flight = deque()
+    for args in args_iterable:
+        in_flight.append(pool.apply_async(func, args))
+        if len(in_flight) >= max_in_flight:
+            yield in_flight.popleft().get()
+    while in_flight:
+        yield in_flight.popleft().get()
@@ -6,6 +6,7 @@ import jsonschema
 import pytest
 from source_faker import SourceFaker
 
+from airbyte_cdk.entrypoint import AirbyteEntrypoint
 from airbyte_cdk.models import AirbyteMessage, ConfiguredAirbyteCatalog, Type
 
 
@@ -262,8 +263,31 @@ def test_read_with_seed():
     iterator = source.read(logger, config, catalog, state)
 
     records = [row for row in iterator if row.type is Type.RECORD]
-    assert records[0].record.data["occupation"] == "Sheriff Principal"
-    assert records[0].record.data["email"] == "alleged2069+1@example.com"
+    assert records[0].record.data["occupation"] == "Investment Strategist"
+    assert records[0].record.data["email"] == "ozone1987+1@example.com"
+
+
+@pytest.mark.parametrize("stream_name", ["users", "purchases"])
+def test_read_with_seed_does_not_depend_on_parallelism(stream_name):
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            {
+                "stream": {"name": stream_name, "json_schema": {}, "supported_sync_modes": ["incremental"]},
+                "sync_mode": "incremental",
+                "destination_sync_mode": "overwrite",
+            }
+        ]
+    )
+
+    def read_data(parallelism):
+        config = {"count": 250, "seed": 100, "records_per_slice": 30, "parallelism": parallelism}
+        iterator = SourceFaker().read(logger, config, catalog, {})
+        # updated_at is the time at which the record was generated
+        return [{**row.record.data, "updated_at": None} for row in iterator if row.type is Type.RECORD]
+
+    records = read_data(parallelism=1)
+    assert records and len({record["id"] for record in records}) == len(records)
+    assert records == read_data(parallelism=3)
 
 
 def test_ensure_no_purchases_without_users():
@@ -278,3 +302,35 @@ def test_ensure_no_purchases_without_users():
         state = {}
         iterator = source.read(logger, config, catalog, state)
         iterator.__next__()
+
+
+@pytest.mark.parametrize("stream_name", ["users", "purchases"])
+def test_read_counts_every_record_in_state_stats(stream_name):
+    source = SourceFaker()
+    config = {"count": 250, "records_per_slice": 30, "parallelism": 1}
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            {
+                "stream": {"name": "users", "json_schema": {}, "supported_sync_modes": ["incremental"]},
+                "sync_mode": "incremental",
+                "destination_sync_mode": "overwrite",
+            },
+            {
+                "stream": {"name": "purchases", "json_schema": {}, "supported_sync_modes": ["incremental"]},
+                "sync_mode": "incremental",
+                "destination_sync_mode": "overwrite",
+            },
+        ]
+    )
+    entrypoint = AirbyteEntrypoint(source)
+    iterator = entrypoint.read(source.spec(logger), config, catalog, {})
+
+    record_count, state_record_counts = 0, []
+    for row in iterator:
+        if row.type is Type.RECORD and row.record.stream == stream_name:
+            record_count += 1
+        if row.type is Type.STATE and row.state.stream.stream_descriptor.name == stream_name:
+            state_record_counts.append(row.state.sourceStats.recordCount)
+
+    assert record_count > 0
+    assert sum(state_record_counts) == record_count
@@ -46,8 +46,10 @@ def get_stream_name(blob):
 
 class GCSRemoteFile(RemoteFile):
     """
-    Extends RemoteFile instance with displayed_uri attribute.
+    Extends RemoteFile instance with displayed_uri and blob_name attributes.
     displayed_uri is being used by Cursor to identify files with temporal local path in their uri attribute.
+    blob_name is the name of the object in the bucket, used to sign its URL when the file is opened.
     """
 
     displayed_uri: str = None
+    blob_name: str = None
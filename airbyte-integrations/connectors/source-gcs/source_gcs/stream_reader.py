@@ -4,9 +4,10 @@
 import itertools
 import json
 import logging
+import shutil
 import tempfile
 from datetime import datetime, timedelta
-from io import IOBase, StringIO
+from io import IOBase
 from typing import Iterable, List, Optional
 
 import pytz
@@ -35,6 +36,9 @@ class SourceGCSStreamReader(AbstractFileBasedStreamReader):
     Stream reader for Google Cloud Storage (GCS).
     """
 
+    # Non-seekable files (e.g. compressed ones) are buffered in memory up to this size, and spill to a temporary file beyond it
+    SPOOLED_FILE_MAX_SIZE = 16 * 1024 * 1024
+
     def __init__(self):
         super().__init__()
         self._gcs_client = None
@@ -91,20 +95,27 @@ class SourceGCSStreamReader(AbstractFileBasedStreamReader):
             if not prefixes:
                 prefixes = [""]
 
-            for prefix, glob in itertools.product(prefixes, globs):
-                bucket = self.gcs_client.get_bucket(self.config.bucket)
+            bucket = self.gcs_client.get_bucket(self.config.bucket)
+            listed_blob_names = set()
+            for prefix, glob in itertools.product(self._collapse_prefixes(prefixes), globs):
                 blobs = bucket.list_blobs(prefix=prefix, match_glob=glob)
                 for blob in blobs:
+                    # the same blob can match several globs
+                    if blob.name in listed_blob_names:
+                        continue
+                    listed_blob_names.add(blob.name)
+
                     last_modified = blob.updated.astimezone(pytz.utc).replace(tzinfo=None)
 
                     if not start_date or last_modified >= start_date:
                         if self.config.credentials.auth_type == "Client":
                             uri = f"gs://{blob.bucket.name}/{blob.name}"
                         else:
-                            uri = blob.generate_signed_url(expiration=timedelta(days=7), version="v4")
+                            # the URL is signed when the file gets opened, see open_file
+                            uri = blob.public_url
 
                         file_extension = ".".join(blob.name.split(".")[1:])
-                        remote_file = GCSRemoteFile(uri=uri, last_modified=last_modified, mime_type=file_extension)
+                        remote_file = GCSRemoteFile(uri=uri, last_modified=last_modified, mime_type=file_extension, blob_name=blob.name)
 
                         if file_extension == "zip":
                             yield from ZipHelper(blob, remote_file, self.tmp_dir).get_gcs_remote_files()
@@ -113,6 +124,23 @@ class SourceGCSStreamReader(AbstractFileBasedStreamReader):
         except Exception as exc:
             self._handle_file_listing_error(exc, prefix, logger)
 
+    @staticmethod
+    def _collapse_prefixes(prefixes: Iterable[str]) -> List[str]:
+        """
+        Drop the prefixes that are already covered by a shorter prefix, so no blob is listed more than once per glob.
+        """
+        collapsed_prefixes: List[str] = []
+        for prefix in sorted(set(prefixes)):
+            if not collapsed_prefixes or not prefix.startswith(collapsed_prefixes[-1]):
+                collapsed_prefixes.append(prefix)
+        return collapsed_prefixes
+
+    def _get_file_url(self, file: GCSRemoteFile) -> str:
+        if file.blob_name is None or self.config.credentials.auth_type == "Client":
+            return file.uri
+        blob = self.gcs_client.bucket(self.config.bucket).blob(file.blob_name)
+        return blob.generate_signed_url(expiration=timedelta(days=7), version="v4")
+
     def _handle_file_listing_error(self, exc: Exception, prefix: str, logger: logging.Logger):
         logger.error(f"Error while listing files: {str(exc)}")
         raise ErrorListingFiles(
@@ -137,12 +165,32 @@ class SourceGCSStreamReader(AbstractFileBasedStreamReader):
 
         try:
             result = smart_open.open(
-                file.uri, mode=mode.value, compression=compression, encoding=encoding, transport_params={"client": self.gcs_client}
+                self._get_file_url(file),
+                mode=mode.value,
+                compression=compression,
+                encoding=encoding,
+                transport_params={"client": self.gcs_client},
             )
             if not result.seekable():
-                result = StringIO(result.read())
+                result = self._spool(result, mode, encoding)
         except OSError as oe:
             logger.warning(ERROR_MESSAGE_ACCESS.format(uri=file.uri, bucket=self.config.bucket))
             logger.exception(oe)
             raise oe
         return result
+
+    def _spool(self, file: IOBase, mode: FileReadMode, encoding: Optional[str]) -> IOBase:
+        """
+        Copy a non-seekable file into a seekable one without holding more than SPOOLED_FILE_MAX_SIZE in memory.
+        """
+        if mode == FileReadMode.READ_BINARY:
+            spooled_file = tempfile.SpooledTemporaryFile(max_size=self.SPOOLED_FILE_MAX_SIZE, mode="w+b")
+        else:
+            # the content has already been decoded and had its newlines translated by smart_open, so it is written back as is
+            spooled_file = tempfile.SpooledTemporaryFile(
+                max_size=self.SPOOLED_FILE_MAX_SIZE, mode="w+", encoding=encoding or "utf-8", newline=""
+            )
+        with file:
+            shutil.copyfileobj(file, spooled_file)
+        spooled_file.seek(0)
+        return spooled_file
@@ -1,15 +1,16 @@
 # Copyright (c) 2024 Airbyte, Inc., all rights reserved.
 
 import datetime
-from unittest.mock import Mock
+import io
+from unittest.mock import Mock, patch
 
 import pytest
 from source_gcs import Config, SourceGCSStreamReader
 from source_gcs.config import ServiceAccountCredentials
+from source_gcs.helpers import GCSRemoteFile
 
 from airbyte_cdk.sources.file_based.exceptions import ErrorListingFiles
 from airbyte_cdk.sources.file_based.file_based_stream_reader import FileReadMode
-from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 
 
 def test_get_matching_files_with_no_prefix(logger, mocked_reader):
@@ -32,7 +33,7 @@ def test_open_file_with_compression(logger):
     reader._gcs_client = Mock()
     reader._config = Mock()
 
-    file = RemoteFile(uri="http://some.uri/file.gz?query=param", last_modified=datetime.datetime.now())
+    file = GCSRemoteFile(uri="http://some.uri/file.gz?query=param", last_modified=datetime.datetime.now())
     file.mime_type = "file.gz"
 
     with pytest.raises(OSError):
@@ -46,3 +47,75 @@ def test_open_file_without_compression(remote_file, logger):
 
     with pytest.raises(OSError):
         reader.open_file(remote_file, FileReadMode.READ, None, logger)
+
+
+def _blob(name: str) -> Mock:
+    blob = Mock(updated=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc), public_url=f"https://storage.googleapis.com/test_bucket/{name}")
+    blob.name = name
+    return blob
+
+
+def test_get_matching_files_lists_each_blob_once(logger, mocked_reader):
+    mocked_reader._config = Config(
+        credentials=ServiceAccountCredentials(service_account='{"type": "service_account"}', auth_type="Service"),
+        bucket="test_bucket",
+        streams=[],
+    )
+    blobs = {"data/": [_blob("data/a.csv"), _blob("data/2024/b.csv")], "data/2024/": [_blob("data/2024/b.csv")]}
+    bucket = mocked_reader._gcs_client.get_bucket.return_value
+    bucket.list_blobs.side_effect = lambda prefix, match_glob: iter(blobs[prefix])
+
+    files = list(mocked_reader.get_matching_files(["data/*.csv", "data/2024/*.csv", "data/**/*.csv"], None, logger))
+
+    assert [(file.uri, file.blob_name) for file in files] == [
+        ("https://storage.googleapis.com/test_bucket/data/a.csv", "data/a.csv"),
+        ("https://storage.googleapis.com/test_bucket/data/2024/b.csv", "data/2024/b.csv"),
+    ]
+    mocked_reader._gcs_client.get_bucket.assert_called_once_with("test_bucket")
+    assert {call.kwargs["prefix"] for call in bucket.list_blobs.call_args_list} == {"data/"}
+    for blobs_of_prefix in blobs.values():
+        for blob in blobs_of_prefix:
+            blob.generate_signed_url.assert_not_called()
+
+
+@pytest.mark.parametrize("prefixes, expected_prefixes", [(["a/b/", "a/", "c/"], ["a/", "c/"]), (["", "a/"], [""]), (["ab/", "a/"], ["a/", "ab/"])])
+def test_collapse_prefixes(prefixes, expected_prefixes):
+    assert SourceGCSStreamReader._collapse_prefixes(prefixes) == expected_prefixes
+
+
+@patch("source_gcs.stream_reader.smart_open.open")
+def test_open_file_signs_url(mock_open, logger, mocked_reader):
+    mocked_reader._config = Config(
+        credentials=ServiceAccountCredentials(service_account='{"type": "service_account"}', auth_type="Service"),
+        bucket="test_bucket",
+        streams=[],
+    )
+    blob = mocked_reader._gcs_client.bucket.return_value.blob.return_value
+    blob.generate_signed_url.return_value = "https://storage.googleapis.com/test_bucket/a.csv?X-Goog-Signature=abc"
+    file = GCSRemoteFile(
+        uri="https://storage.googleapis.com/test_bucket/a.csv", last_modified=datetime.datetime.now(), mime_type="csv", blob_name="a.csv"
+    )
+
+    assert mocked_reader.open_file(file, FileReadMode.READ, None, logger) == mock_open.return_value
+
+    mocked_reader._gcs_client.bucket.return_value.blob.assert_called_once_with("a.csv")
+    assert mock_open.call_args.args[0] == "https://storage.googleapis.com/test_bucket/a.csv?X-Goog-Signature=abc"
+
+
+@pytest.mark.parametrize(
+    "mode, content",
+    [(FileReadMode.READ_BINARY, b"\x1f\x8b" * 100_000), (FileReadMode.READ, "a,b\nd\u00e9,f\n" * 100_000)],
+)
+@patch("source_gcs.stream_reader.smart_open.open")
+def test_open_file_spools_non_seekable_files(mock_open, logger, mocked_reader, mode, content, remote_file):
+    mocked_reader._config = Mock()
+    mocked_reader.SPOOLED_FILE_MAX_SIZE = 1024
+    non_seekable_file = io.BytesIO(content) if mode == FileReadMode.READ_BINARY else io.StringIO(content)
+    non_seekable_file.seekable = lambda: False
+    mock_open.return_value = non_seekable_file
+
+    with mocked_reader.open_file(remote_file, mode, None, logger) as result:
+        assert result.seekable()
+        assert result._rolled
+        assert result.read() == content
+    assert non_seekable_file.closed
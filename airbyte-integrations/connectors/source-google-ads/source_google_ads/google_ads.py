@@ -34,13 +34,34 @@ def on_give_up(details):
         )
 
 
+class SearchStreamResponse:
+    """
+    Rows returned by the `search_stream` RPC, which streams all the rows of a query in batches instead of one page per request.
+    Iterating it again, e.g. when retrying after a server error, sends the request again.
+    """
+
+    def __init__(self, ga_service, request):
+        self._ga_service = ga_service
+        self._request = request
+
+    def __iter__(self) -> Iterator[GoogleAdsRow]:
+        for batch in self._ga_service.search_stream(self._request):
+            yield from batch.results
+
+
 class GoogleAds:
     DEFAULT_PAGE_SIZE = 1000
 
-    def __init__(self, credentials: MutableMapping[str, Any]):
+    def __init__(self, credentials: MutableMapping[str, Any], use_search_stream: bool = False, max_concurrent_requests: int = 1):
+        """
+        :param use_search_stream: Whether to read query results with the `search_stream` RPC instead of the paged `search` RPC.
+        :param max_concurrent_requests: The maximum number of (customer, date range) slices of a stream read at the same time.
+        """
         # `google-ads` library version `14.0.0` and higher requires an additional required parameter `use_proto_plus`.
         # More details can be found here: https://developers.google.com/google-ads/api/docs/client-libs/python/protobuf-messages
         credentials["use_proto_plus"] = True
+        self.use_search_stream = use_search_stream
+        self.max_concurrent_requests = max_concurrent_requests
         self.clients = {}
         self.ga_services = {}
         self.credentials = credentials
@@ -96,6 +117,12 @@ class GoogleAds:
         login_customer_id: str = "default",
     ) -> Iterator[SearchGoogleAdsResponse]:
         client = self.get_client(login_customer_id)
+        if self.use_search_stream:
+            search_stream_request = client.get_type("SearchGoogleAdsStreamRequest")
+            search_stream_request.query = query
+            search_stream_request.customer_id = customer_id
+            return [SearchStreamResponse(self.ga_service(login_customer_id), search_stream_request)]
+
         search_request = client.get_type("SearchGoogleAdsRequest")
         search_request.query = query
         search_request.customer_id = customer_id
@@ -175,7 +175,7 @@ class SourceGoogleAds(AbstractSource):
         config = self._validate_and_transform(config)
 
         logger.info("Checking the config")
-        google_api = GoogleAds(credentials=self.get_credentials(config))
+        google_api = GoogleAds(credentials=self.get_credentials(config), use_search_stream=config.get("use_search_stream", False))
 
         customers = self.get_customers(google_api, config)
         logger.info(f"Found {len(customers)} customers: {[customer.id for customer in customers]}")
@@ -223,7 +223,11 @@ class SourceGoogleAds(AbstractSource):
 
     def streams(self, config: Mapping[str, Any]) -> List[Stream]:
         config = self._validate_and_transform(config)
-        google_api = GoogleAds(credentials=self.get_credentials(config))
+        google_api = GoogleAds(
+            credentials=self.get_credentials(config),
+            use_search_stream=config.get("use_search_stream", False),
+            max_concurrent_requests=config.get("num_workers", 1),
+        )
 
         customers = self.get_customers(google_api, config)
         logger.info(f"Found {len(customers)} customers: {[customer.id for customer in customers]}")
@@ -20,15 +20,49 @@ from airbyte_cdk.utils import AirbyteTracedException
 
 from .google_ads import GoogleAds, logger
 from .models import CustomerModel
-from .utils import ExpiredPageTokenError, chunk_date_range, detached, generator_backoff, get_resource_name, parse_dates, traced_exception
+from .utils import (
+    ConcurrentSliceReader,
+    ExpiredPageTokenError,
+    chunk_date_range,
+    detached,
+    generator_backoff,
+    get_resource_name,
+    parse_dates,
+    traced_exception,
+)
+
+
+# the maximum time (in minutes) a request can go without returning rows before it is retried
+REQUEST_TIMEOUT_MINUTES = 5
+# the maximum number of rows a request reads ahead of the records being consumed
+MAX_BUFFERED_RECORDS = 10000
 
 
 class GoogleAdsStream(Stream, ABC):
     CATCH_CUSTOMER_NOT_ENABLED_ERROR = True
+    # whether the slices of the stream are independent (customer, date range) units which can be read at the same time
+    SUPPORTS_CONCURRENT_SLICES = True
 
     def __init__(self, api: GoogleAds, customers: List[CustomerModel]):
         self.google_ads_client = api
         self.customers = customers
+        self._slice_reader: Optional[ConcurrentSliceReader] = None
+
+    def read_slices_concurrently(self, stream_slices: Iterable[Optional[Mapping[str, Any]]]) -> Iterable[Optional[Mapping[str, Any]]]:
+        """
+        Read the records of the next slices in parallel when more than one concurrent request is allowed.
+        Records are still yielded slice by slice, in the order of the slices.
+        """
+        max_workers = self.google_ads_client.max_concurrent_requests
+        if not self.SUPPORTS_CONCURRENT_SLICES or max_workers <= 1:
+            yield from stream_slices
+            return
+        # the workers go through `request_records_job` as well, so requests which stop returning rows are retried the same way
+        self._slice_reader = ConcurrentSliceReader(self._read_slice_records, max_workers=max_workers, max_buffered_records=MAX_BUFFERED_RECORDS)
+        try:
+            yield from self._slice_reader.prefetch(stream_slices)
+        finally:
+            self._slice_reader = None
 
     def get_query(self, stream_slice: Mapping[str, Any]) -> str:
         fields = GoogleAds.get_fields_from_schema(self.get_json_schema())
@@ -41,8 +75,9 @@ class GoogleAdsStream(Stream, ABC):
             yield self.google_ads_client.parse_single_result(self.get_json_schema(), result)
 
     def stream_slices(self, stream_state: Mapping[str, Any] = None, **kwargs) -> Iterable[Optional[Mapping[str, any]]]:
-        for customer in self.customers:
-            yield {"customer_id": customer.id, "login_customer_id": customer.login_customer_id}
+        yield from self.read_slices_concurrently(
+            {"customer_id": customer.id, "login_customer_id": customer.login_customer_id} for customer in self.customers
+        )
 
     @generator_backoff(
         wait_gen=backoff.constant,
@@ -53,7 +88,7 @@ class GoogleAdsStream(Stream, ABC):
         ),
         interval=1,
     )
-    @detached(timeout_minutes=5)
+    @detached(timeout_minutes=REQUEST_TIMEOUT_MINUTES, max_buffered_values=MAX_BUFFERED_RECORDS)
     def request_records_job(self, customer_id, login_customer_id, query, stream_slice):
         response_records = self.google_ads_client.send_request(query=query, customer_id=customer_id, login_customer_id=login_customer_id)
         yield from self.parse_records_with_backoff(response_records, stream_slice)
@@ -62,6 +97,13 @@ class GoogleAdsStream(Stream, ABC):
         if stream_slice is None:
             return []
 
+        if not self._slice_reader:
+            yield from self._read_slice_records(stream_slice)
+            return
+
+        yield from self._slice_reader.read(stream_slice, default=lambda: self._read_slice_records(stream_slice))
+
+    def _read_slice_records(self, stream_slice: Mapping[str, Any]) -> Iterable[Mapping[str, Any]]:
         customer_id = stream_slice["customer_id"]
         login_customer_id = stream_slice["login_customer_id"]
 
@@ -131,6 +173,9 @@ class IncrementalGoogleAdsStream(GoogleAdsStream, CheckpointMixin, ABC):
             return default
 
     def stream_slices(self, stream_state: Mapping[str, Any] = None, **kwargs) -> Iterable[Optional[MutableMapping[str, any]]]:
+        yield from self.read_slices_concurrently(self._date_range_slices(stream_state))
+
+    def _date_range_slices(self, stream_state: Mapping[str, Any] = None) -> Iterable[Optional[MutableMapping[str, any]]]:
         for customer in self.customers:
             stream_state = stream_state or {}
             if stream_state.get(customer.id):
@@ -242,6 +287,8 @@ class CustomerClient(GoogleAdsStream):
     """
 
     primary_key = ["customer_client.id"]
+    # records are read by read_records below, the accounts it returns are needed before the other streams are created
+    SUPPORTS_CONCURRENT_SLICES = False
 
     def __init__(self, customer_status_filter: List[str], **kwargs):
         self.customer_status_filter = customer_status_filter
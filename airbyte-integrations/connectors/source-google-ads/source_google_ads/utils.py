@@ -3,14 +3,17 @@
 #
 
 import functools
+import json
 import logging
 import queue
 import re
 import threading
 import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Callable, Generator, Iterable, MutableMapping, Optional, Tuple, Type, Union
+from typing import Any, Callable, Deque, Dict, Generator, Iterable, Mapping, MutableMapping, Optional, Tuple, Type, Union
 
 import pendulum
 from google.ads.googleads.errors import GoogleAdsException
@@ -219,12 +222,15 @@ class RunAsThread:
     and you want to enforce a time limit for their execution.
     """
 
-    def __init__(self, timeout_minutes):
+    def __init__(self, timeout_minutes, max_buffered_values: Optional[int] = None):
         """
         :param timeout_minutes: The maximum allowed time (in minutes) for the generator function to idle.
                                 If the timeout is reached, a TimeoutError is raised.
+        :param max_buffered_values: The maximum number of values produced ahead of the caller, the thread waits for them to be consumed.
+                                    Unbounded by default.
         """
         self._timeout_seconds = timeout_minutes * 60
+        self._max_buffered_values = max_buffered_values or 0
 
     def __call__(self, generator_func):
         @functools.wraps(generator_func)
@@ -236,7 +242,7 @@ class RunAsThread:
             # Event and Queue initialization
             write_event = threading.Event()
             exit_event = threading.Event()
-            the_queue = queue.Queue()
+            the_queue = queue.Queue(maxsize=self._max_buffered_values)
 
             # Thread initialization and start
             thread = threading.Thread(
@@ -246,27 +252,31 @@ class RunAsThread:
 
             # Records the starting time for the timeout calculation.
             start_time = time.time()
-            while thread.is_alive() or not the_queue.empty():
-                # The main thread waits for the `write_event` to be set or until the specified timeout.
-                if the_queue.empty():
-                    write_event.wait(self._timeout_seconds)
-                try:
-                    # The main thread yields the result obtained from reading the queue.
-                    yield self.read(the_queue)
-                    # The timer is reset since a new result has been received, preventing the timeout from occurring.
-                    start_time = time.time()
-                except queue.Empty:
-                    # If exit_event is set it means that the generator function in the thread has completed its execution.
-                    if exit_event.is_set():
-                        break
-                    # Check if the timeout has been reached without new results.
-                    if time.time() - start_time > self._timeout_seconds:
-                        # The thread may continue to run for some time after reaching a timeout and even come to life and continue working.
-                        # That is why the exit event is set to signal the generator function to stop producing data.
-                        exit_event.set()
-                        raise TimeoutError(f"Method '{generator_func.__name__}' timed out after {self._timeout_seconds / 60.0} minutes")
-                    # The write event is cleared to reset it for the next iteration.
-                    write_event.clear()
+            try:
+                while thread.is_alive() or not the_queue.empty():
+                    # The main thread waits for the `write_event` to be set or until the specified timeout.
+                    if the_queue.empty():
+                        write_event.wait(self._timeout_seconds)
+                    try:
+                        # The main thread yields the result obtained from reading the queue.
+                        yield self.read(the_queue)
+                        # The timer is reset since a new result has been received, preventing the timeout from occurring.
+                        start_time = time.time()
+                    except queue.Empty:
+                        # If exit_event is set it means that the generator function in the thread has completed its execution.
+                        if exit_event.is_set():
+                            break
+                        # Check if the timeout has been reached without new results.
+                        if time.time() - start_time > self._timeout_seconds:
+                            # The thread may continue to run for some time after reaching a timeout and even come to life and continue working.
+                            # That is why the exit event is set to signal the generator function to stop producing data.
+                            exit_event.set()
+                            raise TimeoutError(f"Method '{generator_func.__name__}' timed out after {self._timeout_seconds / 60.0} minutes")
+                        # The write event is cleared to reset it for the next iteration.
+                        write_event.clear()
+            finally:
+                # The caller may stop reading before the end, e.g. when the sync fails: a thread waiting for room in the queue is stopped too.
+                exit_event.set()
 
         return wrapper
 
@@ -288,7 +298,7 @@ class RunAsThread:
                 # If the timeout has been reached we must stop producing any data
                 if exit_event.is_set():
                     break
-                self.write(the_queue, value, write_event)
+                self.write(the_queue, value, write_event, exit_event)
             else:
                 # Notify the main thread that the generator function has completed its execution.
                 exit_event.set()
@@ -296,19 +306,25 @@ class RunAsThread:
                 if not write_event.is_set():
                     write_event.set()
         except Exception as e:
-            self.write(the_queue, e, write_event)
+            self.write(the_queue, e, write_event, exit_event)
 
     @staticmethod
-    def write(the_queue, value, write_event):
+    def write(the_queue, value, write_event, exit_event):
         """
         Puts a value into the queue and sets a write event to notify the main thread that new data is available.
         :param the_queue: A queue used for communication between the main thread and the thread running the generator function.
         :param value: The value to be put into the communication queue.
                       This can be any type of data produced by the generator function, including results or exceptions.
         :param write_event: An event signaling the availability of new data in the queue.
+        :param exit_event: An event indicating that the main thread stopped reading the queue, values are then dropped.
         :return: None
         """
-        the_queue.put(value)
+        while not exit_event.is_set():
+            try:
+                the_queue.put(value, timeout=1)
+                break
+            except queue.Full:
+                continue
         write_event.set()
 
     @staticmethod
@@ -329,6 +345,101 @@ class RunAsThread:
 detached = RunAsThread
 
 
+class ConcurrentSliceReader:
+    """
+    Reads the records of the upcoming stream slices with a bounded pool of workers while the records of the current slice are consumed.
+    Records are still returned slice by slice, in the order of the slices, so the state can be checkpointed after each slice as before.
+    """
+
+    _DONE = object()
+
+    def __init__(
+        self,
+        read_slice: Callable[[Mapping[str, Any]], Iterable[Any]],
+        max_workers: int,
+        max_buffered_records: int = 10000,
+    ):
+        """
+        :param read_slice: The function returning the records of a slice, called from the workers.
+                           Records it buffers itself, e.g. in a `detached` thread, add to the `max_buffered_records` read ahead.
+        :param max_workers: The maximum number of slices read at the same time, including the one being consumed.
+        :param max_buffered_records: The maximum number of records read ahead for each slice, workers wait for them to be consumed.
+        """
+        self._read_slice = read_slice
+        self._max_workers = max_workers
+        self._max_buffered_records = max_buffered_records
+        self._pending: Dict[str, Deque[queue.Queue]] = defaultdict(deque)
+        self._closed = threading.Event()
+
+    @staticmethod
+    def _slice_key(stream_slice: Mapping[str, Any]) -> str:
+        return json.dumps(stream_slice, sort_keys=True, default=str)
+
+    def prefetch(self, stream_slices: Iterable[Optional[Mapping[str, Any]]]) -> Iterable[Optional[Mapping[str, Any]]]:
+        """
+        Yield the given slices, the records of a slice and of the following ones being read as soon as it is yielded.
+        """
+        self._closed.clear()
+        submitted: Deque[Optional[Mapping[str, Any]]] = deque()
+        stream_slices = iter(stream_slices)
+        executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="google_ads_slice_reader")
+        try:
+            while True:
+                while len(submitted) < self._max_workers:
+                    stream_slice = next(stream_slices, self._DONE)
+                    if stream_slice is self._DONE:
+                        break
+                    if stream_slice is not None:
+                        records = queue.Queue(maxsize=self._max_buffered_records)
+                        self._pending[self._slice_key(stream_slice)].append(records)
+                        executor.submit(self._read_into_queue, stream_slice, records)
+                    submitted.append(stream_slice)
+                if not submitted:
+                    return
+                yield submitted.popleft()
+        finally:
+            # stop the workers of slices which will not be consumed, e.g. when the sync fails
+            self._closed.set()
+            self._pending.clear()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def read(self, stream_slice: Mapping[str, Any], default: Callable[[], Iterable[Any]]) -> Iterable[Any]:
+        """
+        Yield the records of a slice read ahead by a worker, raising the error the worker ran into if any.
+        Slices which were not prefetched, e.g. when their dates were changed to retry them, are read with `default`.
+        """
+        key = self._slice_key(stream_slice)
+        if not self._pending.get(key):
+            yield from default()
+            return
+        records = self._pending[key].popleft()
+        while True:
+            record = records.get()
+            if record is self._DONE:
+                return
+            if isinstance(record, Exception):
+                raise record
+            yield record
+
+    def _read_into_queue(self, stream_slice: Mapping[str, Any], records: queue.Queue):
+        try:
+            for record in self._read_slice(stream_slice):
+                if not self._put(records, record):
+                    return
+        except Exception as e:
+            self._put(records, e)
+        self._put(records, self._DONE)
+
+    def _put(self, records: queue.Queue, value: Any) -> bool:
+        while not self._closed.is_set():
+            try:
+                records.put(value, timeout=1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+
 def parse_dates(stream_slice):
     start_date = pendulum.parse(stream_slice["start_date"])
     end_date = pendulum.parse(stream_slice["end_date"])
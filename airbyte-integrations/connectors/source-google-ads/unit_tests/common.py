@@ -4,6 +4,8 @@
 
 
 import json
+import re
+import threading
 
 from google.ads.googleads.errors import GoogleAdsException
 from google.ads.googleads.v18.errors.types.authentication_error import AuthenticationErrorEnum
@@ -11,6 +13,7 @@ from google.ads.googleads.v18.errors.types.authorization_error import Authorizat
 from google.ads.googleads.v18.errors.types.errors import GoogleAdsFailure
 from google.ads.googleads.v18.errors.types.query_error import QueryErrorEnum
 from google.ads.googleads.v18.errors.types.quota_error import QuotaErrorEnum
+from google.ads.googleads.v18.services.types.google_ads_service import SearchGoogleAdsStreamResponse
 
 
 class MockSearchRequest:
@@ -27,10 +30,43 @@ class MockGoogleAdsService:
         return search_request
 
 
+class FakeGoogleAdsService:
+    """
+    Serves canned `GoogleAdsRow` protobuf messages through the `search` and `search_stream` RPCs.
+    The rows of the customer of a request are filtered by the `segments.date` range of its query, if any.
+    """
+
+    DATE_RANGE = re.compile(r"segments\.date >= '(?P<start_date>[\d-]+)' AND segments\.date <= '(?P<end_date>[\d-]+)'")
+
+    def __init__(self, rows, stream_batch_size=2):
+        self.rows = rows
+        self.stream_batch_size = stream_batch_size
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def search(self, search_request):
+        return iter(self._get_rows(search_request))
+
+    def search_stream(self, search_stream_request):
+        rows = self._get_rows(search_stream_request)
+        for start in range(0, len(rows), self.stream_batch_size):
+            yield SearchGoogleAdsStreamResponse(results=rows[start : start + self.stream_batch_size])
+
+    def _get_rows(self, request):
+        with self._lock:
+            self.requests.append(request)
+        rows = [row for row in self.rows if str(row.customer.id) == request.customer_id]
+        date_range = self.DATE_RANGE.search(request.query)
+        if date_range:
+            rows = [row for row in rows if date_range["start_date"] <= row.segments.date <= date_range["end_date"]]
+        return rows
+
+
 class MockGoogleAdsClient:
     def __init__(self, credentials, **kwargs):
         self.config = credentials
         self.customer_ids = ["1"]
+        self.max_concurrent_requests = kwargs.get("max_concurrent_requests", 1)
 
     def get_type(self, type):
         return MockSearchRequest()
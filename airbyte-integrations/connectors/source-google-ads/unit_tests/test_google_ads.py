@@ -8,14 +8,14 @@ from datetime import date
 
 import pendulum
 import pytest
-from google.ads.googleads.v18.services.types.google_ads_service import GoogleAdsRow
+from google.ads.googleads.v18.services.types.google_ads_service import GoogleAdsRow, SearchGoogleAdsStreamRequest
 from google.auth import exceptions
 from source_google_ads.google_ads import GoogleAds
 from source_google_ads.streams import chunk_date_range
 
 from airbyte_cdk.utils import AirbyteTracedException
 
-from .common import MockGoogleAdsClient, MockGoogleAdsService
+from .common import FakeGoogleAdsService, MockGoogleAdsClient, MockGoogleAdsService
 
 
 SAMPLE_SCHEMA = {
@@ -82,6 +82,22 @@ def test_send_request(mocker, customers):
     assert response[0].query == query
 
 
+def test_send_request_with_search_stream(mocker, customers):
+    customer_id = next(iter(customers)).id
+    rows = [GoogleAdsRow(customer={"id": int(customer_id)}, segments={"date": f"2021-01-0{day}"}) for day in range(1, 4)]
+    ga_service = FakeGoogleAdsService(rows, stream_batch_size=2)
+    client = MockGoogleAdsClient(SAMPLE_CONFIG)
+    mocker.patch.object(client, "get_type", side_effect=lambda name: SearchGoogleAdsStreamRequest())
+    mocker.patch.object(client, "get_service", return_value=ga_service)
+    mocker.patch("source_google_ads.google_ads.GoogleAdsClient.load_from_dict", return_value=client)
+    google_ads_client = GoogleAds(**SAMPLE_CONFIG, use_search_stream=True)
+
+    response = list(google_ads_client.send_request("Query", customer_id=customer_id))
+
+    assert [result for page in response for result in page] == rows
+    assert [(request.customer_id, request.query) for request in ga_service.requests] == [(customer_id, "Query")]
+
+
 def test_get_fields_from_schema():
     response = GoogleAds.get_fields_from_schema(SAMPLE_SCHEMA)
     assert response == ["segment.date"]
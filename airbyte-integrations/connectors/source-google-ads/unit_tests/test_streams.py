@@ -9,6 +9,7 @@ import pytest
 from google.ads.googleads.errors import GoogleAdsException
 from google.ads.googleads.v18.errors.types.errors import ErrorCode, GoogleAdsError, GoogleAdsFailure
 from google.ads.googleads.v18.errors.types.request_error import RequestErrorEnum
+from google.ads.googleads.v18.services.types.google_ads_service import GoogleAdsRow
 from google.api_core.exceptions import DataLoss, InternalServerError, ResourceExhausted, TooManyRequests, Unauthenticated
 from grpc import RpcError
 from source_google_ads.google_ads import GoogleAds
@@ -17,6 +18,8 @@ from source_google_ads.streams import AdGroup, ClickView, Customer, CustomerLabe
 from airbyte_cdk.models import FailureType, SyncMode
 from airbyte_cdk.utils import AirbyteTracedException
 
+from .common import FakeGoogleAdsService
+
 
 # EXPIRED_PAGE_TOKEN exception will be raised when page token has expired.
 exception = GoogleAdsException(
@@ -331,3 +334,34 @@ def test_ad_group_stream_query_removes_metrics_field_for_manager(customers_manag
     stream_config = dict(api=api, customers=customers, start_date="2020-01-01", conversion_window_days=10)
     stream = AdGroup(**stream_config)
     assert "metrics" in stream.get_query(stream_slice={"customer_id": "123"})
+
+
+@pytest.mark.parametrize("use_search_stream", (False, True))
+@pytest.mark.parametrize("max_concurrent_requests", (1, 4))
+def test_read_slices_concurrently(mocker, config, additional_customers, max_concurrent_requests, use_search_stream):
+    rows = [
+        GoogleAdsRow(customer={"id": int(customer.id)}, segments={"date": f"2021-{month:02d}-{day:02d}"})
+        for customer in additional_customers
+        for month in (1, 2)
+        for day in range(1, 29, 3)
+    ]
+    ga_service = FakeGoogleAdsService(rows)
+    api = GoogleAds(
+        credentials=config["credentials"], use_search_stream=use_search_stream, max_concurrent_requests=max_concurrent_requests
+    )
+    mocker.patch.object(api, "ga_service", return_value=ga_service)
+    stream = Customer(api=api, customers=additional_customers, start_date="2021-01-01", end_date="2021-03-01", conversion_window_days=14)
+    # the workers go through request_records_job, so requests which stop returning rows are retried as when reading sequentially
+    request_records_job = mocker.spy(stream, "request_records_job")
+
+    records = []
+    for stream_slice in stream.stream_slices(stream_state={}):
+        records.extend(
+            (record["customer.id"], record["segments.date"])
+            for record in stream.read_records(SyncMode.incremental, stream_slice=stream_slice)
+        )
+
+    # records are yielded slice by slice, in the order of the slices
+    assert records == [(row.customer.id, row.segments.date) for row in rows]
+    assert stream.state == {customer.id: {"segments.date": "2021-02-28"} for customer in additional_customers}
+    assert request_records_job.call_count == len(list(stream._date_range_slices(stream_state={})))
@@ -3,13 +3,14 @@
 #
 
 
+import time
 from datetime import datetime
 from unittest.mock import Mock
 
 import backoff
 import pytest
 from source_google_ads import SourceGoogleAds
-from source_google_ads.utils import GAQL, generator_backoff
+from source_google_ads.utils import GAQL, ConcurrentSliceReader, detached, generator_backoff
 
 from airbyte_cdk.utils import AirbyteTracedException
 
@@ -202,3 +203,106 @@ def test_generator_backoff_retries_until_success():
     # Compare each expected call with the actual call
     for expected, actual in zip(expected_calls, actual_calls):
         assert expected == actual
+
+
+def test_concurrent_slice_reader_keeps_slices_order():
+    stream_slices = [{"customer_id": str(i)} for i in range(10)]
+
+    def read_slice(stream_slice):
+        # the first slices are the slowest ones
+        time.sleep(0.01 * (10 - int(stream_slice["customer_id"])))
+        yield from (f"{stream_slice['customer_id']}_{i}" for i in range(3))
+
+    reader = ConcurrentSliceReader(read_slice, max_workers=4, max_buffered_records=2)
+    records = []
+    for stream_slice in reader.prefetch(stream_slices):
+        records.extend(reader.read(stream_slice, default=Mock(side_effect=AssertionError("slice should be prefetched"))))
+
+    assert records == [record for stream_slice in stream_slices for record in read_slice(stream_slice)]
+
+
+def test_concurrent_slice_reader_raises_worker_errors_in_order():
+    def read_slice(stream_slice):
+        yield stream_slice["customer_id"]
+        if stream_slice["customer_id"] == "1":
+            raise ValueError("failed slice")
+
+    reader = ConcurrentSliceReader(read_slice, max_workers=3)
+    records = []
+    with pytest.raises(ValueError, match="failed slice"):
+        for stream_slice in reader.prefetch([{"customer_id": str(i)} for i in range(3)]):
+            records.extend(reader.read(stream_slice, default=Mock()))
+
+    assert records == ["0", "1"]
+
+
+def test_concurrent_slice_reader_reads_unknown_slices_directly():
+    reader = ConcurrentSliceReader(lambda stream_slice: iter(["prefetched"]), max_workers=2)
+    records = []
+    for stream_slice in reader.prefetch([{"customer_id": "1"}]):
+        # the slice is changed before being read, e.g. when it is retried from a later date
+        records.extend(reader.read(dict(stream_slice, start_date="2021-01-02"), default=lambda: iter(["direct"])))
+
+    assert records == ["direct"]
+
+
+def test_concurrent_slice_reader_bounds_records_read_ahead():
+    read_records = []
+
+    def read_slice(stream_slice):
+        for i in range(100):
+            read_records.append(i)
+            yield i
+
+    reader = ConcurrentSliceReader(read_slice, max_workers=2, max_buffered_records=5)
+    stream_slices = reader.prefetch([{"customer_id": "1"}])
+    stream_slice = next(stream_slices)
+    time.sleep(0.1)
+
+    # the worker waits for the buffered records to be consumed before reading more of them
+    assert len(read_records) == 6
+    assert list(reader.read(stream_slice, default=Mock())) == list(range(100))
+    assert list(stream_slices) == []
+
+
+
+def test_concurrent_slice_reader_retries_stalled_requests_in_workers():
+    attempts = []
+
+    @generator_backoff(wait_gen=backoff.constant, exception=TimeoutError, max_tries=3, interval=0)
+    @detached(timeout_minutes=0.001, max_buffered_values=2)
+    def read_slice(stream_slice):
+        attempts.append(stream_slice["customer_id"])
+        if attempts.count(stream_slice["customer_id"]) == 1 and stream_slice["customer_id"] == "1":
+            # the first request of the slice stops returning rows
+            time.sleep(0.5)
+        yield from (f"{stream_slice['customer_id']}_{i}" for i in range(5))
+
+    reader = ConcurrentSliceReader(read_slice, max_workers=2)
+    records = []
+    for stream_slice in reader.prefetch([{"customer_id": str(i)} for i in range(3)]):
+        records.extend(reader.read(stream_slice, default=Mock()))
+
+    assert records == [f"{customer_id}_{i}" for customer_id in "012" for i in range(5)]
+    assert sorted(attempts) == ["0", "1", "1", "2"]
+
+
+def test_detached_bounds_values_read_ahead():
+    produced = []
+
+    @detached(timeout_minutes=1, max_buffered_values=5)
+    def produce():
+        for i in range(100):
+            produced.append(i)
+            yield i
+
+    values = produce()
+    assert next(values) == 0
+    time.sleep(0.1)
+    # the thread waits for the buffered values to be consumed before producing more of them
+    assert len(produced) <= 7
+
+    values.close()
+    time.sleep(1.5)
+    # the thread stops once the caller gives up the values
+    assert len(produced) <= 8
@@ -7,10 +7,13 @@ import io
 import json
 import logging
 import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from io import IOBase
 from os.path import getsize
-from typing import Dict, Iterable, List, Optional, Set, Tuple
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
 
 from google.oauth2 import credentials, service_account
 from googleapiclient.discovery import build
@@ -77,10 +80,15 @@ class GoogleDriveRemoteFile(RemoteFile):
 
 class SourceGoogleDriveStreamReader(AbstractFileBasedStreamReader):
     FILE_SIZE_LIMIT = 1_500_000_000
+    # Maximum number of folders combined into a single files().list query
+    LISTING_BATCH_SIZE = 25
+    # Maximum number of files().list queries running at the same time
+    LISTING_CONCURRENCY = 8
 
     def __init__(self):
         super().__init__()
         self._drive_service = None
+        self._listing_services = threading.local()
 
     @property
     def config(self) -> SourceGoogleDriveSpec:
@@ -132,35 +140,34 @@ class SourceGoogleDriveStreamReader(AbstractFileBasedStreamReader):
     def get_matching_files(self, globs: List[str], prefix: Optional[str], logger: logging.Logger) -> Iterable[RemoteFile]:
         """
         Get all files matching the specified glob patterns.
+
+        Folders are listed breadth-first: pending folders are combined into `'a' in parents or 'b' in parents ...` queries of up to
+        LISTING_BATCH_SIZE folders, and up to LISTING_CONCURRENCY of these queries run at the same time. Results are mapped back to
+        the folder they were found in through their `parents` field. Listings are processed in the order they were submitted, so the
+        files are found in the same order, and with the same paths, whichever query completes first.
         """
-        service = self.google_drive_service
         root_folder_id = get_folder_id(self.config.folder_url)
         # ignore prefix argument as it's legacy only and this is a new connector
         prefixes = self.get_prefixes_from_globs(globs)
 
-        folder_id_queue = [("", root_folder_id)]
+        folder_id_queue: List[Tuple[str, str]] = [("", root_folder_id)]
         seen: Set[str] = set()
-        while len(folder_id_queue) > 0:
-            (path, folder_id) = folder_id_queue.pop()
-            # fetch all files in this folder (1000 is the max page size)
-            # supportsAllDrives and includeItemsFromAllDrives are required to access files in shared drives
-            # ref https://developers.google.com/workspace/drive/api/reference/rest/v3/files#File
-            request = service.files().list(
-                q=f"'{folder_id}' in parents",
-                pageSize=1000,
-                fields="nextPageToken, files(id, name, modifiedTime, mimeType, webViewLink, driveId, createdTime)",
-                supportsAllDrives=True,
-                includeItemsFromAllDrives=True,
-            )
-            while True:
-                results = request.execute()
-                new_files = results.get("files", [])
-                for new_file in new_files:
+        executor = ThreadPoolExecutor(max_workers=self.LISTING_CONCURRENCY, thread_name_prefix="google-drive-listing")
+        pending_listings: Deque[Tuple[Future, Dict[str, str]]] = deque()
+        try:
+            while folder_id_queue or pending_listings:
+                while folder_id_queue and len(pending_listings) < self.LISTING_CONCURRENCY:
+                    batch, folder_id_queue = folder_id_queue[: self.LISTING_BATCH_SIZE], folder_id_queue[self.LISTING_BATCH_SIZE :]
+                    folder_paths = {folder_id: path for path, folder_id in batch}
+                    pending_listings.append((executor.submit(self._list_folders, list(folder_paths)), folder_paths))
+
+                listing, folder_paths = pending_listings.popleft()
+                for new_file in listing.result():
                     # It's possible files and folders are linked up multiple times, this prevents us from getting stuck in a loop
                     if new_file["id"] in seen:
                         continue
                     seen.add(new_file["id"])
-                    file_name = path + new_file["name"]
+                    file_name = self._get_parent_folder_path(new_file, folder_paths) + new_file["name"]
                     if new_file["mimeType"] == FOLDER_MIME_TYPE:
                         folder_name = f"{file_name}/"
                         # check prefix matching in both directions to handle
@@ -190,9 +197,50 @@ class SourceGoogleDriveStreamReader(AbstractFileBasedStreamReader):
                         )
                         if self.file_matches_globs(remote_file, globs):
                             yield remote_file
-                request = service.files().list_next(request, results)
-                if request is None:
-                    break
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _list_folders(self, folder_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch the files and folders contained in any of the given folders, following all result pages.
+        """
+        service = self._get_listing_service()
+        # fetch all files in these folders (1000 is the max page size)
+        # supportsAllDrives and includeItemsFromAllDrives are required to access files in shared drives
+        # ref https://developers.google.com/workspace/drive/api/reference/rest/v3/files#File
+        request = service.files().list(
+            q=" or ".join(f"'{folder_id}' in parents" for folder_id in folder_ids),
+            pageSize=1000,
+            fields="nextPageToken, files(id, name, modifiedTime, mimeType, webViewLink, driveId, createdTime, parents)",
+            supportsAllDrives=True,
+            includeItemsFromAllDrives=True,
+        )
+        files = []
+        while request is not None:
+            results = request.execute()
+            files.extend(results.get("files", []))
+            request = service.files().list_next(request, results)
+        return files
+
+    def _get_listing_service(self):
+        """
+        Google API clients are not thread-safe, so every listing thread builds its own Drive client.
+        """
+        if not hasattr(self._listing_services, "drive_service"):
+            self._listing_services.drive_service = self._build_google_service("drive", "v3")
+        return self._listing_services.drive_service
+
+    @staticmethod
+    def _get_parent_folder_path(file: Dict[str, Any], folder_paths: Dict[str, str]) -> str:
+        """
+        Returns the path of the listed folder a file was found in. Files with several parents are placed in the first listed one.
+        """
+        if len(folder_paths) == 1:
+            return next(iter(folder_paths.values()))
+        for parent in file.get("parents", []):
+            if parent in folder_paths:
+                return folder_paths[parent]
+        raise ValueError(f"File {file['id']} was not found in any of the listed folders.")
 
     def _is_exportable_document(self, mime_type: str):
         """
@@ -4,6 +4,7 @@
 
 
 import datetime
+import time
 from os import path
 from typing import Dict
 from unittest.mock import ANY, MagicMock, call, patch
@@ -51,6 +52,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "test.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/abc/view?usp=drivesdk",
                             }
                         ]
@@ -64,6 +66,7 @@ def flatten_list(list_of_lists):
                     mime_type="text/csv",
                     original_mime_type="text/csv",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/file/d/abc/view?usp=drivesdk",
                 )
             ],
@@ -80,6 +83,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "test.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/abc/view?usp=drivesdk",
                             },
                             {
@@ -87,6 +91,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "another_file.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/def/view?usp=drivesdk",
                             },
                         ]
@@ -100,6 +105,7 @@ def flatten_list(list_of_lists):
                     mime_type="text/csv",
                     original_mime_type="text/csv",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/file/d/abc/view?usp=drivesdk",
                 ),
                 GoogleDriveRemoteFile(
@@ -108,6 +114,7 @@ def flatten_list(list_of_lists):
                     mime_type="text/csv",
                     original_mime_type="text/csv",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/file/d/def/view?usp=drivesdk",
                 ),
             ],
@@ -124,6 +131,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "test.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/abc/view?usp=drivesdk",
                             }
                         ]
@@ -135,6 +143,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "another_file.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/def/view?usp=drivesdk",
                             }
                         ]
@@ -148,6 +157,7 @@ def flatten_list(list_of_lists):
                     mime_type="text/csv",
                     original_mime_type="text/csv",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/file/d/abc/view?usp=drivesdk",
                 ),
                 GoogleDriveRemoteFile(
@@ -156,6 +166,7 @@ def flatten_list(list_of_lists):
                     mime_type="text/csv",
                     original_mime_type="text/csv",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/file/d/def/view?usp=drivesdk",
                 ),
             ],
@@ -182,6 +193,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "test.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/abc/view?usp=drivesdk",
                             },
                             {
@@ -189,6 +201,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.folder",
                                 "name": "subfolder",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/sub/view?usp=drivesdk",
                             },
                         ]
@@ -203,6 +216,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "another_file.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/def/view?usp=drivesdk",
                             },
                             {
@@ -210,6 +224,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.folder",
                                 "name": "subsubfolder",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/subsub/view?usp=drivesdk",
                             },
                         ]
@@ -224,6 +239,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "yet_another_file.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/ghi/view?usp=drivesdk",
                             },
                         ]
@@ -237,6 +253,7 @@ def flatten_list(list_of_lists):
                     mime_type="text/csv",
                     original_mime_type="text/csv",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/file/d/abc/view?usp=drivesdk",
                 ),
                 GoogleDriveRemoteFile(
@@ -245,6 +262,7 @@ def flatten_list(list_of_lists):
                     mime_type="text/csv",
                     original_mime_type="text/csv",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/file/d/def/view?usp=drivesdk",
                 ),
                 GoogleDriveRemoteFile(
@@ -253,6 +271,7 @@ def flatten_list(list_of_lists):
                     mime_type="text/csv",
                     original_mime_type="text/csv",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/file/d/ghi/view?usp=drivesdk",
                 ),
             ],
@@ -269,6 +288,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "test.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/abc/view?usp=drivesdk",
                             },
                             {
@@ -276,6 +296,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.folder",
                                 "name": "subfolder",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/sub/view?usp=drivesdk",
                             },
                         ]
@@ -290,6 +311,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "test.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/abc/view?usp=drivesdk",
                             },
                             {
@@ -297,6 +319,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.folder",
                                 "name": "subsubfolder",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/subsub/view?usp=drivesdk",
                             },
                         ]
@@ -311,6 +334,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "test.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/abc/view?usp=drivesdk",
                             },
                             {
@@ -318,6 +342,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.folder",
                                 "name": "link_to_subfolder",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/sub/view?usp=drivesdk",
                             },
                         ]
@@ -331,6 +356,7 @@ def flatten_list(list_of_lists):
                     mime_type="text/csv",
                     original_mime_type="text/csv",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/file/d/abc/view?usp=drivesdk",
                 ),
             ],
@@ -347,6 +373,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "test.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/abc/view?usp=drivesdk",
                             },
                             {
@@ -354,6 +381,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.folder",
                                 "name": "subfolder",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/sub/view?usp=drivesdk",
                             },
                         ]
@@ -368,6 +396,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "another_file.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/def/view?usp=drivesdk",
                             },
                             {
@@ -375,6 +404,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/jsonl",
                                 "name": "non_matching.jsonl",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/ghi/view?usp=drivesdk",
                             },
                         ]
@@ -388,6 +418,7 @@ def flatten_list(list_of_lists):
                     mime_type="text/csv",
                     original_mime_type="text/csv",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/file/d/def/view?usp=drivesdk",
                 ),
             ],
@@ -404,6 +435,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "test.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/abc/view?usp=drivesdk",
                             },
                             {
@@ -411,6 +443,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.folder",
                                 "name": "subfolder",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/sub/view?usp=drivesdk",
                             },
                             # This won't get queued because it has no chance of matching the glob
@@ -419,6 +452,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.folder",
                                 "name": "ignored_subfolder",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/sub/view?usp=drivesdk",
                             },
                         ]
@@ -433,6 +467,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "another_file.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/def/view?usp=drivesdk",
                             },
                             # This will get queued because it matches the prefix (event though it can't match the glob)
@@ -441,6 +476,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.folder",
                                 "name": "subsubfolder",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/subsub/view?usp=drivesdk",
                             },
                         ]
@@ -455,6 +491,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "yet_another_file.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/ghi/view?usp=drivesdk",
                             },
                         ]
@@ -468,6 +505,7 @@ def flatten_list(list_of_lists):
                     mime_type="text/csv",
                     original_mime_type="text/csv",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/file/d/def/view?usp=drivesdk",
                 ),
             ],
@@ -484,6 +522,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "test.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/abc/view?usp=drivesdk",
                             },
                             {
@@ -491,6 +530,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.folder",
                                 "name": "subfolder",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/sub/view?usp=drivesdk",
                             },
                         ]
@@ -505,6 +545,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "another_file.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/def/view?usp=drivesdk",
                             },
                             # This will get queued because it matches the prefix (event though it can't match the glob)
@@ -513,6 +554,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.folder",
                                 "name": "subsubfolder",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/subsub/view?usp=drivesdk",
                             },
                         ]
@@ -527,6 +569,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "yet_another_file.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/ghi/view?usp=drivesdk",
                             },
                             # This will get queued because it matches the prefix (event though it can't match the glob)
@@ -535,6 +578,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.folder",
                                 "name": "ignored_subsubsubfolder",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/subsubsub/view?usp=drivesdk",
                             },
                         ]
@@ -549,6 +593,7 @@ def flatten_list(list_of_lists):
                     mime_type="text/csv",
                     original_mime_type="text/csv",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/file/d/ghi/view?usp=drivesdk",
                 ),
             ],
@@ -565,6 +610,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.document",
                                 "name": "MyDoc",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/document/d/abc/edit?usp=drivesdk",
                             }
                         ]
@@ -578,6 +624,7 @@ def flatten_list(list_of_lists):
                     original_mime_type="application/vnd.google-apps.document",
                     mime_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/document/d/abc/edit?usp=drivesdk",
                 )
             ],
@@ -594,6 +641,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.presentation",
                                 "name": "MySlides",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/presentation/d/abc/edit?usp=drivesdk",
                             }
                         ]
@@ -607,6 +655,7 @@ def flatten_list(list_of_lists):
                     original_mime_type="application/vnd.google-apps.presentation",
                     mime_type="application/pdf",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/presentation/d/abc/edit?usp=drivesdk",
                 )
             ],
@@ -623,6 +672,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.drawing",
                                 "name": "MyDrawing",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/drawings/d/abc/edit?usp=drivesdk",
                             }
                         ]
@@ -636,6 +686,7 @@ def flatten_list(list_of_lists):
                     original_mime_type="application/vnd.google-apps.drawing",
                     mime_type="application/pdf",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/drawings/d/abc/edit?usp=drivesdk",
                 )
             ],
@@ -652,6 +703,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.video",
                                 "name": "MyVideo",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/abc/view?usp=drivesdk",
                             }
                         ]
@@ -665,6 +717,7 @@ def flatten_list(list_of_lists):
                     original_mime_type="application/vnd.google-apps.video",
                     mime_type="application/vnd.google-apps.video",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/file/d/abc/view?usp=drivesdk",
                 )
             ],
@@ -708,6 +761,7 @@ def test_matching_files(mock_build_service, mock_service_account, glob, listing_
                 mime_type="text/csv",
                 original_mime_type="text/csv",
                 last_modified=datetime.datetime(2021, 1, 1),
+                created_at=datetime.datetime(2021, 1, 1),
                 view_link=f"https://docs.google.com/file/d/abc/view?usp=drivesdk",
             ),
             b"test",
@@ -725,6 +779,7 @@ def test_matching_files(mock_build_service, mock_service_account, glob, listing_
                 mime_type="text/csv",
                 original_mime_type="text/csv",
                 last_modified=datetime.datetime(2021, 1, 1),
+                created_at=datetime.datetime(2021, 1, 1),
                 view_link=f"https://docs.google.com/file/d/abc/view?usp=drivesdk",
             ),
             b"test",
@@ -742,6 +797,7 @@ def test_matching_files(mock_build_service, mock_service_account, glob, listing_
                 mime_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
                 original_mime_type="application/vnd.google-apps.document",
                 last_modified=datetime.datetime(2021, 1, 1),
+                created_at=datetime.datetime(2021, 1, 1),
                 view_link=f"https://docs.google.com/document/d/abc/edit?usp=drivesdk",
             ),
             b"test",
@@ -812,6 +868,7 @@ def test_open_file(
             GoogleDriveRemoteFile(
                 uri="some/path/in/source/test.jsonl",
                 last_modified=datetime.datetime(2023, 10, 16, 6, 16, 6),
+                created_at=datetime.datetime(2023, 10, 16, 6, 16, 6),
                 mime_type="application/octet-stream",
                 id="1",
                 original_mime_type="application/octet-stream",
@@ -832,6 +889,7 @@ def test_open_file(
             GoogleDriveRemoteFile(
                 uri="subfolder/test2.jsonl",
                 last_modified=datetime.datetime(2023, 10, 19, 1, 43, 56),
+                created_at=datetime.datetime(2023, 10, 19, 1, 43, 56),
                 mime_type="application/octet-stream",
                 id="test2",
                 original_mime_type="application/octet-stream",
@@ -852,6 +910,7 @@ def test_open_file(
             GoogleDriveRemoteFile(
                 uri="testdoc_docx.docx",
                 last_modified=datetime.datetime(2023, 10, 27, 0, 45, 54),
+                created_at=datetime.datetime(2023, 10, 27, 0, 45, 54),
                 mime_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
                 id="testdoc_docx",
                 original_mime_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
@@ -868,6 +927,7 @@ def test_open_file(
             GoogleDriveRemoteFile(
                 uri="testdoc_pdf.pdf",
                 last_modified=datetime.datetime(2023, 10, 27, 0, 45, 58),
+                created_at=datetime.datetime(2023, 10, 27, 0, 45, 58),
                 mime_type="application/pdf",
                 id="testdoc_pdf",
                 original_mime_type="application/pdf",
@@ -884,6 +944,7 @@ def test_open_file(
             GoogleDriveRemoteFile(
                 uri="testdoc_ocr_pdf.pdf",
                 last_modified=datetime.datetime(2023, 10, 27, 0, 46, 4),
+                created_at=datetime.datetime(2023, 10, 27, 0, 46, 4),
                 mime_type="application/pdf",
                 id="testdoc_ocr_pdf",
                 original_mime_type="application/pdf",
@@ -900,6 +961,7 @@ def test_open_file(
             GoogleDriveRemoteFile(
                 uri="testdoc_google",
                 last_modified=datetime.datetime(2023, 11, 10, 13, 46, 18, 551000),
+                created_at=datetime.datetime(2023, 11, 10, 13, 46, 18, 551000),
                 mime_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
                 id="testdoc_google",
                 original_mime_type="application/vnd.google-apps.document",
@@ -916,6 +978,7 @@ def test_open_file(
             GoogleDriveRemoteFile(
                 uri="testdoc_presentation",
                 last_modified=datetime.datetime(2023, 11, 10, 13, 49, 6, 640000),
+                created_at=datetime.datetime(2023, 11, 10, 13, 49, 6, 640000),
                 mime_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
                 id="testdoc_presentation",
                 original_mime_type="application/vnd.google-apps.presentation",
@@ -991,7 +1054,7 @@ def test_upload_file(
         assert expected_paths["file_relative_path"] == file_reference.source_file_relative_path
         assert file.mime_type == file_record_data.mime_type
 
-        assert path.basename(expected_paths["staging_file_url"]) == file_record_data.filename
+        assert path.basename(expected_paths["staging_file_url"]) == file_record_data.file_name
         assert path.dirname(expected_paths["staging_file_url"].replace(f"{TEST_LOCAL_DIRECTORY}/", "")) == file_record_data.folder
 
         assert mock_downloader.next_chunk.call_count == 2
@@ -1010,6 +1073,7 @@ def test_upload_file(
             GoogleDriveRemoteFile(
                 uri="test.csv",
                 last_modified=datetime.datetime(2023, 10, 16, 6, 16, 6),
+                created_at=datetime.datetime(2023, 10, 16, 6, 16, 6),
                 mime_type="text/csv",
                 id="123",
                 original_mime_type="text/csv",
@@ -1022,6 +1086,7 @@ def test_upload_file(
             GoogleDriveRemoteFile(
                 uri="shared_drive_test.csv",
                 last_modified=datetime.datetime(2023, 10, 16, 6, 16, 6),
+                created_at=datetime.datetime(2023, 10, 16, 6, 16, 6),
                 mime_type="text/csv",
                 id="456",
                 original_mime_type="text/csv",
@@ -1071,3 +1136,90 @@ def test_source_uri_format(
 
     file_record_data, _ = create_reader().upload(file, local_directory=TEST_LOCAL_DIRECTORY, logger=MagicMock())
     assert file_record_data.source_uri == expected_source_uri
+
+
+def drive_item(item_id, name, parent, mime_type="text/csv"):
+    return {
+        "id": item_id,
+        "mimeType": mime_type,
+        "name": name,
+        "modifiedTime": "2021-01-01T00:00:00.000Z",
+        "createdTime": "2021-01-01T00:00:00.000Z",
+        "webViewLink": f"https://docs.google.com/file/d/{item_id}/view?usp=drivesdk",
+        "parents": [parent],
+    }
+
+
+FOLDER_TREE = [
+    drive_item("a", "a", "root_id", "application/vnd.google-apps.folder"),
+    drive_item("b", "b", "root_id", "application/vnd.google-apps.folder"),
+    drive_item("c", "c", "root_id", "application/vnd.google-apps.folder"),
+    drive_item("root.csv", "root.csv", "root_id"),
+    drive_item("a.csv", "a.csv", "a"),
+    drive_item("b.csv", "b.csv", "b"),
+    drive_item("c.csv", "c.csv", "c"),
+    drive_item("ab", "ab", "a", "application/vnd.google-apps.folder"),
+    drive_item("ab.csv", "ab.csv", "ab"),
+    # link back to a folder that was already listed
+    drive_item("a", "link_to_a", "ab", "application/vnd.google-apps.folder"),
+    # file found in two folders, it gets the path of the first listing it is found in
+    {**drive_item("shared.csv", "shared.csv", "c"), "parents": ["c", "a"]},
+]
+
+
+@pytest.mark.parametrize(
+    "glob, batch_size, expected_queries, expected_uris",
+    [
+        pytest.param(
+            "**/*.csv",
+            25,
+            [["root_id"], ["a", "b", "c"], ["ab"]],
+            ["root.csv", "a/a.csv", "b/b.csv", "c/c.csv", "c/shared.csv", "a/ab/ab.csv"],
+            id="folders of a level listed together",
+        ),
+        pytest.param(
+            "**/*.csv",
+            2,
+            [["root_id"], ["a", "b"], ["c"], ["ab"]],
+            ["root.csv", "a/a.csv", "b/b.csv", "c/c.csv", "a/shared.csv", "a/ab/ab.csv"],
+            id="folders split into batches",
+        ),
+        pytest.param("a/ab/*.csv", 25, [["root_id"], ["a"], ["ab"]], ["a/ab/ab.csv"], id="folders pruned by prefix"),
+    ],
+)
+@patch("source_google_drive.stream_reader.service_account")
+@patch("source_google_drive.stream_reader.build")
+def test_matching_files_lists_folders_in_batches(mock_build_service, mock_service_account, glob, batch_size, expected_queries, expected_uris):
+    def list_files(q, **kwargs):
+        folder_ids = [clause.split("'")[1] for clause in q.split(" or ")]
+        if "a" in folder_ids:
+            # the listing of the first batch of a level completes after the other ones
+            time.sleep(0.05)
+        request = MagicMock()
+        request.execute.return_value = {"files": [item for item in FOLDER_TREE if set(item["parents"]) & set(folder_ids)]}
+        return request
+
+    files_service = MagicMock()
+    files_service.list.side_effect = list_files
+    files_service.list_next.return_value = None
+    drive_service = MagicMock()
+    drive_service.files.return_value = files_service
+    mock_build_service.return_value = drive_service
+
+    reader = create_reader(
+        config=SourceGoogleDriveSpec(
+            folder_url="https://drive.google.com/drive/folders/root_id",
+            streams=[FileBasedStreamConfig(name="test", format=JsonlFormat())],
+            credentials=ServiceAccountCredentials(auth_type="Service", service_account_info='{"test": "abc"}'),
+        )
+    )
+    reader.LISTING_BATCH_SIZE = batch_size
+
+    found_files = list(reader.get_matching_files([glob], None, MagicMock()))
+
+    # listings of the same level run concurrently, so neither the order of the found files nor the order of the queries is asserted
+    assert sorted(file.uri for file in found_files) == sorted(expected_uris)
+    assert sorted(
+        [clause.split("'")[1] for clause in list_call.kwargs["q"].split(" or ")] for list_call in files_service.list.call_args_list
+    ) == sorted(expected_queries)
+    assert all("parents" in list_call.kwargs["fields"] for list_call in files_service.list.call_args_list)
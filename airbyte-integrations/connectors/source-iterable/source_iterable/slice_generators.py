@@ -124,30 +124,38 @@ class AdjustableSliceGenerator(SliceGenerator):
     # Default is True so for first slice it would length would be INITIAL_RANGE_DAYS (30 days)
     _range_adjusted = True
 
-    def adjust_range(self, previous_request_time: Period):
+    def adjust_range(self, previous_request_time: Period, range_days: Optional[float] = None):
         """
         Calculate next slice length in days based on previous slice length and
-        processing time.
+        processing time. If range_days is given it is used as the number of
+        days processed within previous_request_time instead of the previous
+        slice length.
         """
         minutes_spent = previous_request_time.total_minutes()
         if minutes_spent == 0:
             self._current_range = self.DEFAULT_RANGE_DAYS
         else:
-            days_per_minute = self._current_range / minutes_spent
+            days_per_minute = (self._current_range if range_days is None else range_days) / minutes_spent
             next_range = math.floor(days_per_minute / self.REQUEST_PER_MINUTE_LIMIT)
             self._current_range = min(next_range or self.DEFAULT_RANGE_DAYS, self.MAX_RANGE_DAYS)
         self._range_adjusted = True
 
-    def reduce_range(self) -> StreamSlice:
+    def reduce_range(self, resume_date: Optional[DateTime] = None) -> StreamSlice:
         """
         This method is supposed to be called when slice processing failed.
         Reset next slice start date to previous one and reduce slice range by
         RANGE_REDUCE_FACTOR (2 times).
+        If part of the failed slice has already been processed, resume_date
+        is the date to continue from and the retried slice starts there
+        instead. The retried slice never ends after the failed one.
         Returns updated slice to try again.
         """
         self._current_range = int(max(self._current_range / self.RANGE_REDUCE_FACTOR, self.INITIAL_RANGE_DAYS))
         start_date = self._prev_start_date
-        end_date = min(self._end_date, start_date + (pendulum.Duration(days=self._current_range)))
+        if resume_date:
+            start_date = max(start_date, resume_date)
+        end_date = min(self._end_date, self._start_date, start_date + (pendulum.Duration(days=self._current_range)))
+        self._prev_start_date = start_date
         self._start_date = end_date
         return StreamSlice(start_date=start_date, end_date=end_date)
 
@@ -288,7 +288,9 @@ class IterableExportStreamAdjustableRange(IterableExportStream, ABC):
     In case of slice processing request failed with ChunkedEncodingError (which
     means that API server closed connection cause of request takes to much
     time) make CHUNKED_ENCODING_ERROR_RETRIES (6) retries each time reducing
-    slice length.
+    slice length. Retries continue from the last emitted record instead of
+    the slice start, so records emitted before the error are not emitted again.
+    Range adjustment is based on the whole slice processing time.
 
     See AdjustableSliceGenerator description for more details on next slice length adjustment alghorithm.
     """
@@ -314,7 +316,15 @@ class IterableExportStreamAdjustableRange(IterableExportStream, ABC):
         stream_state: Mapping[str, Any] = None,
     ) -> Iterable[Mapping[str, Any]]:
         start_time = pendulum.now()
+        slice_start_date = stream_slice.start_date
+        # Export records come ordered by cursor field. The API filters them
+        # with a precision of one second, so a retry resumes from the second of
+        # the last emitted record and skips the records of that second it has
+        # already emitted.
+        resume_date: Optional[DateTime] = None
+        resume_date_records: List[Mapping[str, Any]] = []
         for _ in range(self.CHUNKED_ENCODING_ERROR_RETRIES):
+            seen_keys = {self._record_key(record) for record in resume_date_records}
             try:
                 self.logger.info(
                     f"Processing slice of {(stream_slice.end_date - stream_slice.start_date).total_days()} days for stream {self.name}"
@@ -325,16 +335,30 @@ class IterableExportStreamAdjustableRange(IterableExportStream, ABC):
                     stream_slice=stream_slice,
                     stream_state=stream_state,
                 ):
-                    now = pendulum.now()
-                    self._adjustable_generator.adjust_range(now - start_time)
+                    record_date = record[self.cursor_field].in_timezone("UTC").replace(microsecond=0)
+                    if record_date != resume_date:
+                        resume_date = record_date
+                        resume_date_records = []
+                        seen_keys = set()
+                    elif seen_keys and self._record_key(record) in seen_keys:
+                        continue
+                    resume_date_records.append(record)
                     yield record
-                    start_time = now
                 break
             except ChunkedEncodingError:
                 self.logger.warn("ChunkedEncodingError occurred, decrease days range and try again")
-                stream_slice = self._adjustable_generator.reduce_range()
+                stream_slice = self._adjustable_generator.reduce_range(resume_date)
         else:
             raise Exception(f"ChunkedEncodingError: Reached maximum number of retires: {self.CHUNKED_ENCODING_ERROR_RETRIES}")
+        # Slices without records leave the range unadjusted, see AdjustableSliceGenerator.
+        if resume_date:
+            self._adjustable_generator.adjust_range(
+                pendulum.now() - start_time, (stream_slice.end_date - slice_start_date).total_days()
+            )
+
+    @staticmethod
+    def _record_key(record: Mapping[str, Any]) -> str:
+        return json.dumps(record, sort_keys=True, default=str)
 
 
 class IterableExportEventsStreamAdjustableRange(IterableExportStreamAdjustableRange, ABC):
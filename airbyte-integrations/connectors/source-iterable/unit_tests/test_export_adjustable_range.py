@@ -5,18 +5,23 @@
 import datetime
 import json
 import urllib.parse
-from typing import List
+from typing import List, Optional
 from unittest import mock
 
 import freezegun
 import pendulum
 import pytest
+import requests
 import responses
 from requests.exceptions import ChunkedEncodingError
 from source_iterable.slice_generators import AdjustableSliceGenerator
 from source_iterable.source import SourceIterable
+from source_iterable.streams import EmailSend
+from urllib3.exceptions import ProtocolError
 
+from airbyte_cdk.models import SyncMode
 from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.sources.streams.http import HttpStream
 
 
 TEST_START_DATE = "2020"
@@ -117,3 +122,53 @@ def test_email_stream_chunked_encoding(mocker, mock_lists_resp, catalog, days_du
     assert len(ranges) == len(records)
     # since read is called on source instance, under the hood .streams() is called which triggers one more http call
     assert len(responses.calls) == 3 * len(ranges)
+
+
+class BrokenStreamRaw:
+    """Raw response body that closes the connection after break_offset bytes."""
+
+    def __init__(self, body: bytes, break_offset: Optional[int] = None):
+        self._body = body
+        self._break_offset = break_offset
+
+    def stream(self, chunk_size, decode_content=True):
+        body = self._body if self._break_offset is None else self._body[: self._break_offset]
+        for start in range(0, len(body), chunk_size):
+            yield body[start : start + chunk_size]
+        if self._break_offset is not None:
+            raise ProtocolError("Connection broken")
+
+
+@pytest.mark.parametrize("break_offset", (0, 10, 100, 333, 700, 1000))
+def test_email_stream_resumes_after_chunked_encoding_error(mocker, break_offset):
+    slice_start = pendulum.parse("2020-01-02")
+    # Three records share every half-second, so six records share every second.
+    records = [{"id": i, "createdAt": int(slice_start.timestamp() * 1000) + (i // 3) * 500} for i in range(30)]
+    requested_start_dates = []
+
+    def fake_read_records(self, sync_mode, cursor_field=None, stream_slice=None, stream_state=None):
+        start_date = pendulum.parse(stream_slice.start_date.strftime("%Y-%m-%d %H:%M:%S"))
+        requested_start_dates.append(start_date)
+        body = b"".join(
+            json.dumps(record).encode() + b"\n" for record in records if record["createdAt"] >= start_date.timestamp() * 1000
+        )
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = BrokenStreamRaw(body, break_offset if len(requested_start_dates) == 1 else None)
+        return self.parse_response(response)
+
+    mocker.patch.object(HttpStream, "read_records", fake_read_records)
+    stream = EmailSend(authenticator=None, start_date="2020-01-01", end_date="2020-01-10")
+    # the source sets the state of the stream before reading it
+    stream.state = {}
+
+    emitted = []
+    for stream_slice in stream.stream_slices(sync_mode=SyncMode.full_refresh):
+        emitted.extend(stream.read_records(sync_mode=SyncMode.full_refresh, cursor_field=None, stream_slice=stream_slice))
+
+    assert [record["id"] for record in emitted] == [record["id"] for record in records]
+    assert len(requested_start_dates) == 2
+    first_line_length = len(json.dumps(records[0])) + 1
+    if break_offset >= first_line_length:
+        # the retry resumes from the second of the last emitted record rather than the slice start
+        assert requested_start_dates[1] > pendulum.parse("2020-01-01")
@@ -103,3 +103,19 @@ def test_reduce_range():
     reduced_slice = slice_generator.reduce_range()
     assert reduced_slice.start_date == datetime(2022, 1, 1)
     assert reduced_slice.end_date == datetime(2022, 1, 31)
+
+
+def test_reduce_range_resume_date():
+    slice_generator = AdjustableSliceGenerator(start_date=datetime(2022, 1, 1), end_date=datetime(2022, 3, 31))
+    next(slice_generator)
+    reduced_slice = slice_generator.reduce_range(resume_date=datetime(2022, 1, 20))
+    assert reduced_slice.start_date == datetime(2022, 1, 20)
+    assert reduced_slice.end_date == datetime(2022, 1, 31)
+    assert next(slice_generator).start_date == datetime(2022, 1, 31)
+
+
+def test_adjust_range_days():
+    slice_generator = AdjustableSliceGenerator(start_date=TEST_DATE, end_date=TEST_DATE + pendulum.Duration(days=1000))
+    next(slice_generator)
+    slice_generator.adjust_range(pendulum.Duration(minutes=10), range_days=80)
+    assert (next(slice_generator).end_date - TEST_DATE).days == 30 + 2
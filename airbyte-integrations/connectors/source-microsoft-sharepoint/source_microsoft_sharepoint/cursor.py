@@ -0,0 +1,60 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+from typing import Any, Dict, Iterable, MutableMapping, Optional, Set
+
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.stream.cursor import DefaultFileBasedCursor
+from airbyte_cdk.sources.file_based.types import StreamState
+
+
+class SourceMicrosoftSharePointCursor(DefaultFileBasedCursor):
+    """
+    File-based cursor that also keeps the Graph delta link of every drive in the stream state, so the next sync only lists
+    the items changed since this one.
+
+    The delta links returned by the listing of this sync replace the previous ones in the state only once every file it
+    selected to sync has been synced. If the sync fails before that, the next one lists the same changes again.
+    """
+
+    DELTA_LINKS_KEY = "delta_links"
+
+    def __init__(self, stream_config: FileBasedStreamConfig, **kwargs: Any):
+        super().__init__(stream_config, **kwargs)
+        self._delta_links: Dict[str, str] = {}
+        self._next_delta_links: Optional[Dict[str, str]] = None
+        self._files_left_to_sync: Set[str] = set()
+        self._files_to_sync_selected = False
+
+    def set_initial_state(self, value: StreamState) -> None:
+        super().set_initial_state(value)
+        self._delta_links = dict(value.get(self.DELTA_LINKS_KEY, {}))
+
+    def start_listing(self) -> MutableMapping[str, str]:
+        """
+        Returns the delta links to list the drives from, by drive id. The listing updates them in place with the delta
+        links of the next sync.
+        """
+        self._next_delta_links = dict(self._delta_links)
+        return self._next_delta_links
+
+    def get_files_to_sync(self, all_files: Iterable[RemoteFile], logger: logging.Logger) -> Iterable[RemoteFile]:
+        for file in super().get_files_to_sync(all_files, logger):
+            self._files_left_to_sync.add(file.uri)
+            yield file
+        self._files_to_sync_selected = True
+
+    def add_file(self, file: RemoteFile) -> None:
+        super().add_file(file)
+        self._files_left_to_sync.discard(file.uri)
+
+    def get_state(self) -> StreamState:
+        state = super().get_state()
+        if self._next_delta_links is not None and self._files_to_sync_selected and not self._files_left_to_sync:
+            self._delta_links = self._next_delta_links
+        if self._delta_links:
+            state[self.DELTA_LINKS_KEY] = self._delta_links
+        return state
@@ -117,6 +117,12 @@ class SourceMicrosoftSharePointSpec(AbstractFileBasedSpec, BaseModel):
         order=5,
         default="",
     )
+    delta_listing: bool = Field(
+        title="Incremental File Listing",
+        description="List only the files changed since the previous sync of each stream, using Microsoft Graph delta queries on the drives. The first sync of a stream, and syncs whose delta link has expired, still list all files. This does not apply to shared items.",
+        order=6,
+        default=False,
+    )
 
     @classmethod
     def documentation_url(cls) -> str:
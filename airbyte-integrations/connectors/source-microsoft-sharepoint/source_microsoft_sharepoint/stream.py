@@ -0,0 +1,21 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+from typing import Iterable
+
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.stream import DefaultFileBasedStream
+from source_microsoft_sharepoint.cursor import SourceMicrosoftSharePointCursor
+
+
+class SourceMicrosoftSharePointStream(DefaultFileBasedStream):
+    def get_files(self) -> Iterable[RemoteFile]:
+        """
+        Return all files that belong to the stream as defined by the stream's globs, listing the drives from the delta
+        links held by the cursor when there is one.
+        """
+        delta_links = self._cursor.start_listing() if isinstance(self._cursor, SourceMicrosoftSharePointCursor) else None
+        return self.stream_reader.get_matching_files(
+            self.config.globs or [], self.config.legacy_prefix, self.logger, delta_links=delta_links
+        )
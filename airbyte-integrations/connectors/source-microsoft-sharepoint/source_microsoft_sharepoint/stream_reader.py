@@ -9,7 +9,8 @@ from datetime import datetime
 from functools import lru_cache
 from io import IOBase
 from os.path import getsize
-from typing import Any, Callable, Dict, Iterable, List, MutableMapping, Optional, Tuple
+from typing import Any, Callable, Dict, Generator, Iterable, List, Mapping, MutableMapping, Optional, Tuple
+from urllib.parse import unquote
 
 import requests
 import smart_open
@@ -31,6 +32,8 @@ from source_microsoft_sharepoint.spec import SourceMicrosoftSharePointSpec
 
 from .exceptions import ErrorFetchingMetadata
 from .utils import (
+    LOGGER,
+    DeltaLinkExpiredException,
     FolderNotFoundException,
     MicrosoftSharePointRemoteFile,
     execute_query_with_retry,
@@ -41,6 +44,7 @@ from .utils import (
 
 SITE_TITLE = "Title"
 SITE_PATH = "Path"
+GRAPH_API_URL = "https://graph.microsoft.com/v1.0"
 
 
 class SourceMicrosoftSharePointClient:
@@ -183,7 +187,7 @@ class SourceMicrosoftSharePointStreamReader(AbstractFileBasedStreamReader):
 
         access_token = self.get_access_token()
         headers = {"Authorization": f"Bearer {access_token}"}
-        base_url = f"https://graph.microsoft.com/v1.0/drives/{drive_id}"
+        base_url = f"{GRAPH_API_URL}/drives/{drive_id}"
 
         def get_files(url: str, path: str) -> Iterable[MicrosoftSharePointRemoteFile]:
             response = requests.get(url, headers=headers)
@@ -246,26 +250,132 @@ class SourceMicrosoftSharePointStreamReader(AbstractFileBasedStreamReader):
                 yield from self._list_directories_and_files(item, item_path)
         yield from []
 
-    def _get_files_by_drive_name(self, drives, folder_path) -> Iterable[MicrosoftSharePointRemoteFile]:
-        """Yields files from the specified drive."""
+    def _get_files_by_drive_name(
+        self, drives, folder_path, delta_links: Optional[MutableMapping[str, str]] = None
+    ) -> Iterable[MicrosoftSharePointRemoteFile]:
+        """
+        Yields files from the specified drive.
+        If delta_links is given, drives are listed incrementally from the delta links it holds by drive id, and it is updated
+        in place with the delta links to list the drives from on the next sync.
+        """
         path_levels = [level for level in folder_path.split("/") if level]
         folder_path = "/".join(path_levels)
 
         for drive in drives:
             is_sharepoint = drive.drive_type == "documentLibrary"
             if is_sharepoint:
-                # Define base path for drive files to differentiate files between drives
-                if folder_path in self.ROOT_PATH:
-                    folder = drive.root
-                    folder_path_url = drive.web_url
+                if delta_links is None:
+                    yield from self._get_drive_files(drive, folder_path)
+                else:
+                    yield from self._get_drive_files_incrementally(drive, folder_path, delta_links)
+
+    def _get_drive_files(self, drive, folder_path: str) -> Iterable[MicrosoftSharePointRemoteFile]:
+        """Yields all files of the drive under folder_path, walking its folders."""
+        # Define base path for drive files to differentiate files between drives
+        if folder_path in self.ROOT_PATH:
+            folder = drive.root
+            folder_path_url = drive.web_url
+        else:
+            try:
+                folder = execute_query_with_retry(drive.root.get_by_path(folder_path).get())
+            except FolderNotFoundException:
+                return
+            folder_path_url = drive.web_url + "/" + folder_path
+
+        yield from self._list_directories_and_files(folder, folder_path_url)
+
+    def _get_drive_files_incrementally(
+        self, drive, folder_path: str, delta_links: MutableMapping[str, str]
+    ) -> Iterable[MicrosoftSharePointRemoteFile]:
+        """
+        Yields the files of the drive changed since its delta link was returned, and stores the delta link of the next sync.
+        Without a delta link, or once it has expired, all files of the drive are listed by walking its folders.
+        """
+        headers = self._get_headers()
+        delta_link = delta_links.get(drive.id)
+        if delta_link:
+            try:
+                delta_links[drive.id] = yield from self._list_changed_files(drive, folder_path, delta_link, headers)
+                return
+            except DeltaLinkExpiredException:
+                LOGGER.warning(f"The delta link of drive {drive.web_url} has expired, listing all of its files.")
+
+        # The delta link is requested before listing the files, so the changes made while they are listed are part of the next sync
+        latest_delta_link = self._get_graph_data(f"{GRAPH_API_URL}/drives/{drive.id}/root/delta?token=latest", headers)["@odata.deltaLink"]
+        yield from self._get_drive_files(drive, folder_path)
+        delta_links[drive.id] = latest_delta_link
+
+    @staticmethod
+    def _get_graph_data(url: str, headers: Mapping[str, str]) -> Mapping[str, Any]:
+        response = requests.get(url, headers=headers)
+        if response.status_code == 410:
+            # https://learn.microsoft.com/en-us/graph/api/driveitem-delta#response-1
+            raise DeltaLinkExpiredException(f"Delta link '{url}' has expired.")
+        if response.status_code != 200:
+            error_info = response.json().get("error", {}).get("message", "No additional error information provided.")
+            raise RuntimeError(f"Failed to retrieve data from URL '{url}'. HTTP status: {response.status_code}. Error: {error_info}")
+        return response.json()
+
+    def _list_changed_files(
+        self, drive, folder_path: str, delta_link: str, headers: Mapping[str, str]
+    ) -> Generator[MicrosoftSharePointRemoteFile, None, str]:
+        """
+        Yields the files under folder_path changed since delta_link was returned, and returns the delta link of the next sync.
+
+        Delta items do not hold their path, so it is built from the folders returned with the changes. The path of folders
+        that did not change is fetched once per sync.
+        """
+        base_url = f"{GRAPH_API_URL}/drives/{drive.id}"
+        folders: Dict[str, Tuple[str, str]] = {}
+        folder_paths: Dict[str, str] = {}
+
+        def get_folder_path(folder_id: str) -> str:
+            if folder_id not in folder_paths:
+                if folder_id in folders:
+                    name, parent_id = folders[folder_id]
+                    folder_paths[folder_id] = "/".join(level for level in (get_folder_path(parent_id), name) if level)
                 else:
-                    try:
-                        folder = execute_query_with_retry(drive.root.get_by_path(folder_path).get())
-                    except FolderNotFoundException:
-                        continue
-                    folder_path_url = drive.web_url + "/" + folder_path
+                    folder = self._get_graph_data(f"{base_url}/items/{folder_id}?$select=name,root,parentReference", headers)
+                    if "root" in folder:
+                        folder_paths[folder_id] = ""
+                    else:
+                        # e.g. "/drives/{drive_id}/root:/Folder%201/Folder%202"
+                        parent_path = unquote(folder["parentReference"]["path"].split("root:", 1)[1])
+                        folder_paths[folder_id] = "/".join(level for level in (*parent_path.split("/"), folder["name"]) if level)
+            return folder_paths[folder_id]
+
+        url = delta_link
+        while True:
+            data = self._get_graph_data(url, headers)
+            changed_files = []
+            for item in data.get("value", []):
+                if "deleted" in item:
+                    continue
+                if "root" in item:
+                    folder_paths[item["id"]] = ""
+                elif "folder" in item:
+                    folders[item["id"]] = (item["name"], item["parentReference"]["id"])
+                    folder_paths.pop(item["id"], None)
+                elif "file" in item:
+                    changed_files.append(item)
+
+            for item in changed_files:
+                item_path = "/".join(level for level in (get_folder_path(item["parentReference"]["id"]), item["name"]) if level)
+                if folder_path not in self.ROOT_PATH and folder_path and not item_path.startswith(folder_path + "/"):
+                    continue
+                download_url = item.get("@microsoft.graph.downloadUrl")
+                if not download_url:
+                    download_url = self._get_graph_data(f"{base_url}/items/{item['id']}", headers)["@microsoft.graph.downloadUrl"]
+                yield MicrosoftSharePointRemoteFile(
+                    uri=drive.web_url + "/" + item_path,
+                    download_url=download_url,
+                    last_modified=datetime.strptime(item["lastModifiedDateTime"], "%Y-%m-%dT%H:%M:%SZ"),
+                    created_at=datetime.strptime(item["createdDateTime"], "%Y-%m-%dT%H:%M:%SZ"),
+                )
 
-                yield from self._list_directories_and_files(folder, folder_path_url)
+            if "@odata.deltaLink" in data:
+                return data["@odata.deltaLink"]
+            url = data["@odata.nextLink"]
 
     def get_all_sites(self) -> List[MutableMapping[str, Any]]:
         """
@@ -373,10 +483,10 @@ class SourceMicrosoftSharePointStreamReader(AbstractFileBasedStreamReader):
             if parent_reference and parent_reference["driveId"] not in drive_ids:
                 yield from self._get_shared_drive_object(parent_reference["driveId"], drive_item.id, drive_item.web_url)
 
-    def get_all_files(self) -> Iterable[MicrosoftSharePointRemoteFile]:
+    def get_all_files(self, delta_links: Optional[MutableMapping[str, str]] = None) -> Iterable[MicrosoftSharePointRemoteFile]:
         if self.config.search_scope in ("ACCESSIBLE_DRIVES", "ALL"):
             # Get files from accessible drives
-            yield from self._get_files_by_drive_name(self.drives, self.config.folder_path)
+            yield from self._get_files_by_drive_name(self.drives, self.config.folder_path, delta_links)
 
         # skip this step for application authentication flow
         if self.config.credentials.auth_type != "Client" or (
@@ -388,23 +498,32 @@ class SourceMicrosoftSharePointStreamReader(AbstractFileBasedStreamReader):
                 # Get files from shared items
                 yield from self._get_shared_files_from_all_drives(parsed_drives)
 
-    def get_matching_files(self, globs: List[str], prefix: Optional[str], logger: logging.Logger) -> Iterable[RemoteFile]:
+    def get_matching_files(
+        self,
+        globs: List[str],
+        prefix: Optional[str],
+        logger: logging.Logger,
+        delta_links: Optional[MutableMapping[str, str]] = None,
+    ) -> Iterable[RemoteFile]:
         """
         Retrieve all files matching the specified glob patterns in SharePoint.
+        With the delta listing enabled, only the files changed since the delta links in delta_links were returned are
+        retrieved from the drives, and delta_links is updated in place with the links of the next sync.
         """
-        files = self.get_all_files()
+        if delta_links is not None and not self.config.delta_listing:
+            delta_links = None
+        listing_changes = bool(delta_links)
+        files = self.get_all_files(delta_links)
 
-        files_generator = filter_http_urls(
-            self.filter_files_by_globs_and_start_date([file for file in files], globs),
-            logger,
-        )
+        files_generator = filter_http_urls(self.filter_files_by_globs_and_start_date(files, globs), logger)
 
         items_processed = False
         for file in files_generator:
             items_processed = True
             yield file
 
-        if not items_processed:
+        # there may be no changes since the previous sync
+        if not items_processed and not listing_changes:
             raise AirbyteTracedException(
                 message=f"Drive is empty or does not exist.",
                 failure_type=FailureType.config_error,
@@ -27,6 +27,10 @@ class FolderNotFoundException(Exception):
     pass
 
 
+class DeltaLinkExpiredException(Exception):
+    pass
+
+
 class MicrosoftSharePointRemoteFile(RemoteFile):
     download_url: str
     created_at: datetime
@@ -0,0 +1,42 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+from datetime import datetime
+
+from source_microsoft_sharepoint.cursor import SourceMicrosoftSharePointCursor
+
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+
+
+def make_cursor(state=None) -> SourceMicrosoftSharePointCursor:
+    cursor = SourceMicrosoftSharePointCursor(FileBasedStreamConfig(name="test", globs=["**"], format={"filetype": "csv"}))
+    cursor.set_initial_state(state or {})
+    return cursor
+
+
+def test_delta_links_are_persisted_once_listed_files_are_synced():
+    cursor = make_cursor({"history": {}, "delta_links": {"drive-id": "previous-link"}})
+    delta_links = cursor.start_listing()
+    assert delta_links == {"drive-id": "previous-link"}
+    delta_links["drive-id"] = "next-link"
+
+    files = [RemoteFile(uri=f"file-{i}.csv", last_modified=datetime(2025, 1, i + 1)) for i in range(2)]
+    assert list(cursor.get_files_to_sync(files, logging.getLogger())) == files
+
+    cursor.add_file(files[0])
+    assert cursor.get_state()["delta_links"] == {"drive-id": "previous-link"}
+    cursor.add_file(files[1])
+    assert cursor.get_state()["delta_links"] == {"drive-id": "next-link"}
+    assert make_cursor(cursor.get_state()).start_listing() == {"drive-id": "next-link"}
+
+
+def test_delta_links_without_files_to_sync():
+    cursor = make_cursor()
+    cursor.start_listing()["drive-id"] = "next-link"
+    assert "delta_links" not in cursor.get_state()
+
+    assert list(cursor.get_files_to_sync([], logging.getLogger())) == []
+    assert cursor.get_state()["delta_links"] == {"drive-id": "next-link"}
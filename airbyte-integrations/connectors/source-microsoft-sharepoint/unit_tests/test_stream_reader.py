@@ -967,3 +967,114 @@ def test_get_all_sites_with_no_results(test_case, search_job_value, primary_quer
             "contentclass:STS_Site NOT Path:https://test-tenant-my.sharepoint.com"
         )
         mock_execute_query.assert_called_once_with(mock_search_job)
+
+
+DRIVE_WEB_URL = "https://test-tenant.sharepoint.com/Shared%20Documents"
+DELTA_URL = "https://graph.microsoft.com/v1.0/drives/drive-id/root/delta"
+ITEMS_URL = "https://graph.microsoft.com/v1.0/drives/drive-id/items"
+
+# Graph responses recorded from a drive delta query, trimmed to the fields the reader uses
+DELTA_FIRST_PAGE = {
+    "value": [
+        {"id": "root-id", "name": "root", "root": {}, "folder": {"childCount": 2}},
+        {"id": "reports-id", "name": "Reports", "folder": {"childCount": 1}, "parentReference": {"driveId": "drive-id", "id": "root-id"}},
+        {
+            "id": "file-1-id",
+            "name": "january.csv",
+            "file": {"mimeType": "text/csv"},
+            "lastModifiedDateTime": "2025-01-02T10:00:00Z",
+            "createdDateTime": "2025-01-01T10:00:00Z",
+            "parentReference": {"driveId": "drive-id", "id": "reports-id"},
+            "@microsoft.graph.downloadUrl": "https://test-tenant.sharepoint.com/download/file-1",
+        },
+        {"id": "file-2-id", "deleted": {"state": "deleted"}, "parentReference": {"driveId": "drive-id", "id": "reports-id"}},
+    ],
+    "@odata.nextLink": f"{DELTA_URL}?token=page-2",
+}
+DELTA_LAST_PAGE = {
+    "value": [
+        {
+            "id": "file-3-id",
+            "name": "february.csv",
+            "file": {"mimeType": "text/csv"},
+            "lastModifiedDateTime": "2025-02-02T10:00:00Z",
+            "createdDateTime": "2025-02-01T10:00:00Z",
+            "parentReference": {"driveId": "drive-id", "id": "archive-id"},
+        },
+    ],
+    "@odata.deltaLink": f"{DELTA_URL}?token=next-sync",
+}
+ARCHIVE_FOLDER = {"id": "archive-id", "name": "2024", "parentReference": {"driveId": "drive-id", "path": "/drives/drive-id/root:/Reports/Old%20Archive"}}
+FILE_3 = {"id": "file-3-id", "name": "february.csv", "@microsoft.graph.downloadUrl": "https://test-tenant.sharepoint.com/download/file-3"}
+
+
+@pytest.fixture
+def delta_reader(setup_reader_class, mocker):
+    reader = setup_reader_class
+    reader.config.delta_listing = True
+    mocker.patch.object(reader, "get_access_token", return_value="token")
+    return reader
+
+
+def mock_sharepoint_drive():
+    return Mock(id="drive-id", drive_type="documentLibrary", web_url=DRIVE_WEB_URL)
+
+
+@pytest.mark.parametrize(
+    "folder_path, expected_uris",
+    [
+        (".", [f"{DRIVE_WEB_URL}/Reports/january.csv", f"{DRIVE_WEB_URL}/Reports/Old Archive/2024/february.csv"]),
+        ("Reports/Old Archive", [f"{DRIVE_WEB_URL}/Reports/Old Archive/2024/february.csv"]),
+        ("/Sales/", []),
+    ],
+)
+def test_get_files_by_drive_name_from_delta_link(requests_mock, delta_reader, folder_path, expected_uris):
+    requests_mock.get(f"{DELTA_URL}?token=previous-sync", json=DELTA_FIRST_PAGE)
+    requests_mock.get(f"{DELTA_URL}?token=page-2", json=DELTA_LAST_PAGE)
+    requests_mock.get(f"{ITEMS_URL}/archive-id", json=ARCHIVE_FOLDER)
+    requests_mock.get(f"{ITEMS_URL}/file-3-id", json=FILE_3)
+    delta_links = {"drive-id": f"{DELTA_URL}?token=previous-sync"}
+
+    files = list(delta_reader._get_files_by_drive_name([mock_sharepoint_drive()], folder_path, delta_links))
+
+    assert [file.uri for file in files] == expected_uris
+    assert delta_links == {"drive-id": f"{DELTA_URL}?token=next-sync"}
+    if folder_path == ".":
+        assert [file.download_url for file in files] == [
+            "https://test-tenant.sharepoint.com/download/file-1",
+            "https://test-tenant.sharepoint.com/download/file-3",
+        ]
+        assert files[1].last_modified == datetime(2025, 2, 2, 10)
+
+
+@pytest.mark.parametrize("delta_link", [None, f"{DELTA_URL}?token=expired"])
+def test_get_files_by_drive_name_walks_drive_without_valid_delta_link(requests_mock, delta_reader, mock_drive_files, delta_link):
+    requests_mock.get(
+        f"{DELTA_URL}?token=expired", status_code=410, json={"error": {"code": "resyncRequired", "message": "Resync required."}}
+    )
+    requests_mock.get(f"{DELTA_URL}?token=latest", json={"value": [], "@odata.deltaLink": f"{DELTA_URL}?token=next-sync"})
+    delta_reader._list_directories_and_files = Mock(return_value=iter(mock_drive_files))
+    delta_links = {"drive-id": delta_link} if delta_link else {}
+
+    files = list(delta_reader._get_files_by_drive_name([mock_sharepoint_drive()], ".", delta_links))
+
+    assert files == mock_drive_files
+    assert delta_links == {"drive-id": f"{DELTA_URL}?token=next-sync"}
+
+
+def test_get_matching_files_without_changes(delta_reader):
+    delta_reader._get_files_by_drive_name = Mock(return_value=iter([]))
+    delta_reader._get_shared_files_from_all_drives = Mock(return_value=iter([]))
+    delta_links = {"drive-id": f"{DELTA_URL}?token=previous-sync"}
+
+    assert list(delta_reader.get_matching_files(["*.csv"], None, Mock(), delta_links=delta_links)) == []
+    delta_reader._get_files_by_drive_name.assert_called_once_with(ANY, ".", delta_links)
+
+
+def test_get_matching_files_ignores_delta_links_when_delta_listing_is_disabled(delta_reader, mock_drive_files):
+    delta_reader.config.delta_listing = False
+    delta_reader._get_files_by_drive_name = Mock(return_value=iter(mock_drive_files))
+    delta_reader._get_shared_files_from_all_drives = Mock(return_value=iter([]))
+
+    list(delta_reader.get_matching_files(["*.csv"], None, Mock(), delta_links={"drive-id": "link"}))
+    delta_reader._get_files_by_drive_name.assert_called_once_with(ANY, ".", None)
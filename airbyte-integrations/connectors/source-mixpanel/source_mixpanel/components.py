@@ -19,9 +19,9 @@ from airbyte_cdk.sources.declarative.requesters.error_handlers.backoff_strategie
 from airbyte_cdk.sources.declarative.requesters.paginators.strategies.page_increment import PageIncrement
 from airbyte_cdk.sources.declarative.transformations import RecordTransformation
 from airbyte_cdk.sources.declarative.types import Config, Record, StreamSlice, StreamState
-from airbyte_cdk.sources.streams.http.error_handlers import ErrorResolution, ResponseAction
+from airbyte_cdk.sources.streams.http.error_handlers.response_models import SUCCESS_RESOLUTION, ErrorResolution, ResponseAction
 from source_mixpanel.backoff_strategy import DEFAULT_API_BUDGET
-from source_mixpanel.property_transformation import transform_property_names
+from source_mixpanel.property_transformation import cached_property_names_transformation
 from source_mixpanel.source import raise_config_error
 
 
@@ -387,10 +387,11 @@ def iter_dicts(lines, logger=logging.getLogger("airbyte")):
 
 
 class ExportDpathExtractor(DpathExtractor):
-    def extract_records(self, response: requests.Response) -> List[Mapping[str, Any]]:
-        # We prefer response.iter_lines() to response.text.split_lines() as the later can missparse text properties embeding linebreaks
-        records = list(iter_dicts(response.iter_lines(decode_unicode=True)))
-        return records
+    def extract_records(self, response: requests.Response) -> Iterable[Mapping[str, Any]]:
+        # We prefer response.iter_lines() to response.text.split_lines() as the later can missparse text properties embeding linebreaks.
+        # The export requesters set `stream_response`, so records are yielded as the body is downloaded: a daily export can take
+        # several GB and is never held in memory.
+        yield from iter_dicts(response.iter_lines(decode_unicode=True))
 
 
 class ExportErrorHandler(DefaultErrorHandler):
@@ -401,6 +402,7 @@ class ExportErrorHandler(DefaultErrorHandler):
     - 400 status code with "to_date cannot be later than today" message, indicating a potential timezone mismatch.
     - ConnectionResetError during response parsing, indicating a need to retry the request.
 
+    Successful responses are streamed and are not matched against the response filters, as evaluating them parses the whole body.
     If the response does not match these specific cases, the handler defers to the parent class's implementation.
 
     """
@@ -416,6 +418,8 @@ class ExportErrorHandler(DefaultErrorHandler):
                     failure_type=FailureType.transient_error,
                     error_message=f"Response status code: {response_or_exception.status_code}. Retrying...",
                 )
+            if response_or_exception.ok:
+                return SUCCESS_RESOLUTION
 
         return super().interpret_response(response_or_exception)
 
@@ -433,11 +437,11 @@ class PropertiesTransformation(RecordTransformation):
         stream_state: Optional[StreamState] = None,
         stream_slice: Optional[StreamSlice] = None,
     ) -> None:
-        updated_record = {}
         to_transform = record[self.properties_field] if self.properties_field else record
-
-        for result in transform_property_names(to_transform.keys()):
-            updated_record[result.transformed_name] = to_transform[result.source_name]
+        updated_record = {
+            result.transformed_name: to_transform[result.source_name]
+            for result in cached_property_names_transformation(tuple(to_transform))
+        }
 
         if self.properties_field:
             record[self.properties_field].clear()
@@ -3,7 +3,8 @@
 #
 
 from collections import defaultdict
-from typing import Iterable, Iterator, NamedTuple
+from functools import lru_cache
+from typing import Iterable, Iterator, NamedTuple, Tuple
 
 
 class TransformationResult(NamedTuple):
@@ -36,3 +37,12 @@ def transform_property_names(property_names: Iterable[str]) -> Iterator[Transfor
 
         lowercase_properties.add(lowercase_property_name)
         yield TransformationResult(source_name=property_name, transformed_name=property_name_transformed)
+
+
+@lru_cache(maxsize=1024)
+def cached_property_names_transformation(property_names: Tuple[str, ...]) -> Tuple[TransformationResult, ...]:
+    """
+    Memoized transform_property_names. Events of the same type share a property set,
+    so the names are sorted and renamed once per distinct set instead of once per record.
+    """
+    return tuple(transform_property_names(property_names))
@@ -9,6 +9,7 @@ that will conflict in further data normalization, like:
 """
 
 import pytest
+from source_mixpanel.property_transformation import cached_property_names_transformation
 
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.declarative.types import StreamSlice
@@ -60,3 +61,17 @@ def test_export_stream_conflict_names(requests_mock, export_response, config_raw
     assert record["userName"] == "1"
     assert record["_userName"] == "2"
     assert record["__username"] == "3"
+
+
+def test_cached_property_names_transformation():
+    cached_property_names_transformation.cache_clear()
+    names = ("$userName", "userName", "username", "time")
+    first = cached_property_names_transformation(names)
+    assert cached_property_names_transformation(names) is first
+    assert cached_property_names_transformation.cache_info().hits == 1
+    assert [(result.source_name, result.transformed_name) for result in first] == [
+        ("$userName", "userName"),
+        ("time", "time"),
+        ("userName", "_userName"),
+        ("username", "__username"),
+    ]
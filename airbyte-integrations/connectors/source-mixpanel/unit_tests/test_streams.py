@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import io
 import json
 import logging
 import urllib.parse
@@ -13,7 +14,7 @@ import pytest
 import responses
 import source_mixpanel
 from source_mixpanel import SourceMixpanel
-from source_mixpanel.components import iter_dicts
+from source_mixpanel.components import ExportDpathExtractor, iter_dicts
 from source_mixpanel.utils import read_full_refresh
 
 from airbyte_cdk.models import (
@@ -699,6 +700,34 @@ def test_export_iter_dicts():
     assert list(iter_dicts([record_string, record_string[:2], record_string, record_string[2:]])) == [record, record]
 
 
+def test_export_extractor_yields_lazily():
+    record = {"event": "Viewed Page", "properties": {"time": 1}}
+
+    def lines(**kwargs):
+        yield json.dumps(record)
+        raise AssertionError("the response has been read past the first record")
+
+    response = mock.Mock(iter_lines=lines)
+    records = ExportDpathExtractor(field_path=[], config={}, parameters={}).extract_records(response)
+    assert next(iter(records)) == record
+
+
+
+def test_export_stream_reads_response_lazily(requests_mock, config_raw):
+    stream = init_stream("export", config_raw)
+    record_line = json.dumps({"event": "Viewed Page", "properties": {"time": 1485302400, "distinct_id": "1"}}).encode() + b"\n"
+    body = io.BytesIO(record_line * 10000)
+
+    requests_mock.register_uri("GET", get_url_to_mock(stream), body=body)
+    requests_mock.register_uri("GET", "https://mixpanel.com/api/query/events/properties/top", json={})
+    stream_slice = StreamSlice(partition={}, cursor_slice={"start_time": "2017-01-25T00:00:00Z", "end_time": "2017-02-25T00:00:00Z"})
+    records = stream.read_records(sync_mode=SyncMode.incremental, stream_slice=stream_slice)
+
+    assert next(iter(records))["event"] == "Viewed Page"
+    # the export is read as the records are consumed, not downloaded upfront
+    assert not body.closed and body.tell() < len(body.getvalue())
+
+
 @responses.activate
 def test_export_full_refresh_read(export_config, engage_response):
     config = export_config.copy()
@@ -166,6 +166,8 @@ class SourceSalesforce(ConcurrentSourceAdapter):
             stream_class = incremental
             stream_kwargs["replication_key"] = replication_key
             stream_kwargs["stream_slice_step"] = config.get("stream_slice_step", "P30D")
+            if api_type == "bulk" and config.get("bulk_job_target_record_count"):
+                stream_kwargs["bulk_job_target_record_count"] = config["bulk_job_target_record_count"]
         else:
             stream_class = full_refresh
 
@@ -4,11 +4,13 @@
 
 import csv
 import ctypes
+import os
 import urllib.parse
 from abc import ABC
-from datetime import timedelta
-from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Type, Union
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Type, Union
 
+import pandas as pd
 import pendulum
 import requests  # type: ignore[import]
 from pendulum import DateTime  # type: ignore[attr-defined]
@@ -63,6 +65,12 @@ csv.field_size_limit(CSV_FIELD_SIZE_LIMIT)
 DEFAULT_ENCODING = "utf-8"
 LOOKBACK_SECONDS = 600  # based on https://trailhead.salesforce.com/trailblazer-community/feed/0D54V00007T48TASAZ
 _JOB_TRANSIENT_ERRORS_MAX_RETRY = 1
+BULK_RESULT_CHUNK_SIZE = 1000
+# same strings as the ones accepted by TypeTransformer.default_convert for boolean fields
+BOOLEAN_STRINGS = {
+    **{string: True for string in ("y", "yes", "t", "true", "on", "1")},
+    **{string: False for string in ("n", "no", "f", "false", "off", "0")},
+}
 
 
 class SalesforceStream(HttpStream, ABC):
@@ -386,9 +394,69 @@ class RestSalesforceSubStream(BatchedSubStream, RestSalesforceStream):
     pass
 
 
+class BulkJobSliceSizer:
+    """
+    Resizes the datetime windows of BULK jobs so that each job returns about `target_records_per_job` records.
+
+    The number of records of each window is counted with `count_records` (a `SELECT COUNT()` query for the streams). Windows holding more
+    records than the target are split in two until they hold less or get as small as `min_window`, following windows holding less are
+    merged as long as they hold less than the target altogether. This avoids both multi-hour jobs and many jobs for a few records each.
+    Windows whose records could not be counted, i.e. `count_records` returned None, are kept as they are.
+    """
+
+    def __init__(
+        self,
+        count_records: Callable[[datetime, datetime], Optional[int]],
+        target_records_per_job: int,
+        min_window: timedelta = timedelta(minutes=1),
+    ) -> None:
+        self._count_records = count_records
+        self._target_records_per_job = target_records_per_job
+        self._min_window = min_window
+
+    def resize(self, windows: Iterable[Tuple[datetime, datetime]]) -> Iterable[Tuple[datetime, datetime]]:
+        """
+        Yield the resized windows covering the same ranges as `windows`, which are expected to be sorted and to not overlap.
+        """
+        pending_window: Optional[Tuple[datetime, datetime]] = None
+        pending_count = 0
+        for start, end in windows:
+            count = self._count_records(start, end)
+            if count is None:
+                if pending_window:
+                    yield pending_window
+                pending_window, pending_count = None, 0
+                yield start, end
+                continue
+            for window, count in self._split(start, end, count):
+                if pending_window and pending_window[1] == window[0] and pending_count + count <= self._target_records_per_job:
+                    pending_window, pending_count = (pending_window[0], window[1]), pending_count + count
+                    continue
+                if pending_window:
+                    yield pending_window
+                pending_window, pending_count = window, count
+        if pending_window:
+            yield pending_window
+
+    def _split(self, start: datetime, end: datetime, count: int) -> Iterable[Tuple[Tuple[datetime, datetime], int]]:
+        if count <= self._target_records_per_job or end - start <= self._min_window:
+            yield (start, end), count
+            return
+        middle = start + (end - start) / 2
+        middle = middle.replace(microsecond=middle.microsecond // 1000 * 1000)  # Salesforce datetimes have a millisecond precision
+        first_half_count = self._count_records(start, middle)
+        if first_half_count is None:
+            yield (start, end), count
+            return
+        yield from self._split(start, middle, first_half_count)
+        # the windows are half-open hence the records of the second half are the ones not in the first one
+        yield from self._split(middle, end, max(count - first_half_count, 0))
+
+
 class BulkDatetimeStreamSlicer(StreamSlicer):
-    def __init__(self, cursor: Optional[ConcurrentCursor]) -> None:
+    def __init__(self, cursor: Optional[ConcurrentCursor], job_slice_sizer: Optional[BulkJobSliceSizer] = None) -> None:
         self._cursor = cursor
+        self._job_slice_sizer = job_slice_sizer
 
     def get_request_params(
         self,
@@ -431,6 +499,24 @@ class BulkDatetimeStreamSlicer(StreamSlicer):
             yield from [StreamSlice(partition={}, cursor_slice={})]
             return
 
+        if self._job_slice_sizer:
+            windows = (
+                (
+                    datetime.fromisoformat(stream_slice["start_date"].replace("Z", "+00:00")),
+                    datetime.fromisoformat(stream_slice["end_date"].replace("Z", "+00:00")),
+                )
+                for stream_slice in self._cursor.stream_slices()
+            )
+            for start, end in self._job_slice_sizer.resize(windows):
+                yield StreamSlice(
+                    partition={},
+                    cursor_slice={
+                        "start_date": start.isoformat(timespec="milliseconds"),
+                        "end_date": end.isoformat(timespec="milliseconds"),
+                    },
+                )
+            return
+
         for stream_slice in self._cursor.stream_slices():
             yield StreamSlice(
                 partition={},
@@ -501,6 +587,87 @@ class BulkParentStreamStreamSlicer(StreamSlicer):
             )
 
 
+def _to_boolean(value: str) -> bool:
+    try:
+        return BOOLEAN_STRINGS[value.lower().strip()]
+    except KeyError:
+        raise ValueError(f"Invalid boolean value: {value}")
+
+
+class BulkResultExtractor(ResponseToFileExtractor):
+    """
+    Extracts the records of a BULK job result page and casts their values according to the stream schema.
+
+    All the values of the CSV are strings, they used to be cast by the stream transformer which walks the schema for every record. The
+    records are now cast column by column instead: the cast of a column is derived from its property schema once, and returns the same
+    values as `TypeTransformer.default_convert` followed by `transform_empty_string_to_none` did.
+    """
+
+    VALUE_CASTS: Mapping[str, Callable[[str], Any]] = {"string": str, "number": float, "integer": int, "boolean": _to_boolean}
+
+    def __init__(self, schema: Mapping[str, Any], parameters: Mapping[str, Any]) -> None:
+        super().__init__(parameters=parameters)
+        self._properties = schema.get("properties", {})
+        self._column_casts: Dict[str, Optional[Callable[[List[Any]], List[Any]]]] = {}
+
+    def _get_column_cast(self, column: str) -> Optional[Callable[[List[Any]], List[Any]]]:
+        if column not in self._column_casts:
+            property_schema = self._properties.get(column)
+            self._column_casts[column] = self._create_column_cast(column, property_schema) if property_schema is not None else None
+        return self._column_casts[column]
+
+    def _create_column_cast(self, column: str, property_schema: Mapping[str, Any]) -> Callable[[List[Any]], List[Any]]:
+        types = property_schema.get("type", [])
+        types = [types] if isinstance(types, str) else types
+        target_types = [type_ for type_ in types if type_ != "null"]
+        if "null" not in types or len(target_types) != 1 or target_types[0] not in self.VALUE_CASTS:
+            # not a type generated for the fields supported by BULK, values are converted one by one as the transformer does
+            return lambda values: [
+                transform_empty_string_to_none(TypeTransformer.default_convert(value, property_schema), property_schema) for value in values
+            ]
+
+        value_cast = self.VALUE_CASTS[target_types[0]]
+        error_message = f"Failed to transform value from type 'string' to type '{property_schema['type']}' at path: '{column}'"
+
+        def cast(value: Optional[str]) -> Any:
+            if value is None:
+                return None
+            try:
+                return value_cast(value)
+            except ValueError:
+                if not value.strip():
+                    return None
+                self.logger.warning(error_message)
+                return value
+
+        if value_cast is str:
+            return lambda values: [value if value is None or value.strip() else None for value in values]
+        return lambda values: [cast(value) for value in values]
+
+    def _read_with_chunks(self, path: str, file_encoding: str, chunk_size: int = BULK_RESULT_CHUNK_SIZE) -> Iterable[Mapping[str, Any]]:
+        try:
+            with open(path, "r", encoding=file_encoding) as data:
+                chunks = pd.read_csv(data, chunksize=chunk_size, iterator=True, dialect="unix", dtype=object)
+                for chunk in chunks:
+                    chunk = chunk.where(chunk.notna(), None)
+                    columns = list(chunk.columns)
+                    values = []
+                    for column in columns:
+                        column_cast = self._get_column_cast(column)
+                        column_values = chunk[column].tolist()
+                        values.append(column_cast(column_values) if column_cast else column_values)
+                    for row in zip(*values):
+                        yield dict(zip(columns, row))
+        except pd.errors.EmptyDataError as e:
+            self.logger.info(f"Empty data received. {e}")
+            yield from []
+        except IOError as ioe:
+            raise ValueError(f"The IO/Error occured while reading tmp data. Called: {path}", ioe)
+        finally:
+            # remove binary tmp file, after data is read
+            os.remove(path)
+
+
 class BulkSalesforceStream(SalesforceStream):
     def __init__(self, **kwargs) -> None:
         self._stream_slicer_cursor = None
@@ -634,7 +801,7 @@ class BulkSalesforceStream(SalesforceStream):
         download_retriever = SimpleRetriever(
             requester=download_requester,
             record_selector=RecordSelector(
-                extractor=ResponseToFileExtractor(parameters={}),
+                extractor=BulkResultExtractor(self.get_json_schema(), parameters={}),
                 record_filter=None,
                 transformations=[],
                 schema_normalization=TypeTransformer(TransformConfig.NoTransform),
@@ -763,7 +930,10 @@ class BulkSalesforceStream(SalesforceStream):
     MAX_CHECK_INTERVAL_SECONDS = 2.0
     MAX_RETRY_NUMBER = 3
 
-    transformer = TypeTransformer(TransformConfig.CustomSchemaNormalization | TransformConfig.DefaultSchemaNormalization)
+    # the records of BULK jobs are cast while being extracted, see BulkResultExtractor
+    transformer = TypeTransformer(TransformConfig.NoTransform)
+    # records read through the standard API, once the stream has switched to it, are normalized as BULK records used to be
+    standard_records_transformer = TypeTransformer(TransformConfig.CustomSchemaNormalization | TransformConfig.DefaultSchemaNormalization)
 
     def get_query_select_fields(self) -> str:
         return ", ".join(
@@ -809,7 +979,11 @@ class BulkSalesforceStream(SalesforceStream):
             else:
                 yield from self._bulk_job_stream.read_records(sync_mode, cursor_field, stream_slice, stream_state)
         else:
-            yield from self._rest_stream.read_records(sync_mode, cursor_field, stream_slice, stream_state)
+            for record in self._rest_stream.read_records(sync_mode, cursor_field, stream_slice, stream_state):
+                if isinstance(record, Mapping):
+                    record = dict(record)
+                    self.standard_records_transformer.transform(record, self.get_json_schema())
+                yield record
 
     def _is_async_job_slice(self, stream_slice):
         return isinstance(stream_slice, StreamSlice) and "jobs" in stream_slice.extra_fields
@@ -817,7 +991,9 @@ class BulkSalesforceStream(SalesforceStream):
     def stream_slices(
         self, *, sync_mode: SyncMode, cursor_field: Optional[List[str]] = None, stream_state: Optional[Mapping[str, Any]] = None
     ) -> Iterable[Optional[Mapping[str, Any]]]:
-        self._instantiate_declarative_stream(BulkDatetimeStreamSlicer(self._stream_slicer_cursor), has_bulk_parent=False)
+        self._instantiate_declarative_stream(
+            BulkDatetimeStreamSlicer(self._stream_slicer_cursor, self.get_job_slice_sizer()), has_bulk_parent=False
+        )
         try:
             yield from self._bulk_job_stream.stream_slices(sync_mode=sync_mode, cursor_field=cursor_field, stream_state=stream_state)
         except BulkNotSupportedException:
@@ -833,6 +1009,10 @@ class BulkSalesforceStream(SalesforceStream):
             else:
                 yield from self._rest_stream.stream_slices(sync_mode=sync_mode, cursor_field=cursor_field, stream_state=stream_state)
 
+    def get_job_slice_sizer(self) -> Optional[BulkJobSliceSizer]:
+        """Returns the sizer of the datetime windows of the jobs, if they are to be resized"""
+        return None
+
     def get_standard_instance(self) -> SalesforceStream:
         """Returns a instance of standard logic(non-BULK) with same settings"""
         stream_kwargs = dict(
@@ -869,7 +1049,7 @@ class BulkSalesforceSubStream(BatchedSubStream, BulkSalesforceStream):
         yield from self._bulk_job_stream.stream_slices(sync_mode=sync_mode, cursor_field=cursor_field, stream_state=stream_state)
 
 
-@BulkSalesforceStream.transformer.registerCustomTransform
+@BulkSalesforceStream.standard_records_transformer.registerCustomTransform
 def transform_empty_string_to_none(instance: Any, schema: Any):
     """
     BULK API returns a `csv` file, where all values are initially as string type.
@@ -980,6 +1160,34 @@ class IncrementalRestSalesforceStream(RestSalesforceStream, CheckpointMixin, ABC
 class BulkIncrementalSalesforceStream(BulkSalesforceStream, IncrementalRestSalesforceStream):
     state_checkpoint_interval = None
 
+    def __init__(self, bulk_job_target_record_count: Optional[int] = None, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.bulk_job_target_record_count = bulk_job_target_record_count
+
+    def get_job_slice_sizer(self) -> Optional[BulkJobSliceSizer]:
+        if not self.bulk_job_target_record_count:
+            return None
+        return BulkJobSliceSizer(self.count_records, self.bulk_job_target_record_count)
+
+    def count_records(self, start: datetime, end: datetime) -> Optional[int]:
+        """
+        Returns the number of records with a cursor value in [start, end[ using a `SELECT COUNT()` query, cheaper than a BULK job.
+        Returns None if the query fails, the window then being synced as it is.
+        """
+        where_conditions = [
+            f"{self.cursor_field} >= {start.isoformat(timespec='milliseconds')}",
+            f"{self.cursor_field} < {end.isoformat(timespec='milliseconds')}",
+        ]
+        query = f"SELECT COUNT() FROM {self.name} WHERE {' AND '.join(where_conditions)}"
+        try:
+            _, response = self._http_client.send_request(
+                "GET", f"{self.url_base}/services/data/{self.sf_api.version}/queryAll", request_kwargs={}, params={"q": query}
+            )
+            return response.json()["totalSize"]
+        except Exception as error:
+            self.logger.warning(f"Could not count the records of stream {self.name} to size its BULK jobs, the window is not resized: {error}")
+            return None
+
     def request_params(
         self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
     ) -> MutableMapping[str, Any]:
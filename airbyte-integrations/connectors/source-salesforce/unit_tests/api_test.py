@@ -21,6 +21,7 @@ from source_salesforce.source import SourceSalesforce
 from source_salesforce.streams import (
     CSV_FIELD_SIZE_LIMIT,
     BulkIncrementalSalesforceStream,
+    BulkResultExtractor,
     BulkSalesforceStream,
     BulkSalesforceSubStream,
     IncrementalRestSalesforceStream,
@@ -38,6 +39,7 @@ from airbyte_cdk.models import (
     SyncMode,
     Type,
 )
+from airbyte_cdk.sources.declarative.extractors import ResponseToFileExtractor
 from airbyte_cdk.sources.streams import Stream
 from airbyte_cdk.sources.streams.concurrent.adapters import StreamFacade
 from airbyte_cdk.test.catalog_builder import CatalogBuilder
@@ -477,6 +479,40 @@ def test_csv_field_size_limit():
         pass
 
 
+def test_bulk_result_extractor_casts_values_as_the_transformer(tmp_path):
+    schema = {
+        "type": "object",
+        "properties": {
+            "Id": {"type": ["string", "null"]},
+            "Amount": {"type": ["number", "null"]},
+            "Count": {"type": ["integer", "null"]},
+            "IsDeleted": {"type": ["boolean", "null"]},
+            "CreatedDate": {"type": ["string", "null"], "format": "date-time"},
+            "Loose": {"type": ["string", "number", "null"]},
+        },
+    }
+    csv_content = (
+        '"Id","Amount","Count","IsDeleted","CreatedDate","Loose","NotInSchema"\n'
+        '"1","1.5","3","true","2023-01-01T00:00:00.000Z","a","x"\n'
+        '" ","","1.0","no"," ","  ",""\n'
+        '"3"," 2 ","-7","TRUE","","1","NULL"\n'
+        '"NA","abc","1_000","maybe","2023-01-02T00:00:00.000Z","",""\n'
+        '"5","1e3","99999999999999999999","0","","b","y"\n'
+    )
+    expected_path, path = tmp_path / "expected.csv", tmp_path / "result.csv"
+    expected_path.write_text(csv_content)
+    path.write_text(csv_content)
+
+    expected_records = list(ResponseToFileExtractor(parameters={})._read_with_chunks(str(expected_path), "utf-8"))
+    for record in expected_records:
+        BulkSalesforceStream.standard_records_transformer.transform(record, schema)
+    records = list(BulkResultExtractor(schema, parameters={})._read_with_chunks(str(path), "utf-8", chunk_size=2))
+
+    assert records == expected_records
+    assert [type(record["Amount"]) for record in records] == [float, type(None), float, str, float]
+    assert not path.exists()
+
+
 def test_convert_to_standard_instance(stream_config, stream_api):
     bulk_stream = generate_stream("Account", stream_config, stream_api)
     rest_stream = bulk_stream.get_standard_instance()
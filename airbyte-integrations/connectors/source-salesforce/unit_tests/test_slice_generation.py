@@ -1,12 +1,16 @@
 # Copyright (c) 2024 Airbyte, Inc., all rights reserved.
 
+from bisect import bisect_left
 from datetime import datetime, timedelta, timezone
 from unittest import TestCase
+from unittest.mock import Mock
 
 import freezegun
+import requests_mock
 from config_builder import ConfigBuilder
 from conftest import generate_stream, mock_stream_api
 from source_salesforce.api import UNSUPPORTED_BULK_API_SALESFORCE_OBJECTS
+from source_salesforce.streams import BulkDatetimeStreamSlicer, BulkIncrementalSalesforceStream, BulkJobSliceSizer
 
 from airbyte_cdk.models import SyncMode
 
@@ -40,3 +44,131 @@ class IncrementalSliceGenerationTest(TestCase):
             {"start_date": "2019-11-22T00:00:00.000+00:00", "end_date": "2019-12-22T00:00:00.000+00:00"},
             {"start_date": "2019-12-22T00:00:00.000+00:00", "end_date": "2020-01-01T00:00:00.000+00:00"},
         ]
+
+
+class RecordCounter:
+    """Counts records of a stream whose cursor values are `cursor_values`, as a `SELECT COUNT()` query would"""
+
+    def __init__(self, cursor_values):
+        self._cursor_values = sorted(cursor_values)
+        self.calls = 0
+
+    def __call__(self, start: datetime, end: datetime) -> int:
+        self.calls += 1
+        return bisect_left(self._cursor_values, end) - bisect_left(self._cursor_values, start)
+
+
+def _windows(start: datetime, end: datetime, step: timedelta):
+    while start < end:
+        yield start, min(start + step, end)
+        start += step
+
+
+class BulkJobSliceSizerTest(TestCase):
+    def setUp(self) -> None:
+        self._start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        self._end = self._start + timedelta(days=100)
+        # a quiet period of 80 days with a record per day followed by a busy period of 20 days with a record per minute
+        busy_start = self._start + timedelta(days=80)
+        self._cursor_values = [self._start + timedelta(days=day, hours=12) for day in range(80)] + [
+            busy_start + timedelta(minutes=minute) for minute in range(20 * 24 * 60)
+        ]
+
+    def test_when_resize_then_windows_hold_about_the_target_number_of_records(self) -> None:
+        count_records = RecordCounter(self._cursor_values)
+
+        windows = list(BulkJobSliceSizer(count_records, 2000).resize(_windows(self._start, self._end, timedelta(days=10))))
+
+        assert windows[0][0] == self._start
+        assert windows[-1][1] == self._end
+        assert all(previous[1] == current[0] for previous, current in zip(windows, windows[1:]))
+        counts = [count_records(start, end) for start, end in windows]
+        assert sum(counts) == len(self._cursor_values)
+        assert max(counts) <= 2000
+        # the 8 quiet windows are merged with the first busy one, busy windows are split in 8 windows of 1800 records (1.25 day)
+        assert counts[0] == 80 + 1800
+        assert len(windows) == 16
+
+    def test_given_records_with_the_same_cursor_value_when_resize_then_stop_splitting_at_min_window(self) -> None:
+        count_records = RecordCounter([self._start + timedelta(hours=1)] * 5000)
+
+        windows = list(
+            BulkJobSliceSizer(count_records, 1000, min_window=timedelta(hours=1)).resize([(self._start, self._start + timedelta(days=1))])
+        )
+
+        assert all(end - start <= timedelta(hours=1) or count_records(start, end) <= 1000 for start, end in windows)
+        assert sum(count_records(start, end) for start, end in windows) == 5000
+
+    def test_given_windows_with_gaps_when_resize_then_do_not_merge_across_gaps(self) -> None:
+        windows = [(self._start, self._start + timedelta(days=1)), (self._start + timedelta(days=2), self._start + timedelta(days=3))]
+
+        assert list(BulkJobSliceSizer(Mock(return_value=0), 1000).resize(windows)) == windows
+
+    def test_given_windows_which_cannot_be_counted_when_resize_then_keep_them_unsized(self) -> None:
+        count_records = RecordCounter(self._cursor_values)
+        failed_start = self._start + timedelta(days=85)
+
+        def count_records_failing_on_day_85(start: datetime, end: datetime):
+            # only the windows of the initial 10 days can be counted around day 85
+            return None if end - start < timedelta(days=10) and start <= failed_start < end else count_records(start, end)
+
+        windows = list(
+            BulkJobSliceSizer(count_records_failing_on_day_85, 2000).resize(_windows(self._start, self._end, timedelta(days=10)))
+        )
+
+        assert windows[0][0] == self._start
+        assert windows[-1][1] == self._end
+        assert all(previous[1] == current[0] for previous, current in zip(windows, windows[1:]))
+        # the window of day 80 to 90 is split until the count query fails, then its second half is kept as it is
+        assert (self._start + timedelta(days=85), self._start + timedelta(days=90)) in windows
+
+    def test_given_job_slice_sizer_when_stream_slices_then_return_resized_slices(self) -> None:
+        cursor = Mock()
+        cursor.stream_slices.return_value = [
+            {"start_date": "2020-01-01T00:00:00.000Z", "end_date": "2020-01-31T00:00:00.000Z"},
+            {"start_date": "2020-01-31T00:00:00.000Z", "end_date": "2020-02-05T00:00:00.000Z"},
+        ]
+        count_records = RecordCounter([datetime(2020, 1, 1, tzinfo=timezone.utc) + timedelta(hours=hour) for hour in range(24 * 35)])
+
+        slices = list(BulkDatetimeStreamSlicer(cursor, BulkJobSliceSizer(count_records, 500)).stream_slices())
+
+        # the first slice (720 records) is split in two, its second half (360 records) is merged with the second slice (120 records)
+        assert [stream_slice.cursor_slice for stream_slice in slices] == [
+            {"start_date": "2020-01-01T00:00:00.000+00:00", "end_date": "2020-01-16T00:00:00.000+00:00"},
+            {"start_date": "2020-01-16T00:00:00.000+00:00", "end_date": "2020-02-05T00:00:00.000+00:00"},
+        ]
+
+    def test_when_count_records_then_send_count_query(self) -> None:
+        config = ConfigBuilder().start_date(_NOW - timedelta(days=15)).build()
+        config["force_use_bulk_api"] = True
+        config["bulk_job_target_record_count"] = 1000
+        stream_api = mock_stream_api(config)
+        stream = generate_stream("Account", config, stream_api)
+        assert isinstance(stream, BulkIncrementalSalesforceStream)
+        assert stream.get_job_slice_sizer()
+
+        with requests_mock.Mocker() as mocker:
+            mocker.get(f"{stream_api.instance_url}/services/data/{stream_api.version}/queryAll", json={"totalSize": 42, "done": True})
+            count = stream.count_records(datetime(2020, 1, 1, tzinfo=timezone.utc), datetime(2020, 1, 2, tzinfo=timezone.utc))
+
+        assert count == 42
+        assert mocker.last_request.qs["q"] == [
+            "select count() from account where lastmodifieddate >= 2020-01-01t00:00:00.000+00:00 and lastmodifieddate < 2020-01-02t00:00:00.000+00:00"
+        ]
+
+    def test_given_count_query_fails_when_count_records_then_return_none(self) -> None:
+        config = ConfigBuilder().start_date(_NOW - timedelta(days=15)).build()
+        config["force_use_bulk_api"] = True
+        config["bulk_job_target_record_count"] = 1000
+        stream_api = mock_stream_api(config)
+        stream = generate_stream("Account", config, stream_api)
+
+        with requests_mock.Mocker() as mocker:
+            mocker.get(
+                f"{stream_api.instance_url}/services/data/{stream_api.version}/queryAll",
+                status_code=400,
+                json=[{"errorCode": "MALFORMED_QUERY", "message": "COUNT() is not supported"}],
+            )
+            count = stream.count_records(datetime(2020, 1, 1, tzinfo=timezone.utc), datetime(2020, 1, 2, tzinfo=timezone.utc))
+
+        assert count is None
@@ -85,3 +85,12 @@ class SFTPClient:
     @property
     def sftp_connection(self) -> paramiko.SFTPClient:
         return self._connection
+
+    def open_session(self) -> paramiko.SFTPClient:
+        """
+        Opens an additional SFTP session multiplexed over the existing SSH transport, so several requests
+        (e.g. directory listings) can be in flight at once without re-authenticating.
+        """
+        session = paramiko.SFTPClient.from_transport(self.transport)
+        session.get_channel().settimeout(self.timeout)
+        return session
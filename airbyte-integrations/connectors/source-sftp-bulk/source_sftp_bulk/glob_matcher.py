@@ -0,0 +1,51 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+
+import fnmatch
+import re
+from typing import List, Optional, Pattern
+
+
+GLOBSTAR = "**"
+
+
+def _split_path(path: str) -> List[str]:
+    # Repeated and leading separators are collapsed, mirroring how wcmatch compares paths like "//folder/file.csv"
+    return [segment for segment in path.split("/") if segment]
+
+
+class DirectoryGlobMatcher:
+    """
+    Tells whether a directory can contain any file matched by a set of globs, so the subtrees that cannot
+    are never listed.
+
+    Each glob is compiled once into one regex per path segment. A directory can hold a match when each of its
+    segments matches the glob segment at the same depth and the glob still has segments left for the file itself.
+    Reaching a `**` segment means any descendant may match. Matching is deliberately permissive (e.g. `*` matches
+    hidden names), since the final decision is still made per file by `filter_files_by_globs_and_start_date`:
+    a false positive only costs a listing, while a false negative would drop files.
+    """
+
+    def __init__(self, globs: List[str]):
+        self._compiled_globs = [self._compile(glob) for glob in globs]
+
+    @staticmethod
+    def _compile(glob: str) -> List[Optional[Pattern[str]]]:
+        # `None` stands for a globstar segment, which matches any number of directories
+        return [None if segment == GLOBSTAR else re.compile(fnmatch.translate(segment)) for segment in _split_path(glob)]
+
+    def may_contain_matches(self, directory: str) -> bool:
+        segments = _split_path(directory)
+        return any(self._glob_may_match_below(compiled_glob, segments) for compiled_glob in self._compiled_globs)
+
+    @staticmethod
+    def _glob_may_match_below(compiled_glob: List[Optional[Pattern[str]]], segments: List[str]) -> bool:
+        for depth, segment in enumerate(segments):
+            if depth >= len(compiled_glob):
+                return False
+            pattern = compiled_glob[depth]
+            if pattern is None:
+                return True
+            if not pattern.match(segment):
+                return False
+        return len(compiled_glob) > len(segments)
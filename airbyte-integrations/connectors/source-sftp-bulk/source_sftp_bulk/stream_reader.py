@@ -4,10 +4,15 @@
 import datetime
 import logging
 import stat
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from io import IOBase
-from typing import Iterable, List, Optional, Tuple
+from queue import Empty, Queue
+from typing import Iterable, Iterator, List, Optional, Tuple
 
+import paramiko
 import psutil
 from typing_extensions import override
 
@@ -18,11 +23,47 @@ from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFile
 from airbyte_cdk.sources.file_based.file_record_data import FileRecordData
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from source_sftp_bulk.client import SFTPClient
+from source_sftp_bulk.glob_matcher import DirectoryGlobMatcher
 from source_sftp_bulk.spec import SourceSFTPBulkSpec
 
 
+class _SFTPSessionPool:
+    """
+    Hands out SFTP sessions to concurrent listing workers. The client's main connection is reused first and
+    additional sessions are only opened when every existing one is busy, so the pool never grows beyond the
+    number of workers.
+    """
+
+    def __init__(self, client: SFTPClient):
+        self._client = client
+        self._idle_sessions: Queue = Queue()
+        self._idle_sessions.put(client.sftp_connection)
+        self._opened_sessions: List[paramiko.SFTPClient] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def session(self) -> Iterator[paramiko.SFTPClient]:
+        try:
+            session = self._idle_sessions.get_nowait()
+        except Empty:
+            session = self._client.open_session()
+            with self._lock:
+                self._opened_sessions.append(session)
+        try:
+            yield session
+        finally:
+            self._idle_sessions.put(session)
+
+    def close(self) -> None:
+        with self._lock:
+            for session in self._opened_sessions:
+                session.close()
+            self._opened_sessions.clear()
+
+
 class SourceSFTPBulkStreamReader(AbstractFileBasedStreamReader):
     FILE_SIZE_LIMIT = 1_500_000_000
+    LISTING_CONCURRENCY = 8
 
     def __init__(self):
         super().__init__()
@@ -68,25 +109,44 @@ class SourceSFTPBulkStreamReader(AbstractFileBasedStreamReader):
         prefix: Optional[str],
         logger: logging.Logger,
     ) -> Iterable[RemoteFile]:
-        directories = [self._config.folder_path or "/"]
+        directory_matcher = DirectoryGlobMatcher(globs)
+        session_pool = _SFTPSessionPool(self.sftp_client)
 
-        # Iterate through directories and subdirectories
-        while directories:
-            current_dir = directories.pop()
+        # Sibling directories are listed concurrently, each listing borrowing its own SFTP session from the pool.
+        # Subdirectories are only descended into when at least one glob could match a file below them.
+        with ThreadPoolExecutor(max_workers=self.LISTING_CONCURRENCY) as executor:
+            pending = {executor.submit(self._list_directory, session_pool, self._config.folder_path or "/", logger)}
+            try:
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        current_dir, items = future.result()
+                        for item in items:
+                            item_path = f"{current_dir}/{item.filename}"
+                            if item.st_mode and stat.S_ISDIR(item.st_mode):
+                                if directory_matcher.may_contain_matches(item_path):
+                                    pending.add(executor.submit(self._list_directory, session_pool, item_path, logger))
+                            else:
+                                yield from self.filter_files_by_globs_and_start_date(
+                                    [RemoteFile(uri=item_path, last_modified=datetime.datetime.fromtimestamp(item.st_mtime))],
+                                    globs,
+                                )
+            finally:
+                for future in pending:
+                    future.cancel()
+                executor.shutdown(wait=True)
+                session_pool.close()
+
+    @staticmethod
+    def _list_directory(
+        session_pool: "_SFTPSessionPool", directory: str, logger: logging.Logger
+    ) -> Tuple[str, List[paramiko.SFTPAttributes]]:
+        with session_pool.session() as session:
             try:
-                items = self.sftp_client.sftp_connection.listdir_attr(current_dir)
+                return directory, session.listdir_attr(directory)
             except Exception as e:
                 logger.warning(f"Failed to list files in directory: {e}")
-                continue
-
-            for item in items:
-                if item.st_mode and stat.S_ISDIR(item.st_mode):
-                    directories.append(f"{current_dir}/{item.filename}")
-                else:
-                    yield from self.filter_files_by_globs_and_start_date(
-                        [RemoteFile(uri=f"{current_dir}/{item.filename}", last_modified=datetime.datetime.fromtimestamp(item.st_mtime))],
-                        globs,
-                    )
+                return directory, []
 
     def open_file(self, file: RemoteFile, mode: FileReadMode, encoding: Optional[str], logger: logging.Logger) -> IOBase:
         remote_file = self.sftp_client.sftp_connection.open(file.uri, mode=mode.value)
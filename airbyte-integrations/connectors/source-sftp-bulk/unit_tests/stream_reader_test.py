@@ -7,6 +7,8 @@ from unittest.mock import MagicMock, patch
 
 import freezegun
 import paramiko
+import pytest
+from source_sftp_bulk.glob_matcher import DirectoryGlobMatcher
 from source_sftp_bulk.spec import SourceSFTPBulkSpec
 from source_sftp_bulk.stream_reader import SourceSFTPBulkStreamReader
 
@@ -40,3 +42,51 @@ def test_stream_reader_files_read_and_filter_by_date():
         assert len(files) == 1
         assert files[0].uri == "//sample_file_1.csv"
         assert files[0].last_modified == datetime.datetime(2024, 1, 1, 0, 0)
+
+
+def test_stream_reader_prunes_directories_that_cannot_match_globs():
+    directory_mode, file_mode = 0o040755, 0o100644
+    tree = {
+        "/": [MagicMock(filename="data", st_mode=directory_mode), MagicMock(filename="archive", st_mode=directory_mode)],
+        "//data": [
+            MagicMock(filename="2024", st_mode=directory_mode),
+            MagicMock(filename="2023", st_mode=directory_mode),
+            MagicMock(filename="readme.txt", st_mode=file_mode, st_mtime=1704067200),
+        ],
+        "//data/2024": [MagicMock(filename="sample_file_1.csv", st_mode=file_mode, st_mtime=1704067200)],
+    }
+    fake_client = MagicMock()
+    fake_client.from_transport = MagicMock(return_value=fake_client)
+    fake_client.listdir_attr = MagicMock(side_effect=lambda path: tree[path])
+    with patch.object(paramiko, "Transport", MagicMock()), patch.object(paramiko, "SFTPClient", fake_client):
+        reader = SourceSFTPBulkStreamReader()
+        reader.config = SourceSFTPBulkSpec(
+            host="localhost",
+            username="username",
+            credentials={"auth_type": "password", "password": "password"},
+            port=123,
+            streams=[],
+        )
+        files = list(reader.get_matching_files(globs=["/data/2024/*.csv"], prefix=None, logger=logger))
+
+    assert [file.uri for file in files] == ["//data/2024/sample_file_1.csv"]
+    listed_directories = {call.args[0] for call in fake_client.listdir_attr.call_args_list}
+    assert listed_directories == {"/", "//data", "//data/2024"}
+
+
+@pytest.mark.parametrize(
+    "globs, directory, expected",
+    [
+        (["**"], "/any/depth/at/all", True),
+        (["/data/**/*.csv"], "/data/2024/01", True),
+        (["/data/**/*.csv"], "/archive", False),
+        (["/data/2024/*.csv"], "/data", True),
+        (["/data/2024/*.csv"], "/data/2024", True),
+        (["/data/2024/*.csv"], "/data/2024/nested", False),
+        (["/data/202?/*.csv"], "//data/2023", True),
+        (["/data/*/*.csv", "/logs/*.log"], "/logs", True),
+        ([], "/data", False),
+    ],
+)
+def test_directory_glob_matcher(globs, directory, expected):
+    assert DirectoryGlobMatcher(globs).may_contain_matches(directory) is expected